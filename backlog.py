@@ -1,15 +1,23 @@
 #!/usr/bin/env python3
 """Task Management CLI."""
 
+import os
 import sys
-from pathlib import Path
 
-# Ensure we use the venv
-venv_python = Path(__file__).parent / ".venv" / "bin" / "python"
-if venv_python.exists() and not sys.executable.endswith("/.venv/bin/python"):
-    import os
-
-    os.execv(str(venv_python), [str(venv_python)] + sys.argv)
+# Ensure we use the venv. sys.prefix is the venv dir when running inside it;
+# the interpreter path alone can't tell, since venv pythons are symlinks to
+# the base interpreter. The env var stops a re-exec loop if the venv is broken.
+venv_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".venv")
+if not os.environ.get("BACKLOG_SKIP_VENV_EXEC") and os.path.realpath(
+    sys.prefix
+) != os.path.realpath(venv_dir):
+    venv_python = os.path.join(venv_dir, "bin", "python")
+    if os.path.exists(venv_python):
+        os.environ["BACKLOG_SKIP_VENV_EXEC"] = "1"
+        try:
+            os.execv(venv_python, [venv_python] + sys.argv)
+        except OSError:
+            pass
 
 from backlog.cli import cli
 
@@ -0,0 +1,86 @@
+"""AGENTS.md draft snippets printed by ``backlog agents``.
+
+Kept out of cli.py so the text is only loaded when that command runs.
+"""
+
+AGENTS_SNIPPETS = {
+    "short": """# AGENTS.md (Short)
+
+# Work Loop & Task Backlog
+
+## Task Workflow
+- Use `backlog grab` to claim work, then `backlog done` or `backlog cycle`.
+- If a command fails to parse args/usage, run exactly one recovery command: `backlog cycle`.
+- For explicit task IDs, use `backlog claim <TASK_ID> [TASK_ID ...]`.
+- Prefer critical-path work, then `critical > high > medium > low` priority.
+- If blocked, run `backlog blocked --reason "<why>"` and handoff quickly.
+- Keep each change scoped to one task; update status as soon as state changes.
+- Before done: run targeted tests for changed code.
+- For more see `backlog --help`.
+""",
+    "medium": """# AGENTS.md (Medium)
+
+# Work Loop & Task Backlog
+
+## Defaults
+- Claim with `backlog grab` (or `backlog grab --single` for focused work).
+- Use `backlog claim <TASK_ID> [TASK_ID ...]` when task IDs are provided.
+- If command argument parsing fails, run `backlog cycle` once to recover.
+- CLI selection order is: critical-path first, then task priority.
+- Use `backlog work <id>` when switching context; use `backlog show` to review details.
+
+## Execution Loop
+1. `backlog grab` and read the task file.
+2. Implement in small commits and keep diff narrow.
+3. Run focused tests early, then broader tests before completion.
+4. Finish with `backlog done` (or `backlog cycle` to continue immediately).
+
+## Coordination
+- Use `backlog handoff --to <agent> --notes "<context>"` for ownership transfer.
+- Use `backlog blockers --suggest` and `backlog why <task-id>` when sequencing is unclear.
+- Run `backlog dash` and `backlog report progress` for health checks.
+""",
+    "long": """# AGENTS.md (Long)
+
+# Work Loop & Task Backlog
+
+## Operating Model
+- Default command: `backlog`. Use local `.backlog/` state as source of truth.
+- Selection strategy: critical-path first, then `critical > high > medium > low`.
+- Treat task files as contracts: requirements + acceptance criteria drive scope.
+
+## Standard Loop
+1. Claim:
+    - `backlog grab` for normal flow.
+    - `backlog grab --single` for strict focus.
+    - `backlog claim <TASK_ID> [TASK_ID ...]` for explicit IDs.
+    - If a command fails with parsing/usage errors, run `backlog cycle` once.
+2. Inspect:
+   - `backlog show` for current task details.
+   - `backlog why <task-id>` to inspect dependency readiness.
+3. Implement:
+   - Keep commits and PRs small and task-scoped.
+   - Add or update tests with each behavior change.
+4. Validate:
+   - Run targeted tests first, full suite before completion if feasible.
+5. Resolve:
+   - `backlog done` when complete.
+   - `backlog cycle` when moving directly to next claim.
+
+## Multi-Agent Defaults
+- Use handoff when parallelism helps:
+  - `backlog handoff --to <agent> --notes "<state + next steps>"`
+- If blocked:
+  - `backlog blocked --reason "<root cause>"`
+  - `backlog blocked --reason "<root cause>" --grab` (optional)
+  - Unblock owner or dependency explicitly.
+- For triage:
+  - `backlog blockers --deep --suggest`
+  - `backlog search "<pattern>" --status=pending`
+
+## Quality Gates
+- Ensure behavior is covered by tests.
+- Prefer deterministic, fast tests.
+- Do not mark done with unresolved blockers, hidden assumptions, or failing tests.
+""",
+}
@@ -0,0 +1,181 @@
+"""On-disk cache of loaded task trees, shared between CLI invocations.
+
+Off unless ``BACKLOG_DISK_CACHE=1`` is set in the environment.
+Entries live under ``$XDG_CACHE_HOME/backlog`` (default ``~/.cache/backlog``),
+one file per data dir and load options. Each holds a small header, checked
+before the tree itself is unpickled. Only the most recently used
+``_MAX_ENTRIES`` entries of each kind are kept. Nothing is ever unpickled from the data
+dir, which may come from an untrusted checkout.
+
+Dependency-graph results (critical path, cycles) are kept alongside as plain
+JSON, one entry per data dir, reused only for an identical digest of the
+tree content they were computed from.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Optional
+
+from . import __version__, models
+
+# Modules whose code decides what a cached tree contains.
+_STAMPED_FILES = ("models.py", "loader.py", "_yaml.py")
+_MAX_ENTRIES = 16
+
+
+def enabled() -> bool:
+    """Whether the user opted in to the on-disk cache via BACKLOG_DISK_CACHE."""
+    return os.environ.get("BACKLOG_DISK_CACHE", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "backlog"
+
+
+def _code_stamp(*extra_files) -> tuple:
+    """Identify the code behind cached entries.
+
+    Covers the model, loader and YAML modules plus any ``extra_files``, so
+    upgrades or local edits never serve data built by older code.
+    """
+    package_dir = os.path.dirname(models.__file__)
+    paths = [os.path.join(package_dir, name) for name in _STAMPED_FILES]
+    paths.extend(os.fspath(path) for path in extra_files)
+    files = []
+    for path in paths:
+        st = os.stat(path)
+        files.append((st.st_mtime_ns, st.st_size))
+    return (sys.version_info[:2], __version__, tuple(files))
+
+
+def _entry_path(key: tuple, prefix: str = "tree", suffix: str = ".pickle") -> Path:
+    digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()[:32]
+    return _cache_dir() / f"{prefix}-{digest}{suffix}"
+
+
+def _write_atomic(path: Path, write) -> None:
+    """Write path via a temp file and rename; failures leave no entry."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except (OSError, pickle.PicklingError, TypeError, ValueError):
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        return
+    _evict(path)
+
+
+def _evict(path: Path) -> None:
+    """Drop the least recently used entries sharing path's prefix."""
+    prefix = path.name.split("-", 1)[0]
+    try:
+        entries = []
+        for entry in os.scandir(path.parent):
+            if entry.name.startswith(f"{prefix}-") and not entry.name.endswith(".tmp"):
+                entries.append((entry.stat().st_mtime_ns, entry.path))
+    except OSError:
+        return
+    entries.sort(reverse=True)
+    for _, stale_path in entries[_MAX_ENTRIES:]:
+        try:
+            os.unlink(stale_path)
+        except OSError:
+            pass
+
+
+def _touch(path: Path) -> None:
+    """Mark an entry as recently used so eviction keeps it."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def load_tree(key: tuple, signature: tuple) -> Optional[models.TaskTree]:
+    """Return the cached tree for key if it was stored with signature."""
+    path = _entry_path(key)
+    try:
+        with open(path, "rb") as f:
+            if pickle.load(f) != (_code_stamp(), key, signature):
+                return None
+            tree = pickle.load(f)
+    except Exception:
+        # Missing, truncated or unreadable entries are just misses.
+        return None
+    _touch(path)
+    return tree
+
+
+def store_tree(key: tuple, signature: tuple, tree: models.TaskTree) -> None:
+    """Persist tree for key; failures are ignored, the cache is best-effort."""
+
+    def write(f):
+        pickle.dump((_code_stamp(), key, signature), f, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    _write_atomic(_entry_path(key), write)
+
+
+def forget_trees(keys) -> None:
+    """Delete the cached trees stored under any of keys."""
+    for key in keys:
+        try:
+            os.unlink(_entry_path(key))
+        except OSError:
+            pass
+
+
+def _graph_results_entry(data_dir: str) -> Path:
+    return _entry_path((data_dir,), prefix="graph", suffix=".json")
+
+
+class GraphResultCache:
+    """Opt-in store for CriticalPathCalculator results, passed in by CLI views.
+
+    The calculator itself never touches the disk; read-only commands hand it
+    one of these, when the disk cache is enabled, so repeated runs on an
+    unchanged tree reuse its results.
+    """
+
+    def __init__(self, data_dir):
+        self.data_dir = str(Path(data_dir).resolve())
+        self.stamp = _code_stamp(os.path.join(os.path.dirname(models.__file__), "critical_path.py"))
+
+    def load(self, digest: str) -> dict:
+        return load_graph_results(self.data_dir, self.stamp, digest)
+
+    def store(self, digest: str, name: str, value) -> None:
+        store_graph_result(self.data_dir, self.stamp, digest, name, value)
+
+
+def load_graph_results(data_dir: str, stamp: tuple, digest: str) -> dict:
+    """Return the cached dependency-graph results stored for digest."""
+    try:
+        with open(_graph_results_entry(data_dir), "rb") as f:
+            entry = json.load(f)
+        if entry["stamp"] != repr(stamp) or entry["digest"] != digest:
+            return {}
+        return entry["results"]
+    except Exception:
+        return {}
+
+
+def store_graph_result(data_dir: str, stamp: tuple, digest: str, name: str, value) -> None:
+    """Add one named result for digest, dropping results for older digests."""
+    results = dict(load_graph_results(data_dir, stamp, digest))
+    results[name] = value
+    entry = {"stamp": repr(stamp), "digest": digest, "results": results}
+    _write_atomic(
+        _graph_results_entry(data_dir),
+        lambda f: f.write(json.dumps(entry).encode("utf-8")),
+    )
@@ -0,0 +1,34 @@
+"""Filesystem helpers shared by the loader."""
+
+import os
+
+# Absolute paths of directories known to exist in this process.
+_ensured: set[str] = set()
+
+
+def _ensure_dir(path) -> None:
+    """Create path and any missing parents, once per process.
+
+    Directories this helper has already created or confirmed are skipped
+    without touching the filesystem. Call _forget_dir() after moving or
+    removing one.
+    """
+    key = os.path.abspath(path)
+    if key in _ensured:
+        return
+    os.makedirs(key, exist_ok=True)
+    # Every ancestor exists now too; stop at the first one already recorded.
+    while key not in _ensured:
+        _ensured.add(key)
+        parent = os.path.dirname(key)
+        if parent == key:
+            break
+        key = parent
+
+
+def _forget_dir(path) -> None:
+    """Drop path and everything below it from the _ensure_dir() cache."""
+    key = os.path.abspath(path)
+    prefix = key + os.sep
+    for known in [d for d in _ensured if d == key or d.startswith(prefix)]:
+        _ensured.discard(known)
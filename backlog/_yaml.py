@@ -0,0 +1,33 @@
+"""YAML load/dump helpers that prefer the libyaml-backed C implementations.
+
+PyYAML's pure-Python loader and emitter are an order of magnitude slower
+than libyaml. Both variants accept and produce the same documents for the
+plain mappings, lists, and scalars stored in the task tree.
+"""
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+
+def safe_load(stream):
+    """Parse a YAML document from a string, bytes, or open file."""
+    return yaml.load(stream, Loader=_Loader)
+
+
+def safe_dump(data, stream=None, **kwargs):
+    """Serialize data as YAML, to stream if given, otherwise returning a str."""
+    return yaml.dump(data, stream, Dumper=_Dumper, **kwargs)
+
+
+def safe_dump_bytes(data, **kwargs) -> bytes:
+    """Serialize data straight to UTF-8 bytes, ready for Path.write_bytes."""
+    return yaml.dump(data, Dumper=_Dumper, encoding="utf-8", **kwargs)
+
+
+def parse_events(stream):
+    """Yield the YAML event stream for stream without constructing objects."""
+    return yaml.parse(stream, Loader=_Loader)
@@ -0,0 +1,99 @@
+"""Template emitters for fixed-schema YAML documents the loader creates.
+
+Only brand-new files with a known shape are written this way; anything
+that round-trips an existing file goes through backlog._yaml. Each
+emitter falls back to safe_dump() for values outside its template, so the
+output always loads back to the same data.
+"""
+
+import math
+import re
+
+from ._yaml import safe_dump
+
+# Strings that load back as themselves when written unquoted.
+_PLAIN_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_.\- ]*")
+_RESERVED_WORDS = frozenset({"y", "n", "yes", "no", "true", "false", "on", "off", "null"})
+
+_MILESTONE_KEYS = (
+    "id",
+    "name",
+    "status",
+    "estimate_hours",
+    "complexity",
+    "depends_on",
+    "locked",
+    "epics",
+    "stats",
+)
+
+
+_ESCAPES = {"\\": "\\\\", '"': '\\"', "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+
+
+def _quote_char(ch: str) -> str:
+    """Escape one character for a YAML double-quoted scalar."""
+    if ch in _ESCAPES:
+        return _ESCAPES[ch]
+    code = ord(ch)
+    if 0x20 <= code <= 0x7E:
+        return ch
+    if 0xD800 <= code <= 0xDFFF:
+        raise TypeError(f"Unpaired surrogate in string: {ch!r}")
+    # Unlike JSON, YAML spells non-BMP characters as one \U escape, not a
+    # surrogate pair.
+    if code <= 0xFF:
+        return f"\\x{code:02X}"
+    if code <= 0xFFFF:
+        return f"\\u{code:04X}"
+    return f"\\U{code:08X}"
+
+
+def _scalar(value) -> str:
+    """Render a scalar as YAML, quoting strings only when needed."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float) and math.isfinite(value):
+        text = repr(value).lower()
+        # Same adjustment as PyYAML: "1e+20" alone would load as a string.
+        if "." not in text and "e" in text:
+            text = text.replace("e", ".0e", 1)
+        return text
+    if isinstance(value, str):
+        if (
+            _PLAIN_RE.fullmatch(value)
+            and not value.endswith(" ")
+            and value.lower() not in _RESERVED_WORDS
+        ):
+            return value
+        return '"' + "".join(_quote_char(ch) for ch in value) + '"'
+    raise TypeError(f"Unsupported scalar: {value!r}")
+
+
+def _block_list(items) -> str:
+    if not items:
+        return " []"
+    return "".join(f"\n- {_scalar(item)}" for item in items)
+
+
+def dump_milestone_index(index: dict) -> str:
+    """Render a new milestone's index.yaml as created by create_milestone."""
+    try:
+        if tuple(index) != _MILESTONE_KEYS or index["epics"]:
+            raise TypeError("not a fresh milestone index")
+        stats = "".join(f"  {key}: {_scalar(value)}\n" for key, value in index["stats"].items())
+        return (
+            f"id: {_scalar(index['id'])}\n"
+            f"name: {_scalar(index['name'])}\n"
+            f"status: {_scalar(index['status'])}\n"
+            f"estimate_hours: {_scalar(index['estimate_hours'])}\n"
+            f"complexity: {_scalar(index['complexity'])}\n"
+            f"depends_on:{_block_list(index['depends_on'])}\n"
+            f"locked: {_scalar(index['locked'])}\n"
+            "epics: []\n"
+            f"stats:\n{stats}"
+        )
+    except (TypeError, AttributeError):
+        return safe_dump(index, default_flow_style=False, sort_keys=False)
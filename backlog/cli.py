@@ -7,13 +7,18 @@ import json
 import subprocess
 import yaml
 from pathlib import Path
-from types import SimpleNamespace
+from types import MappingProxyType, SimpleNamespace
 from builtins import next as builtin_next
-from datetime import datetime, timezone
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from importlib import import_module
 from rich.console import Console
 
+from ._yaml import safe_load
 from .models import PathQuery, Status, TaskPath, Complexity, Priority
-from .loader import TaskLoader
+from .loader import TaskLoader, _is_racy
+from ._cache import GraphResultCache, enabled as disk_cache_enabled
 from .critical_path import CriticalPathCalculator
 from .time_utils import utc_now, to_utc
 from .status import (
@@ -61,145 +66,130 @@ PREVIEW_AUX_LIMIT = 5
 PREVIEW_BUG_FANOUT_COUNT = 2
 BACKLOG_VERSION = "0.1.0"
 
-AGENTS_SNIPPETS = {
-    "short": """# AGENTS.md (Short)
-
-# Work Loop & Task Backlog
-
-## Task Workflow
-- Use `backlog grab` to claim work, then `backlog done` or `backlog cycle`.
-- If a command fails to parse args/usage, run exactly one recovery command: `backlog cycle`.
-- For explicit task IDs, use `backlog claim <TASK_ID> [TASK_ID ...]`.
-- Prefer critical-path work, then `critical > high > medium > low` priority.
-- If blocked, run `backlog blocked --reason "<why>"` and handoff quickly.
-- Keep each change scoped to one task; update status as soon as state changes.
-- Before done: run targeted tests for changed code.
-- For more see `backlog --help`.
-""",
-    "medium": """# AGENTS.md (Medium)
-
-# Work Loop & Task Backlog
-
-## Defaults
-- Claim with `backlog grab` (or `backlog grab --single` for focused work).
-- Use `backlog claim <TASK_ID> [TASK_ID ...]` when task IDs are provided.
-- If command argument parsing fails, run `backlog cycle` once to recover.
-- CLI selection order is: critical-path first, then task priority.
-- Use `backlog work <id>` when switching context; use `backlog show` to review details.
-
-## Execution Loop
-1. `backlog grab` and read the task file.
-2. Implement in small commits and keep diff narrow.
-3. Run focused tests early, then broader tests before completion.
-4. Finish with `backlog done` (or `backlog cycle` to continue immediately).
-
-## Coordination
-- Use `backlog handoff --to <agent> --notes "<context>"` for ownership transfer.
-- Use `backlog blockers --suggest` and `backlog why <task-id>` when sequencing is unclear.
-- Run `backlog dash` and `backlog report progress` for health checks.
-""",
-    "long": """# AGENTS.md (Long)
-
-# Work Loop & Task Backlog
-
-## Operating Model
-- Default command: `backlog`. Use local `.backlog/` state as source of truth.
-- Selection strategy: critical-path first, then `critical > high > medium > low`.
-- Treat task files as contracts: requirements + acceptance criteria drive scope.
-
-## Standard Loop
-1. Claim:
-    - `backlog grab` for normal flow.
-    - `backlog grab --single` for strict focus.
-    - `backlog claim <TASK_ID> [TASK_ID ...]` for explicit IDs.
-    - If a command fails with parsing/usage errors, run `backlog cycle` once.
-2. Inspect:
-   - `backlog show` for current task details.
-   - `backlog why <task-id>` to inspect dependency readiness.
-3. Implement:
-   - Keep commits and PRs small and task-scoped.
-   - Add or update tests with each behavior change.
-4. Validate:
-   - Run targeted tests first, full suite before completion if feasible.
-5. Resolve:
-   - `backlog done` when complete.
-   - `backlog cycle` when moving directly to next claim.
-
-## Multi-Agent Defaults
-- Use handoff when parallelism helps:
-  - `backlog handoff --to <agent> --notes "<state + next steps>"`
-- If blocked:
-  - `backlog blocked --reason "<root cause>"`
-  - `backlog blocked --reason "<root cause>" --grab` (optional)
-  - Unblock owner or dependency explicitly.
-- For triage:
-  - `backlog blockers --deep --suggest`
-  - `backlog search "<pattern>" --status=pending`
-
-## Quality Gates
-- Ensure behavior is covered by tests.
-- Prefer deterministic, fast tests.
-- Do not mark done with unresolved blockers, hidden assumptions, or failing tests.
-""",
+
+# Commands defined in backlog/commands/<module>.py, registered on first lookup.
+_LAZY_COMMAND_MODULES = {
+    "grab": "workflow",
+    "cycle": "workflow",
+    "work": "workflow",
+    "blocked": "workflow",
+    "skip": "workflow",
+    "handoff": "workflow",
+    "unclaim": "workflow",
+    "why": "workflow",
+    "dash": "display",
+    "search": "search",
+    "blockers": "search",
+    "report": "reports",
+    "r": "reports",
+    "velocity": "reports",
+    "session": "session",
+    "timeline": "timeline",
+    "tl": "timeline",
+    "data": "data",
+    "skills": "skills",
+    "idea": "intake",
+    "fixed": "intake",
+    "schema": "schema",
+    "check": "check",
 }
 
 
 class BacklogGroup(click.Group):
-    """Click group with agent how-to command pinned at top of help output."""
+    """Click group with agent how-to command pinned at top of help output.
+
+    Commands from ``backlog.commands`` modules are imported only when looked
+    up, so running one command does not load every other command module.
+    """
+
+    def get_command(self, ctx, cmd_name):
+        module = _LAZY_COMMAND_MODULES.get(cmd_name)
+        if module is not None and cmd_name not in self.commands:
+            import_module(f".commands.{module}", __package__).register_commands(self)
+        return super().get_command(ctx, cmd_name)
 
     def list_commands(self, ctx):
-        commands = super().list_commands(ctx)
+        commands = sorted(self.commands.keys() | _LAZY_COMMAND_MODULES.keys())
         if "howto" in commands:
             commands.remove("howto")
             return ["howto", *commands]
         return commands
 
 
+# Read-only so a caller mutating its config can never leak into the defaults.
+_CONFIG_DEFAULTS = MappingProxyType(
+    {
+        key: MappingProxyType(section)
+        for key, section in {
+            "agent": {"default_agent": "cli-user", "auto_claim_after_done": False},
+            "session": {"heartbeat_timeout_minutes": 15},
+            "stale_claim": {"warn_after_minutes": 60, "error_after_minutes": 120},
+            "complexity_multipliers": {
+                "low": 1.0,
+                "medium": 1.25,
+                "high": 1.5,
+                "critical": 2.0,
+            },
+            "display": {"progress_bar_style": "unicode"},
+            "timeline": {"default_weeks": 8, "hours_per_week": 40},
+        }.items()
+    }
+)
+
+
+def _default_config() -> dict:
+    """Return a fresh, mutable copy of the default config."""
+    return {key: dict(section) for key, section in _CONFIG_DEFAULTS.items()}
+
+
+@lru_cache(maxsize=1)
+def _load_config_cached(path: str, mtime_ns: int, size: int, ino: int) -> dict:
+    """Parse config and fill in defaults; the stat fields only key the cache."""
+    loaded = safe_load(Path(path).read_bytes()) or {}
+    config = _default_config()
+    for key, value in loaded.items():
+        default = _CONFIG_DEFAULTS.get(key)
+        config[key] = {**default, **value} if default and isinstance(value, dict) else value
+    return config
+
+
 def load_config():
-    """Load configuration."""
+    """Load configuration.
+
+    The merged result is cached on the config file's stat fields, so
+    repeated calls in one process parse it once; callers get a private copy.
+    """
     from .data_dir import BACKLOG_DIR, TASKS_DIR
 
-    defaults = {
-        "agent": {"default_agent": "cli-user", "auto_claim_after_done": False},
-        "session": {"heartbeat_timeout_minutes": 15},
-        "stale_claim": {"warn_after_minutes": 60, "error_after_minutes": 120},
-        "complexity_multipliers": {
-            "low": 1.0,
-            "medium": 1.25,
-            "high": 1.5,
-            "critical": 2.0,
-        },
-        "display": {"progress_bar_style": "unicode"},
-        "timeline": {"default_weeks": 8, "hours_per_week": 40},
-    }
+    for config_dir in (BACKLOG_DIR, TASKS_DIR):
+        path = os.path.join(config_dir, "config.yaml")
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if not _is_racy(st.st_mtime_ns):
+            config = _load_config_cached(path, st.st_mtime_ns, st.st_size, st.st_ino)
+        else:
+            config = _load_config_cached.__wrapped__(path, 0, 0, 0)
+        return copy.deepcopy(config)
 
-    backlog_config = Path(BACKLOG_DIR) / "config.yaml"
-    tasks_config = Path(TASKS_DIR) / "config.yaml"
-    if backlog_config.exists():
-        config_path = backlog_config
-    elif tasks_config.exists():
-        config_path = tasks_config
-    else:
-        config_path = None
-
-    if config_path and config_path.exists():
-        with open(config_path) as f:
-            loaded = yaml.safe_load(f) or {}
-        for key, value in defaults.items():
-            if key not in loaded:
-                loaded[key] = value
-            elif isinstance(value, dict):
-                for k, v in value.items():
-                    if k not in loaded[key]:
-                        loaded[key][k] = v
-        return loaded
-
-    return defaults
-
-
-def get_default_agent():
-    """Get the default agent ID from config."""
-    config = load_config()
+    return _default_config()
+
+
+def _graph_result_cache(loader):
+    """Return a critical-path result cache for loader's data dir, if enabled."""
+    if not disk_cache_enabled():
+        return None
+    return GraphResultCache(loader.tasks_dir)
+
+
+def get_default_agent(config=None):
+    """Get the default agent ID from config.
+
+    Pass an already-loaded ``config`` to skip reading it again.
+    """
+    if config is None:
+        config = load_config()
     return config.get("agent", {}).get("default_agent", "cli-user")
 
 
@@ -886,7 +876,9 @@ def list(
         )
         config = load_config()
 
-        calc = CriticalPathCalculator(tree, config["complexity_multipliers"])
+        calc = CriticalPathCalculator(
+            tree, config["complexity_multipliers"], _graph_result_cache(loader)
+        )
         critical_path, next_available = calc.calculate(explicit_only=True)
         tree.critical_path = critical_path
         tree.next_available = next_available
@@ -1020,36 +1012,91 @@ def list(
         raise click.Abort()
 
 
+def _filter_enums(complexity=None, priority=None):
+    """Convert --complexity/--priority option strings to enum members."""
+    return (
+        Complexity(complexity) if complexity else None,
+        Priority(priority) if priority else None,
+    )
+
+
 def _task_matches_filters(task, complexity=None, priority=None):
-    """Return True when a task matches complexity/priority filters."""
-    if complexity and task.complexity.value != complexity:
+    """Return True when a task matches complexity/priority filter enums."""
+    if complexity is not None and task.complexity is not complexity:
         return False
-    if priority and task.priority.value != priority:
+    if priority is not None and task.priority is not priority:
         return False
     return True
 
 
+def _index_filtered_tasks(phases, complexity=None, priority=None):
+    """Map each phase, milestone and epic ID to ``(tasks, status_counts)``.
+
+    Filtering and status counting share one walk over the tree; filtered
+    views look nodes up here instead of re-walking each level to count.
+    """
+    complexity, priority = _filter_enums(complexity, priority)
+    index = {}
+    for p in phases:
+        p_tasks = []
+        p_counts = Counter()
+        for m in p.milestones:
+            m_tasks, m_counts = _index_milestone_tasks(index, m, complexity, priority)
+            p_tasks.extend(m_tasks)
+            p_counts.update(m_counts)
+        index[p.id] = (p_tasks, p_counts)
+    return index
+
+
+def _index_milestone_tasks(index, m, complexity=None, priority=None):
+    """Add a milestone and its epics to ``index``; return the milestone's entry.
+
+    ``complexity`` and ``priority`` are enum members (see _filter_enums).
+    """
+    m_tasks = []
+    m_counts = Counter()
+    for e in m.epics:
+        e_tasks = []
+        e_counts = Counter()
+        for t in e.tasks:
+            if _task_matches_filters(t, complexity, priority):
+                e_tasks.append(t)
+                e_counts[t.status] += 1
+        index[e.id] = (e_tasks, e_counts)
+        m_tasks.extend(e_tasks)
+        m_counts.update(e_counts)
+    index[m.id] = (m_tasks, m_counts)
+    return index[m.id]
+
+
+_UNFINISHED = frozenset(
+    s for s in Status if s not in (Status.DONE, Status.CANCELLED, Status.REJECTED)
+)
+
+
 def _is_unfinished(status):
     """Check if a status represents unfinished work."""
-    return status not in (Status.DONE, Status.CANCELLED, Status.REJECTED)
+    return status in _UNFINISHED
 
 
 def _filter_unfinished_tasks(tasks):
     """Filter tasks to only unfinished ones."""
-    return [t for t in tasks if _is_unfinished(t.status)]
-
-
-def _find_list_task(tree, task_id):
-    """Resolve normal/auxiliary task IDs for list/available rendering."""
-    if task_id.startswith("B"):
-        for bug in getattr(tree, "bugs", []):
-            if bug.id == task_id:
-                return bug
-    elif task_id.startswith("I"):
-        for idea in getattr(tree, "ideas", []):
-            if idea.id == task_id:
-                return idea
-    return tree.find_task(task_id)
+    return [t for t in tasks if t.status in _UNFINISHED]
+
+
+def _list_task_index(tree):
+    """Map normal/auxiliary task IDs to tasks for list/available rendering."""
+    index = {idea.id: idea for idea in getattr(tree, "ideas", [])}
+    index.update((bug.id, bug) for bug in getattr(tree, "bugs", []))
+    # Hierarchy tasks win on a clash, matching tree.find_task().
+    index.update(
+        (t.id, t)
+        for p in tree.phases
+        for m in p.milestones
+        for e in m.epics
+        for t in e.tasks
+    )
+    return index
 
 
 def _preview_grab_candidates(tree, calc, primary_task):
@@ -1107,58 +1154,94 @@ def _include_aux_item(status, unfinished=False, show_completed_aux=False):
     return _is_unfinished(status)
 
 
+def _annotate_unfinished(phases):
+    """Record has-unfinished flags on every phase/milestone/epic in one pass.
+
+    Views call this on entry so the ``_has_unfinished_*`` checks below become
+    attribute reads instead of re-walking the subtree at every level.
+    """
+    for phase in phases:
+        phase_flag = False
+        for milestone in phase.milestones:
+            milestone_flag = False
+            for epic in milestone.epics:
+                epic._has_unfinished = any(t.status in _UNFINISHED for t in epic.tasks)
+                milestone_flag = milestone_flag or epic._has_unfinished
+            milestone._has_unfinished = milestone_flag
+            phase_flag = phase_flag or milestone_flag
+        phase._has_unfinished = phase_flag
+
+
 def _has_unfinished_tasks(epic):
     """Check if epic has any unfinished tasks."""
-    return any(_is_unfinished(t.status) for t in epic.tasks)
+    flag = getattr(epic, "_has_unfinished", None)
+    if flag is None:
+        flag = any(t.status in _UNFINISHED for t in epic.tasks)
+    return flag
 
 
 def _has_unfinished_epics(milestone):
     """Check if milestone has any unfinished epics."""
-    return any(_has_unfinished_tasks(e) for e in milestone.epics)
+    flag = getattr(milestone, "_has_unfinished", None)
+    if flag is None:
+        flag = any(_has_unfinished_tasks(e) for e in milestone.epics)
+    return flag
 
 
 def _has_unfinished_milestones(phase):
     """Check if phase has any unfinished milestones."""
-    return any(_has_unfinished_epics(m) for m in phase.milestones)
-
-
-def _calculate_task_stats(tasks):
-    """Calculate task statistics."""
-    return {
-        "done": sum(1 for t in tasks if t.status == Status.DONE),
-        "total": len(tasks),
-    }
+    flag = getattr(phase, "_has_unfinished", None)
+    if flag is None:
+        flag = any(_has_unfinished_epics(m) for m in phase.milestones)
+    return flag
 
 
-def _get_epic_stats(epic):
-    """Get statistics for an epic."""
-    return _calculate_task_stats(epic.tasks)
+_STATUS_ICONS = {
+    Status.DONE: "[green][✓][/]",
+    Status.IN_PROGRESS: "[yellow][→][/]",
+    Status.PENDING: "[ ]",
+    Status.BLOCKED: "[red][✗][/]",
+}
 
+# Unbracketed icons for the milestone/epic detail task lists.
+_DETAIL_STATUS_ICONS = {
+    Status.DONE: "[green]✓[/]",
+    Status.IN_PROGRESS: "[yellow]→[/]",
+    Status.PENDING: "[ ]",
+    Status.BLOCKED: "[red]✗[/]",
+}
 
-def _get_milestone_stats(milestone):
-    """Get statistics for a milestone."""
-    tasks = [t for e in milestone.epics for t in e.tasks]
-    return _calculate_task_stats(tasks)
 
+def _done_totals_index(phases):
+    """Map each phase, milestone and epic ID to its ``{"done", "total"}`` stats.
 
-def _get_phase_stats(phase):
-    """Get statistics for a phase."""
-    tasks = [t for m in phase.milestones for e in m.epics for t in e.tasks]
-    return _calculate_task_stats(tasks)
+    Built in one walk so renderers look counts up instead of re-walking
+    each subtree at every level.
+    """
+    index = {}
+    for p in phases:
+        p_done = p_total = 0
+        for m in p.milestones:
+            m_done = m_total = 0
+            for e in m.epics:
+                done = 0
+                for t in e.tasks:
+                    if t.status is Status.DONE:
+                        done += 1
+                index[e.id] = {"done": done, "total": len(e.tasks)}
+                m_done += done
+                m_total += len(e.tasks)
+            index[m.id] = {"done": m_done, "total": m_total}
+            p_done += m_done
+            p_total += m_total
+        index[p.id] = {"done": p_done, "total": p_total}
+    return index
 
 
 def _get_status_icon(status):
     """Get a colored status icon for display."""
-    if status == Status.DONE:
-        return "[green][✓][/]"
-    elif status == Status.IN_PROGRESS:
-        return "[yellow][→][/]"
-    elif status == Status.PENDING:
-        return "[ ]"
-    elif status == Status.BLOCKED:
-        return "[red][✗][/]"
-    else:  # CANCELLED or REJECTED
-        return "[dim][X][/]"
+    # CANCELLED and REJECTED share the dimmed fallback.
+    return _STATUS_ICONS.get(status, "[dim][X][/]")
 
 
 def _show_filter_banner(complexity=None, priority=None):
@@ -1172,6 +1255,16 @@ def _show_filter_banner(complexity=None, priority=None):
         console.print(f"[dim]Filtering by {'; '.join(parts)}[/]\n")
 
 
+def _print_lines(lines):
+    """Print buffered markup lines in one console write.
+
+    Each line is still parsed as its own markup string, so an unclosed tag
+    cannot bleed into the lines after it.
+    """
+    if lines:
+        console.print(*lines, sep="\n")
+
+
 def _build_progress_bar(done: int, in_progress: int, total: int, width: int = 20) -> str:
     if total == 0:
         return "[dim]" + "░" * width + "[/]"
@@ -1218,31 +1311,28 @@ def _list_with_progress(
         else tree.phases if include_normal else []
     )
     if unfinished:
+        _annotate_unfinished(phases_to_show)
         phases_to_show = [p for p in phases_to_show if _has_unfinished_milestones(p)]
 
     completed_phases = []
+    filtered = (
+        _index_filtered_tasks(phases_to_show, complexity, priority)
+        if complexity or priority
+        else None
+    )
     for phase in phases_to_show:
         # Filter tasks when filters are specified
-        if complexity or priority:
-            all_tasks = []
-            for m in phase.milestones:
-                for e in m.epics:
-                    all_tasks.extend(
-                        [
-                            t
-                            for t in e.tasks
-                            if _task_matches_filters(t, complexity, priority)
-                        ]
-                    )
+        if filtered is not None:
+            all_tasks, counts = filtered[phase.id]
 
             if not all_tasks:
                 continue
 
             # Recalculate stats for filtered tasks
-            done = sum(1 for t in all_tasks if t.status.value == "done")
+            done = counts[Status.DONE]
             total = len(all_tasks)
-            in_progress = sum(1 for t in all_tasks if t.status.value == "in_progress")
-            blocked = sum(1 for t in all_tasks if t.status.value == "blocked")
+            in_progress = counts[Status.IN_PROGRESS]
+            blocked = counts[Status.BLOCKED]
         else:
             p_stats = phase.stats
             done = p_stats["done"]
@@ -1271,25 +1361,15 @@ def _list_with_progress(
         # Show milestones if phase is in progress
         for m in phase.milestones:
             # Filter milestone tasks when filters are specified
-            if complexity or priority:
-                milestone_tasks = []
-                for e in m.epics:
-                    milestone_tasks.extend(
-                        [
-                            t
-                            for t in e.tasks
-                            if _task_matches_filters(t, complexity, priority)
-                        ]
-                    )
+            if filtered is not None:
+                milestone_tasks, m_counts = filtered[m.id]
 
                 if not milestone_tasks:
                     continue
 
-                m_done = sum(1 for t in milestone_tasks if t.status.value == "done")
+                m_done = m_counts[Status.DONE]
                 m_total = len(milestone_tasks)
-                m_in_progress = sum(
-                    1 for t in milestone_tasks if t.status.value == "in_progress"
-                )
+                m_in_progress = m_counts[Status.IN_PROGRESS]
             else:
                 m_stats = m.stats
                 m_done = m_stats["done"]
@@ -1323,7 +1403,7 @@ def _list_with_progress(
         else []
     )
     if bugs:
-        bugs_done = sum(1 for b in bugs if b.status == Status.DONE)
+        bugs_done = sum(1 for b in bugs if b.status is Status.DONE)
         bugs_total = len(bugs)
         bug_pct = (bugs_done / bugs_total * 100) if bugs_total > 0 else 0
         bug_bar = make_progress_bar(bugs_done, bugs_total)
@@ -1342,7 +1422,7 @@ def _list_with_progress(
         else []
     )
     if ideas:
-        ideas_done = sum(1 for i in ideas if i.status == Status.DONE)
+        ideas_done = sum(1 for i in ideas if i.status is Status.DONE)
         ideas_total = len(ideas)
         idea_pct = (ideas_done / ideas_total * 100) if ideas_total > 0 else 0
         idea_bar = make_progress_bar(ideas_done, ideas_total)
@@ -1369,17 +1449,17 @@ def _show_milestone_detail(tree, m, critical_path, complexity=None, priority=Non
     _show_filter_banner(complexity, priority)
 
     # Calculate stats with optional filters
+    filtered = None
     if complexity or priority:
-        all_tasks = []
-        for e in m.epics:
-            all_tasks.extend(
-                [t for t in e.tasks if _task_matches_filters(t, complexity, priority)]
-            )
+        filtered = {}
+        all_tasks, counts = _index_milestone_tasks(
+            filtered, m, *_filter_enums(complexity, priority)
+        )
 
-        done = sum(1 for t in all_tasks if t.status.value == "done")
+        done = counts[Status.DONE]
         total = len(all_tasks)
-        in_progress = sum(1 for t in all_tasks if t.status.value == "in_progress")
-        blocked = sum(1 for t in all_tasks if t.status.value == "blocked")
+        in_progress = counts[Status.IN_PROGRESS]
+        blocked = counts[Status.BLOCKED]
     else:
         m_stats = m.stats
         done = m_stats["done"]
@@ -1396,13 +1476,11 @@ def _show_milestone_detail(tree, m, critical_path, complexity=None, priority=Non
     console.print(f"\n[bold]Epics:[/]")
     for e in m.epics:
         # Filter tasks when filters are specified
-        if complexity or priority:
-            filtered_tasks = [
-                t for t in e.tasks if _task_matches_filters(t, complexity, priority)
-            ]
+        if filtered is not None:
+            filtered_tasks, e_counts = filtered[e.id]
             if not filtered_tasks:
                 continue
-            e_done = sum(1 for t in filtered_tasks if t.status.value == "done")
+            e_done = e_counts[Status.DONE]
             e_total = len(filtered_tasks)
         else:
             filtered_tasks = e.tasks
@@ -1417,13 +1495,7 @@ def _show_milestone_detail(tree, m, critical_path, complexity=None, priority=Non
         console.print(f"      Path: {format_epic_path(tree, e)}")
 
         for t in filtered_tasks:
-            status_icons = {
-                "done": "[green]✓[/]",
-                "in_progress": "[yellow]→[/]",
-                "pending": "[ ]",
-                "blocked": "[red]✗[/]",
-            }
-            icon = status_icons.get(t.status.value, "?")
+            icon = _DETAIL_STATUS_ICONS.get(t.status, "?")
             console.print(f"      {icon} {t.id}: {t.title} ({t.estimate_hours}h)")
 
     console.print()
@@ -1442,29 +1514,36 @@ def _list_available(
     scoped_phases=None,
 ):
     """List available tasks with optional complexity/priority filtering."""
+    critical = frozenset(critical_path)
     scope_phases = (
         {p.id for p in scoped_phases} if scoped_phases is not None else None
     )
+    tasks_by_id = _list_task_index(tree)
+    complexity_enum, priority_enum = _filter_enums(complexity, priority)
+    # (task, phase ID) pairs; the phase is None for bugs and ideas.
     resolved_available = []
     for task_id in all_available:
-        task = _find_list_task(tree, task_id)
+        task = tasks_by_id.get(task_id)
         if not task:
             continue
-        if not _task_matches_filters(task, complexity, priority):
+        if not _task_matches_filters(task, complexity_enum, priority_enum):
             continue
-        if scope_phases is not None:
-            try:
-                task_phase = TaskPath.parse(task_id).phase
-            except ValueError:
-                continue
-            if task_phase not in scope_phases:
-                continue
-        if (
-            (task_id.startswith("B") and include_bugs)
-            or (task_id.startswith("I") and include_ideas)
-            or (not task_id.startswith("B") and not task_id.startswith("I") and include_normal)
-        ):
-            resolved_available.append(task)
+        if task_id.startswith("B"):
+            if include_bugs and scope_phases is None:
+                resolved_available.append((task, None))
+            continue
+        if task_id.startswith("I"):
+            if include_ideas and scope_phases is None:
+                resolved_available.append((task, None))
+            continue
+        try:
+            task_phase = TaskPath.parse(task_id).phase
+        except ValueError:
+            continue
+        if scope_phases is not None and task_phase not in scope_phases:
+            continue
+        if include_normal:
+            resolved_available.append((task, task_phase))
 
     if not resolved_available:
         if complexity or priority:
@@ -1485,7 +1564,7 @@ def _list_available(
 
     if output_json:
         output = []
-        for task in resolved_available:
+        for task, _ in resolved_available:
             output.append(
                 {
                     "id": task.id,
@@ -1493,7 +1572,7 @@ def _list_available(
                     "estimate_hours": task.estimate_hours,
                     "complexity": task.complexity.value,
                     "priority": task.priority.value,
-                    "on_critical_path": task.id in critical_path,
+                    "on_critical_path": task.id in critical,
                 }
             )
         click.echo(json.dumps(output, indent=2))
@@ -1503,37 +1582,34 @@ def _list_available(
     bugs = []
     ideas = []
 
-    for task in resolved_available:
+    for task, phase_id in resolved_available:
         if task.id.startswith("B"):
             bugs.append(task)
             continue
         if task.id.startswith("I"):
             ideas.append(task)
             continue
-        task_path = TaskPath.parse(task.id)
-        if task_path.phase not in by_phase:
-            by_phase[task_path.phase] = []
-        by_phase[task_path.phase].append(task)
+        by_phase.setdefault(phase_id, []).append(task)
 
     for phase_id, tasks in sorted(by_phase.items()):
         p = tree.find_phase(phase_id)
         if p:
             console.print(f"\n[bold cyan]{p.name}[/] ({len(tasks)} available)")
             for t in tasks:
-                crit_marker = "[yellow]★[/] " if t.id in critical_path else "  "
+                crit_marker = "[yellow]★[/] " if t.id in critical else "  "
                 console.print(f"  {crit_marker}[bold]{t.id}:[/] {t.title}")
                 console.print(f"     {t.estimate_hours}h, {t.complexity.value}")
 
     if bugs:
         console.print(f"\n[bold cyan]Bugs ({len(bugs)} available)[/]")
         for task in bugs:
-            crit_marker = "[yellow]★[/] " if task.id in critical_path else "  "
+            crit_marker = "[yellow]★[/] " if task.id in critical else "  "
             console.print(f"  {crit_marker}[bold]{task.id}:[/] {task.title}")
 
     if ideas:
         console.print(f"\n[bold cyan]Ideas ({len(ideas)} available)[/]")
         for task in ideas:
-            crit_marker = "[yellow]★[/] " if task.id in critical_path else "  "
+            crit_marker = "[yellow]★[/] " if task.id in critical else "  "
             console.print(f"  {crit_marker}[bold]{task.id}:[/] {task.title}")
 
     console.print(f"\n[dim]★ = On critical path[/]")
@@ -1558,12 +1634,14 @@ def _list_json(
     scope_query=None,
 ):
     """Output list as JSON."""
+    critical = frozenset(critical_path)
     phases_to_show = (
         scoped_phases
         if scoped_phases is not None
         else tree.phases if include_normal else []
     )
     if unfinished:
+        _annotate_unfinished(phases_to_show)
         phases_to_show = [p for p in phases_to_show if _has_unfinished_milestones(p)]
 
     bugs_for_json = (
@@ -1574,7 +1652,7 @@ def _list_json(
                 "status": b.status.value,
                 "priority": b.priority.value,
                 "estimate_hours": b.estimate_hours,
-                "on_critical_path": b.id in critical_path,
+                "on_critical_path": b.id in critical,
             }
             for b in getattr(tree, "bugs", [])
             if _include_aux_item(b.status, unfinished, show_completed_aux)
@@ -1591,7 +1669,7 @@ def _list_json(
                 "status": i.status.value,
                 "priority": i.priority.value,
                 "estimate_hours": i.estimate_hours,
-                "on_critical_path": i.id in critical_path,
+                "on_critical_path": i.id in critical,
             }
             for i in getattr(tree, "ideas", [])
             if _include_aux_item(i.status, unfinished, show_completed_aux)
@@ -1600,6 +1678,7 @@ def _list_json(
         else []
     )
 
+    node_stats = _done_totals_index(phases_to_show)
     output = {
         "critical_path": critical_path,
         "next_available": next_available,
@@ -1609,13 +1688,13 @@ def _list_json(
                 "id": p.id,
                 "name": p.name,
                 "status": p.status.value,
-                "stats": _get_phase_stats(p),
+                "stats": node_stats[p.id],
                 "milestones": [
                     {
                         "id": m.id,
                         "name": m.name,
                         "status": m.status.value,
-                        "stats": _get_milestone_stats(m),
+                        "stats": node_stats[m.id],
                     }
                     for m in (
                         p.milestones
@@ -1632,31 +1711,20 @@ def _list_json(
 
     # Add filter metadata and filtered stats when filters are specified
     if complexity or priority:
+        filtered = _index_filtered_tasks(phases_to_show, complexity, priority)
+        counts = Counter()
+        for p in phases_to_show:
+            counts.update(filtered[p.id][1])
+        if unfinished:
+            counts = Counter({s: n for s, n in counts.items() if _is_unfinished(s)})
         filtered_stats = {
-            "total_tasks": 0,
-            "done": 0,
-            "in_progress": 0,
-            "blocked": 0,
-            "pending": 0,
+            "total_tasks": sum(counts.values()),
+            "done": counts[Status.DONE],
+            "in_progress": counts[Status.IN_PROGRESS],
+            "blocked": counts[Status.BLOCKED],
+            "pending": counts[Status.PENDING],
         }
 
-        for p in phases_to_show:
-            for m in p.milestones:
-                for e in m.epics:
-                    for t in e.tasks:
-                        if _task_matches_filters(t, complexity, priority):
-                            if unfinished and not _is_unfinished(t.status):
-                                continue
-                            filtered_stats["total_tasks"] += 1
-                            if t.status.value == "done":
-                                filtered_stats["done"] += 1
-                            elif t.status.value == "in_progress":
-                                filtered_stats["in_progress"] += 1
-                            elif t.status.value == "blocked":
-                                filtered_stats["blocked"] += 1
-                            elif t.status.value == "pending":
-                                filtered_stats["pending"] += 1
-
         output["filter"] = {}
         if complexity:
             output["filter"]["complexity"] = complexity
@@ -1683,6 +1751,7 @@ def _list_text(
     scoped_depth=None,
 ):
     """Output list as text."""
+    critical = frozenset(critical_path)
     console.print(
         f"\n[bold cyan]Critical Path:[/] {' → '.join(critical_path[:10])}"
         f"{'...' if len(critical_path) > 10 else ''}\n"
@@ -1699,47 +1768,49 @@ def _list_text(
         if scope_query:
             console.print(f"No list nodes found for path query: {scope_query.raw}")
         return
+    if unfinished:
+        _annotate_unfinished(phases_to_show)
 
+    # Rows are buffered and written with one console.print per view.
+    out = []
     if scoped_phases is not None and scoped_depth:
+        node_stats = _done_totals_index(phases_to_show)
         for i, p in enumerate(phases_to_show):
             is_last = i == len(phases_to_show) - 1
-            lines = _render_phase(
+            _render_phase(
                 p,
                 is_last,
                 "",
-                critical_path,
+                critical,
                 unfinished,
                 False,
                 scoped_depth,
                 1,
+                node_stats,
+                out,
             )
-            for line in lines:
-                console.print(line)
+        _print_lines(out)
         return
 
     if unfinished:
         phases_to_show = [p for p in phases_to_show if _has_unfinished_milestones(p)]
 
+    filtered = (
+        _index_filtered_tasks(phases_to_show, complexity, priority)
+        if complexity or priority
+        else None
+    )
     for p in phases_to_show:
         # Calculate stats with optional filters
-        if complexity or priority:
-            all_tasks = []
-            for m in p.milestones:
-                for e in m.epics:
-                    all_tasks.extend(
-                        [
-                            t
-                            for t in e.tasks
-                            if _task_matches_filters(t, complexity, priority)
-                        ]
-                    )
+        if filtered is not None:
+            all_tasks, counts = filtered[p.id]
 
             if not all_tasks:
                 continue
 
-            done = sum(1 for t in all_tasks if t.status.value == "done")
+            done = counts[Status.DONE]
             total = len(all_tasks)
-            in_progress = sum(1 for t in all_tasks if t.status.value == "in_progress")
+            in_progress = counts[Status.IN_PROGRESS]
         else:
             stats = p.stats
             done = stats["done"]
@@ -1750,7 +1821,7 @@ def _list_text(
         if in_progress:
             status_display += f", {in_progress} in progress"
 
-        console.print(f"[bold]{p.name} ({p.id})[/] ({status_display})")
+        out.append(f"[bold]{p.name} ({p.id})[/] ({status_display})")
 
         # Show up to 5 milestones (or all with --all)
         milestones_to_show = []
@@ -1759,22 +1830,14 @@ def _list_text(
             milestones_list = [m for m in p.milestones if _has_unfinished_epics(m)]
 
         for m in milestones_list:
-            if complexity or priority:
+            if filtered is not None:
                 # Check if milestone has any tasks matching active filters
-                milestone_tasks = []
-                for e in m.epics:
-                    milestone_tasks.extend(
-                        [
-                            t
-                            for t in e.tasks
-                            if _task_matches_filters(t, complexity, priority)
-                        ]
-                    )
+                milestone_tasks, m_counts = filtered[m.id]
 
                 if not milestone_tasks:
                     continue
 
-                m_done = sum(1 for t in milestone_tasks if t.status.value == "done")
+                m_done = m_counts[Status.DONE]
                 m_total = len(milestone_tasks)
             else:
                 m_stats = m.stats
@@ -1790,16 +1853,14 @@ def _list_text(
                 and len(milestones_to_show) <= milestone_limit
             )
             prefix = "└──" if is_last else "├──"
-            console.print(
-                f"  {prefix} {m.name} ({m.id}) ({m_done}/{m_total} tasks done)"
-            )
+            out.append(f"  {prefix} {m.name} ({m.id}) ({m_done}/{m_total} tasks done)")
 
         if len(milestones_to_show) > milestone_limit:
-            console.print(
+            out.append(
                 f"  └── ... and {len(milestones_to_show) - milestone_limit} more milestone{'s' if len(milestones_to_show) - milestone_limit > 1 else ''}\n"
             )
         else:
-            console.print()
+            out.append("")
 
     # Show bugs section
     bugs_to_show = (
@@ -1812,17 +1873,17 @@ def _list_text(
         else []
     )
     if bugs_to_show:
-        bugs_done = sum(1 for b in bugs_to_show if b.status == Status.DONE)
-        console.print(f"[bold]Bugs[/] ({bugs_done}/{len(bugs_to_show)} done)")
+        bugs_done = sum(1 for b in bugs_to_show if b.status is Status.DONE)
+        out.append(f"[bold]Bugs[/] ({bugs_done}/{len(bugs_to_show)} done)")
         for i, b in enumerate(bugs_to_show):
             is_last = i == len(bugs_to_show) - 1
             prefix = "└──" if is_last else "├──"
             icon = _get_status_icon(b.status)
-            crit_marker = "[yellow]★[/] " if b.id in critical_path else ""
-            console.print(
+            crit_marker = "[yellow]★[/] " if b.id in critical else ""
+            out.append(
                 f"  {prefix} {icon} {crit_marker}{b.id}: {b.title} [{b.priority.value}]"
             )
-        console.print()
+        out.append("")
 
     ideas_to_show = (
         [
@@ -1834,17 +1895,19 @@ def _list_text(
         else []
     )
     if ideas_to_show:
-        ideas_done = sum(1 for i in ideas_to_show if i.status == Status.DONE)
-        console.print(f"[bold]Ideas[/] ({ideas_done}/{len(ideas_to_show)} done)")
+        ideas_done = sum(1 for i in ideas_to_show if i.status is Status.DONE)
+        out.append(f"[bold]Ideas[/] ({ideas_done}/{len(ideas_to_show)} done)")
         for i, idea in enumerate(ideas_to_show):
             is_last = i == len(ideas_to_show) - 1
             prefix = "└──" if is_last else "├──"
             icon = _get_status_icon(idea.status)
-            crit_marker = "[yellow]★[/] " if idea.id in critical_path else ""
-            console.print(
+            crit_marker = "[yellow]★[/] " if idea.id in critical else ""
+            out.append(
                 f"  {prefix} {icon} {crit_marker}{idea.id}: {idea.title} [{idea.priority.value}]"
             )
-        console.print()
+        out.append("")
+
+    _print_lines(out)
 
 
 # ============================================================================
@@ -1852,29 +1915,32 @@ def _list_text(
 # ============================================================================
 
 
+# Tree connectors indexed by ``is_last``.
+_BRANCH = ("├── ", "└── ")
+_CONT = ("│   ", "    ")
+
+
 def _render_task(task, is_last, prefix, critical_path, show_details):
     """Render a task line in the tree."""
     icon = _get_status_icon(task.status)
-    branch = "└── " if is_last else "├── "
+    branch = _BRANCH[is_last]
     line = f"{prefix}{branch}{icon} {task.id}: {task.title}"
-
-    if show_details:
-        details = []
-        if task.estimate_hours > 0:
-            details.append(f"({task.estimate_hours}h)")
-        if task.status:
-            details.append(f"[{task.status.value}]")
-        if task.claimed_by:
-            details.append(f"@{task.claimed_by}")
-        if task.depends_on:
-            details.append(f"depends:{','.join(task.depends_on)}")
-        if task.id in critical_path:
-            details.append("★")
-
-        if details:
-            line += f" {' '.join(details)}"
-
-    return line
+    if not show_details:
+        return line
+
+    # Each detail carries its own leading space so the parts join directly.
+    parts = [line]
+    if task.estimate_hours > 0:
+        parts.append(f" ({task.estimate_hours}h)")
+    if task.status:
+        parts.append(f" [{task.status.value}]")
+    if task.claimed_by:
+        parts.append(f" @{task.claimed_by}")
+    if task.depends_on:
+        parts.append(f" depends:{','.join(task.depends_on)}")
+    if task.id in critical_path:
+        parts.append(" ★")
+    return "".join(parts)
 
 
 def _render_epic(
@@ -1886,31 +1952,30 @@ def _render_epic(
     show_details,
     max_depth,
     current_depth,
+    node_stats,
+    out,
 ):
-    """Render an epic and its tasks in the tree."""
-    stats = _get_epic_stats(epic)
-    branch = "└── " if is_last else "├── "
-    continuation = "    " if is_last else "│   "
-    lines = []
+    """Append an epic and its tasks to ``out``."""
+    stats = node_stats[epic.id]
+    branch = _BRANCH[is_last]
+    continuation = _CONT[is_last]
 
-    lines.append(
+    out.append(
         f"{prefix}{branch}{epic.name} ({stats['done']}/{stats['total']}) [{epic.status.value}]"
     )
 
     if current_depth >= max_depth:
-        return lines
+        return
 
     tasks_to_show = _filter_unfinished_tasks(epic.tasks) if unfinished else epic.tasks
     new_prefix = prefix + continuation
 
     for i, t in enumerate(tasks_to_show):
         task_is_last = i == len(tasks_to_show) - 1
-        lines.append(
+        out.append(
             _render_task(t, task_is_last, new_prefix, critical_path, show_details)
         )
 
-    return lines
-
 
 def _render_milestone(
     milestone,
@@ -1921,19 +1986,20 @@ def _render_milestone(
     show_details,
     max_depth,
     current_depth,
+    node_stats,
+    out,
 ):
-    """Render a milestone and its epics in the tree."""
-    stats = _get_milestone_stats(milestone)
-    branch = "└── " if is_last else "├── "
-    continuation = "    " if is_last else "│   "
-    lines = []
+    """Append a milestone and its epics to ``out``."""
+    stats = node_stats[milestone.id]
+    branch = _BRANCH[is_last]
+    continuation = _CONT[is_last]
 
-    lines.append(
+    out.append(
         f"{prefix}{branch}{milestone.name} ({stats['done']}/{stats['total']}) [{milestone.status.value}]"
     )
 
     if current_depth >= max_depth:
-        return lines
+        return
 
     epics_to_show = milestone.epics
     if unfinished:
@@ -1943,21 +2009,19 @@ def _render_milestone(
 
     for i, e in enumerate(epics_to_show):
         epic_is_last = i == len(epics_to_show) - 1
-        lines.extend(
-            _render_epic(
-                e,
-                epic_is_last,
-                new_prefix,
-                critical_path,
-                unfinished,
-                show_details,
-                max_depth,
-                current_depth + 1,
-            )
+        _render_epic(
+            e,
+            epic_is_last,
+            new_prefix,
+            critical_path,
+            unfinished,
+            show_details,
+            max_depth,
+            current_depth + 1,
+            node_stats,
+            out,
         )
 
-    return lines
-
 
 def _render_phase(
     phase,
@@ -1968,19 +2032,20 @@ def _render_phase(
     show_details,
     max_depth,
     current_depth,
+    node_stats,
+    out,
 ):
-    """Render a phase and its milestones in the tree."""
-    stats = _get_phase_stats(phase)
-    branch = "└── " if is_last else "├── "
-    continuation = "    " if is_last else "│   "
-    lines = []
+    """Append a phase and its milestones to ``out``."""
+    stats = node_stats[phase.id]
+    branch = _BRANCH[is_last]
+    continuation = _CONT[is_last]
 
-    lines.append(
+    out.append(
         f"{prefix}{branch}[bold]{phase.name}[/] ({stats['done']}/{stats['total']}) [{phase.status.value}]"
     )
 
     if current_depth >= max_depth:
-        return lines
+        return
 
     milestones_to_show = phase.milestones
     if unfinished:
@@ -1990,19 +2055,80 @@ def _render_phase(
 
     for i, m in enumerate(milestones_to_show):
         milestone_is_last = i == len(milestones_to_show) - 1
-        lines.extend(
-            _render_milestone(
-                m,
-                milestone_is_last,
-                new_prefix,
-                critical_path,
-                unfinished,
-                show_details,
-                max_depth,
-                current_depth + 1,
-            )
+        _render_milestone(
+            m,
+            milestone_is_last,
+            new_prefix,
+            critical_path,
+            unfinished,
+            show_details,
+            max_depth,
+            current_depth + 1,
+            node_stats,
+            out,
         )
 
+
+def render_tree(
+    tree_data,
+    critical_path,
+    phases=None,
+    depth=4,
+    unfinished=False,
+    details=False,
+    show_completed_aux=False,
+    include_aux=True,
+):
+    """Render a loaded tree to rich-markup lines without touching the disk.
+
+    ``phases`` defaults to every phase in ``tree_data``; pass a pre-filtered
+    list to render a scoped slice. Bugs and ideas are appended as trailing
+    sections when ``include_aux`` is set.
+    """
+    phases_to_show = tree_data.phases if phases is None else phases
+
+    bugs_to_show = []
+    ideas_to_show = []
+    if include_aux:
+        bugs_to_show = [
+            b
+            for b in getattr(tree_data, "bugs", [])
+            if _include_aux_item(b.status, unfinished, show_completed_aux)
+        ]
+        ideas_to_show = [
+            i
+            for i in getattr(tree_data, "ideas", [])
+            if _include_aux_item(i.status, unfinished, show_completed_aux)
+        ]
+    has_bugs = len(bugs_to_show) > 0
+    has_ideas = len(ideas_to_show) > 0
+    has_aux = has_bugs or has_ideas
+
+    node_stats = _done_totals_index(phases_to_show)
+    critical = frozenset(critical_path)
+    lines = []
+    for i, p in enumerate(phases_to_show):
+        is_last = i == len(phases_to_show) - 1 and not has_aux
+        _render_phase(
+            p, is_last, "", critical, unfinished, details, depth, 1, node_stats, lines
+        )
+
+    if has_bugs:
+        bugs_done = sum(1 for b in bugs_to_show if b.status is Status.DONE)
+        branch = "└──" if not has_ideas else "├──"
+        lines.append(f"{branch} [bold]Bugs[/] ({bugs_done}/{len(bugs_to_show)})")
+        bugs_prefix = "    " if not has_ideas else "│   "
+        for i, b in enumerate(bugs_to_show):
+            is_last_bug = i == len(bugs_to_show) - 1 and not has_ideas
+            lines.append(_render_task(b, is_last_bug, bugs_prefix, critical, details))
+
+    if has_ideas:
+        ideas_done = sum(1 for i in ideas_to_show if i.status is Status.DONE)
+        lines.append(f"└── [bold]Ideas[/] ({ideas_done}/{len(ideas_to_show)})")
+        for i, idea in enumerate(ideas_to_show):
+            is_last_idea = i == len(ideas_to_show) - 1
+            lines.append(_render_task(idea, is_last_idea, "    ", critical, details))
+
     return lines
 
 
@@ -2035,7 +2161,9 @@ def tree(output_json, unfinished, show_completed_aux, details, depth, path_queri
         is_scoped_query = len(parsed_queries) > 0
         config = load_config()
 
-        calc = CriticalPathCalculator(tree_data, config["complexity_multipliers"])
+        calc = CriticalPathCalculator(
+            tree_data, config["complexity_multipliers"], _graph_result_cache(loader)
+        )
         critical_path, next_available = calc.calculate()
         tree_data.critical_path = critical_path
         tree_data.next_available = next_available
@@ -2045,6 +2173,8 @@ def tree(output_json, unfinished, show_completed_aux, details, depth, path_queri
             phases_to_show = _merge_scoped_phases(scoped_slices)
         else:
             phases_to_show = tree_data.phases
+        if unfinished:
+            _annotate_unfinished(phases_to_show)
 
         if output_json:
             if unfinished:
@@ -2052,6 +2182,8 @@ def tree(output_json, unfinished, show_completed_aux, details, depth, path_queri
                     p for p in phases_to_show if _has_unfinished_milestones(p)
                 ]
 
+            node_stats = _done_totals_index(phases_to_show)
+            critical = frozenset(critical_path)
             output = {
                 "critical_path": critical_path,
                 "next_available": next_available,
@@ -2059,50 +2191,49 @@ def tree(output_json, unfinished, show_completed_aux, details, depth, path_queri
                 "show_details": details,
                 "unfinished_only": unfinished,
                 "phases": [
-                    {
-                        "id": p.id,
-                        "name": p.name,
-                        "status": p.status.value,
-                        "stats": _get_phase_stats(p),
-                        "milestones": [
-                            {
-                                "id": m.id,
-                                "name": m.name,
-                                "status": m.status.value,
-                                "stats": _get_milestone_stats(m),
-                                "epics": [
-                                    {
-                                        "id": e.id,
-                                        "name": e.name,
-                                        "status": e.status.value,
-                                        "stats": _get_epic_stats(e),
-                                        "tasks": [
-                                            {
-                                                "id": t.id,
-                                                "title": t.title,
-                                                "status": t.status.value,
-                                                "estimate_hours": t.estimate_hours,
-                                                "claimed_by": t.claimed_by,
-                                                "depends_on": t.depends_on,
-                                                "on_critical_path": t.id
-                                                in critical_path,
-                                            }
-                                            for t in (
-                                                _filter_unfinished_tasks(e.tasks)
-                                                if unfinished
-                                                else e.tasks
-                                            )
-                                        ],
-                                    }
-                                    for e in m.epics
-                                    if not unfinished or _has_unfinished_tasks(e)
-                                ],
-                            }
-                            for m in p.milestones
-                            if not unfinished or _has_unfinished_epics(m)
-                        ],
-                    }
-                    for p in phases_to_show
+                {
+                    "id": p.id,
+                    "name": p.name,
+                    "status": p.status.value,
+                    "stats": node_stats[p.id],
+                    "milestones": [
+                        {
+                            "id": m.id,
+                            "name": m.name,
+                            "status": m.status.value,
+                            "stats": node_stats[m.id],
+                            "epics": [
+                                {
+                                    "id": e.id,
+                                    "name": e.name,
+                                    "status": e.status.value,
+                                    "stats": node_stats[e.id],
+                                    "tasks": [
+                                        {
+                                            "id": t.id,
+                                            "title": t.title,
+                                            "status": t.status.value,
+                                            "estimate_hours": t.estimate_hours,
+                                            "claimed_by": t.claimed_by,
+                                            "depends_on": t.depends_on,
+                                            "on_critical_path": t.id in critical,
+                                        }
+                                        for t in (
+                                            _filter_unfinished_tasks(e.tasks)
+                                            if unfinished
+                                            else e.tasks
+                                        )
+                                    ],
+                                }
+                                for e in m.epics
+                                if not unfinished or _has_unfinished_tasks(e)
+                            ],
+                        }
+                        for m in p.milestones
+                        if not unfinished or _has_unfinished_epics(m)
+                    ],
+                }
+                for p in phases_to_show
                 ],
             }
             click.echo(json.dumps(output, indent=2))
@@ -2114,53 +2245,21 @@ def tree(output_json, unfinished, show_completed_aux, details, depth, path_queri
                 p for p in phases_to_show if _has_unfinished_milestones(p)
             ]
 
-        bugs_to_show = []
-        ideas_to_show = []
-        if not is_scoped_query:
-            bugs_to_show = [
-                b
-                for b in getattr(tree_data, "bugs", [])
-                if _include_aux_item(b.status, unfinished, show_completed_aux)
-            ]
-            ideas_to_show = [
-                i
-                for i in getattr(tree_data, "ideas", [])
-                if _include_aux_item(i.status, unfinished, show_completed_aux)
-            ]
-        has_bugs = len(bugs_to_show) > 0
-        has_ideas = len(ideas_to_show) > 0
-        has_aux = has_bugs or has_ideas
-
-        for i, p in enumerate(phases_to_show):
-            is_last = i == len(phases_to_show) - 1 and not has_aux
-            lines = _render_phase(
-                p, is_last, "", critical_path, unfinished, details, depth, 1
-            )
-            for line in lines:
-                console.print(line)
+        lines = render_tree(
+            tree_data,
+            critical_path,
+            phases=phases_to_show,
+            depth=depth,
+            unfinished=unfinished,
+            details=details,
+            show_completed_aux=show_completed_aux,
+            include_aux=not is_scoped_query,
+        )
+        _print_lines(lines)
 
         if parsed_queries and not phases_to_show:
             console.print("No tree nodes found for path query: " + ", ".join(path_queries))
 
-        # Render auxiliary sections
-        if has_bugs:
-            bugs_done = sum(1 for b in bugs_to_show if b.status == Status.DONE)
-            branch = "└──" if not has_ideas else "├──"
-            console.print(f"{branch} [bold]Bugs[/] ({bugs_done}/{len(bugs_to_show)})")
-            bugs_prefix = "    " if not has_ideas else "│   "
-            for i, b in enumerate(bugs_to_show):
-                is_last_bug = i == len(bugs_to_show) - 1 and not has_ideas
-                line = _render_task(b, is_last_bug, bugs_prefix, critical_path, details)
-                console.print(line)
-
-        if has_ideas:
-            ideas_done = sum(1 for i in ideas_to_show if i.status == Status.DONE)
-            console.print(f"└── [bold]Ideas[/] ({ideas_done}/{len(ideas_to_show)})")
-            for i, idea in enumerate(ideas_to_show):
-                is_last_idea = i == len(ideas_to_show) - 1
-                line = _render_task(idea, is_last_idea, "    ", critical_path, details)
-                console.print(line)
-
     except Exception as e:
         console.print(f"[red]Error:[/] {str(e)}")
         raise click.Abort()
@@ -2415,7 +2514,7 @@ def show(path_ids, show_long, show_all):
                         f"{aux_task.id}: {aux_task.title}\nstatus={aux_task.status.value} "
                         f"estimate={aux_task.estimate_hours}"
                     )
-                    if is_idea_id(path_id) and aux_task.status == Status.PENDING:
+                    if is_idea_id(path_id) and aux_task.status is Status.PENDING:
                         _show_idea_instructions(aux_task)
                 continue
 
@@ -2597,13 +2696,7 @@ def _show_epic(tree, epic_id):
 
     console.print(f"\n[bold]Tasks ({len(epic.tasks)}):[/]")
     for t in epic.tasks:
-        status_icons = {
-            "done": "[green]✓[/]",
-            "in_progress": "[yellow]→[/]",
-            "pending": "[ ]",
-            "blocked": "[red]✗[/]",
-        }
-        icon = status_icons.get(t.status.value, "?")
+        icon = _DETAIL_STATUS_ICONS.get(t.status, "?")
         console.print(f"\n  {icon} [bold]{t.id}[/]: {t.title}")
         console.print(
             f"      {t.estimate_hours}h, {t.complexity.value}, {t.priority.value}"
@@ -2643,30 +2736,26 @@ def _show_task(tree, task_id, show_long=False, show_all=False):
         return
 
     content = task_file.read_text()
+    file_lines = content.splitlines()
     console.print(
-        f"[bold]File stats:[/] {task_file.stat().st_size} bytes, {len(content.splitlines())} lines\n"
+        f"[bold]File stats:[/] {task_file.stat().st_size} bytes, {len(file_lines)} lines\n"
     )
-    parts = content.split("---\n")
-    body = ""
-    if len(parts) >= 3:
-        body = parts[2]
-    else:
-        body = content
-    lines = body.strip().splitlines()
     if show_all:
         console.print("[bold]Task file:[/]")
-        for line in content.splitlines():
-            console.print(f"  {line}")
+        _print_lines([f"  {line}" for line in file_lines])
         return
+    # The body is everything after the second "---" fence, including any
+    # "---" horizontal rules inside it.
+    parts = content.split("---\n", 2)
+    body = parts[2] if len(parts) >= 3 else content
+    lines = body.strip().splitlines()
     if lines:
         console.print("[bold]Body:[/]")
     if show_long:
-        for line in lines:
-            console.print(f"  {line}")
+        _print_lines([f"  {line}" for line in lines])
     else:
         preview_count = min(SHOW_TASK_PREVIEW_LINES, len(lines))
-        for line in lines[:preview_count]:
-            console.print(f"  {line}")
+        _print_lines([f"  {line}" for line in lines[:preview_count]])
         if len(lines) > preview_count:
             console.print(f"[dim]  ... ({len(lines) - preview_count} more lines)[/]")
             console.print(f"[dim]To view the full file, run: cat {task_file}[/]")
@@ -2831,8 +2920,8 @@ def ls(scopes):
                         f"(in_progress={stats['in_progress']}, blocked={stats['blocked']})"
                     )
 
-            bugs_done = sum(1 for bug in tree.bugs if bug.status == Status.DONE)
-            ideas_done = sum(1 for idea in tree.ideas if idea.status == Status.DONE)
+            bugs_done = sum(1 for bug in tree.bugs if bug.status is Status.DONE)
+            ideas_done = sum(1 for idea in tree.ideas if idea.status is Status.DONE)
             fixes_done, fixes_total = _summarize_fixed_tasks(loader)
             console.print(f"Bugs ({bugs_done}/{len(tree.bugs)})")
             console.print(f"Ideas ({ideas_done}/{len(tree.ideas)})")
@@ -2950,7 +3039,9 @@ def next(output_json):
         tree = loader.load("metadata")
         config = load_config()
 
-        calc = CriticalPathCalculator(tree, config["complexity_multipliers"])
+        calc = CriticalPathCalculator(
+            tree, config["complexity_multipliers"], _graph_result_cache(loader)
+        )
         critical_path, next_available = calc.calculate()
 
         if not next_available:
@@ -3005,6 +3096,7 @@ def preview(output_json):
             return
 
         prioritized = calc.prioritize_task_ids(available, critical_path)
+        critical = frozenset(critical_path)
 
         normal_preview = []
         bug_preview = []
@@ -3018,17 +3110,17 @@ def preview(output_json):
             if task.id.startswith("B"):
                 if len(bug_preview) < PREVIEW_AUX_LIMIT:
                     bug_preview.append(
-                        _preview_task_payload(task, critical_path, calc, tree, output_json=output_json)
+                        _preview_task_payload(task, critical, calc, tree, output_json=output_json)
                     )
             elif task.id.startswith("I"):
                 if len(idea_preview) < PREVIEW_AUX_LIMIT:
                     idea_preview.append(
-                        _preview_task_payload(task, critical_path, calc, tree, output_json=output_json)
+                        _preview_task_payload(task, critical, calc, tree, output_json=output_json)
                     )
             else:
                 if len(normal_preview) < PREVIEW_DISPLAY_LIMIT:
                     normal_preview.append(
-                        _preview_task_payload(task, critical_path, calc, tree, output_json=output_json)
+                        _preview_task_payload(task, critical, calc, tree, output_json=output_json)
                     )
 
             if (
@@ -3129,7 +3221,7 @@ def preview(output_json):
 
 def _show_blocking_tasks(tree):
     """Show tasks that may be blocking progress."""
-    in_progress = [t for t in get_all_tasks(tree) if t.status == Status.IN_PROGRESS]
+    in_progress = [t for t in get_all_tasks(tree) if t.status is Status.IN_PROGRESS]
 
     if in_progress:
         console.print(f"There are {len(in_progress)} task(s) in progress:\n")
@@ -3334,7 +3426,7 @@ def done(task_ids, verify, force):
                     console.print(f"[red]Error:[/] Task not found: {task_id}")
                     raise click.Abort()
 
-                if task.status == Status.DONE:
+                if task.status is Status.DONE:
                     console.print(f"[yellow]⚠ Already done:[/] {task.id} - {task.title}")
                     continue
 
@@ -3356,17 +3448,17 @@ def done(task_ids, verify, force):
 
                 # Show unblocked tasks
                 calc = CriticalPathCalculator(tree, config["complexity_multipliers"])
-                critical_path, _ = calc.calculate()
+                critical = frozenset(calc.calculate()[0])
                 unblocked = find_newly_unblocked(tree, calc, task_id)
 
                 if unblocked:
                     console.print(f"[cyan]Unblocked {len(unblocked)} task(s):[/]")
                     for t in unblocked:
-                        crit = " [yellow]★[/]" if t.id in critical_path else ""
+                        crit = " [yellow]★[/]" if t.id in critical else ""
                         console.print(f"  → {t.id}: {t.title}{crit}")
 
                     # Suggest next task
-                    on_crit = [t for t in unblocked if t.id in critical_path]
+                    on_crit = [t for t in unblocked if t.id in critical]
                     if on_crit:
                         console.print(
                             f"\n[dim]Claim next:[/] 'backlog grab' or 'backlog cycle'\n"
@@ -3385,7 +3477,7 @@ def done(task_ids, verify, force):
                 _completion_status = print_completion_notices(console, tree, task)
 
                 # Handle multi-task context
-                agent = get_default_agent()
+                agent = get_default_agent(config)
                 primary, additional = get_all_current_tasks(agent)
 
                 if primary == task_id and additional:
@@ -3625,9 +3717,7 @@ def sync():
         tree.next_available = next_available
         _warn_non_task_cycle(calc)
 
-        loader.save_stats(tree)
-
-        stats = tree.stats
+        stats = loader.save_stats(tree)
         console.print("\n[green]✓ Synchronized task tree[/]\n")
         console.print(f"  Total tasks: {stats['total_tasks']}")
         console.print(f"  Done: {stats['done']}")
@@ -3694,21 +3784,22 @@ def unclaim_stale(threshold, dry_run):
         if threshold is None:
             threshold = config["stale_claim"]["error_after_minutes"]
 
-        all_tasks = get_all_tasks(tree)
         now = utc_now()
+        cutoff = now - timedelta(minutes=threshold)
 
-        # Find stale claims
+        # Find stale claims; only those past the cutoff need their age.
         stale_tasks = []
-        for task in all_tasks:
-            if task.status == Status.IN_PROGRESS and task.claimed_at:
-                age_minutes = (now - to_utc(task.claimed_at)).total_seconds() / 60
-                if age_minutes >= threshold:
-                    stale_tasks.append(
-                        {
-                            "task": task,
-                            "age_minutes": age_minutes,
-                        }
-                    )
+        for task in get_all_tasks(tree):
+            if task.status is not Status.IN_PROGRESS or not task.claimed_at:
+                continue
+            claimed = to_utc(task.claimed_at)
+            if claimed <= cutoff:
+                stale_tasks.append(
+                    {
+                        "task": task,
+                        "age_minutes": (now - claimed).total_seconds() / 60,
+                    }
+                )
 
         if not stale_tasks:
             console.print(
@@ -3765,6 +3856,8 @@ def unclaim_stale(threshold, dry_run):
 )
 def agents(profile):
     """Print concise AGENTS.md draft text for task workflow defaults."""
+    from ._agents_snippets import AGENTS_SNIPPETS
+
     order = ["short", "medium", "long"] if profile == "all" else [profile]
     for i, key in enumerate(order):
         if i:
@@ -4152,42 +4245,5 @@ def migrate(force, no_symlink):
         raise click.Abort()
 
 
-# ============================================================================
-# Register Commands from Modules
-# ============================================================================
-
-
-def _register_all_commands():
-    """Register commands from all modules."""
-    from .commands import (
-        workflow,
-        display,
-        search,
-        reports,
-        session,
-        timeline,
-        data,
-        skills,
-        intake,
-        schema,
-        check,
-    )
-
-    workflow.register_commands(cli)
-    display.register_commands(cli)
-    search.register_commands(cli)
-    reports.register_commands(cli)
-    session.register_commands(cli)
-    timeline.register_commands(cli)
-    data.register_commands(cli)
-    skills.register_commands(cli)
-    intake.register_commands(cli)
-    schema.register_commands(cli)
-    check.register_commands(cli)
-
-
-_register_all_commands()
-
-
 if __name__ == "__main__":
     cli()
@@ -7,7 +7,6 @@ import re
 from pathlib import Path
 
 import click
-import networkx as nx
 from rich.console import Console
 
 from ..helpers import (
@@ -453,6 +452,8 @@ def _validate_bugs(tree, findings, tasks_root: Path):
 def _append_graph_cycle_findings(
     graph, findings, code: str, message_prefix: str, location: str
 ):
+    import networkx as nx
+
     if nx.is_directed_acyclic_graph(graph):
         return
     cycles = list(nx.simple_cycles(graph))
@@ -464,6 +465,8 @@ def _append_graph_cycle_findings(
 
 
 def _validate_cycles(tree, findings):
+    import networkx as nx
+
     # Task dependency cycles (includes bugs via getAllTasks)
     task_graph = nx.DiGraph()
     all_tasks = get_all_tasks(tree)
@@ -14,6 +14,13 @@ from ..time_utils import utc_now, to_utc
 
 console = Console()
 
+_STATUS_ICONS = {
+    Status.DONE: "[green]✓[/]",
+    Status.IN_PROGRESS: "[yellow]→[/]",
+    Status.PENDING: "[ ]",
+    Status.BLOCKED: "[red]✗[/]",
+}
+
 
 def load_config():
     """Load configuration."""
@@ -121,13 +128,7 @@ def search(pattern, status, tags, complexity, priority, limit):
 
             for task in tasks:
                 # Status indicator
-                status_icons = {
-                    "done": "[green]✓[/]",
-                    "in_progress": "[yellow]→[/]",
-                    "pending": "[ ]",
-                    "blocked": "[red]✗[/]",
-                }
-                icon = status_icons.get(task.status.value, "?")
+                icon = _STATUS_ICONS.get(task.status, "?")
 
                 # Critical path marker
                 crit = "[yellow]★[/]" if task.id in critical_path else " "
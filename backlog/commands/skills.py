@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from textwrap import dedent
 
@@ -102,74 +103,16 @@ def install_skills(
         if _should_prompt_for_client(ctx):
             client_name = _prompt_for_client()
 
-        selected_skills = _resolve_skills(skill_names)
-        config = load_config()
-
-        operations, warnings = _build_install_operations(
-            skills=selected_skills,
+        result = run_install(
+            skill_names,
             scope=scope,
             client_name=client_name,
             artifact=artifact,
             output_dir=output_dir,
-            config=config,
+            force=force,
+            dry_run=dry_run,
         )
 
-        if not operations:
-            message = "No supported install targets were selected."
-            if warnings:
-                message = f"{message}\n" + "\n".join(f"- {w}" for w in warnings)
-            raise click.ClickException(message)
-
-        existing_paths = {str(op.path) for op in operations if op.path.exists()}
-        conflicting_ops = [op for op in operations if str(op.path) in existing_paths]
-        writable_ops = [op for op in operations if str(op.path) not in existing_paths]
-
-        skipped_existing: list[Path] = []
-        if conflicting_ops and not force and not dry_run:
-            if not writable_ops:
-                preview = "\n".join(
-                    f"  - {op.path}"
-                    for op in sorted(conflicting_ops, key=lambda op: str(op.path))
-                )
-                raise click.ClickException(
-                    "Refusing to overwrite existing files (use --force):\n" + preview
-                )
-
-            skipped_existing = [op.path for op in conflicting_ops]
-            warnings.append(
-                f"Skipped {len(skipped_existing)} existing file(s); use --force to overwrite."
-            )
-            operations = writable_ops
-
-        written = []
-        if not dry_run:
-            for op in operations:
-                op.path.parent.mkdir(parents=True, exist_ok=True)
-                op.path.write_text(op.content, encoding="utf-8")
-                written.append(op.path)
-
-        result = {
-            "skills": selected_skills,
-            "scope": scope,
-            "client": client_name,
-            "artifact": artifact,
-            "output_dir": str(output_dir) if output_dir else None,
-            "dry_run": dry_run,
-            "force": force,
-            "warnings": warnings,
-            "skipped_existing_count": len(skipped_existing),
-            "operations": [
-                {
-                    "client": op.client,
-                    "artifact": op.artifact,
-                    "path": str(op.path),
-                    "action": "planned" if dry_run else "written",
-                }
-                for op in operations
-            ],
-            "written_count": 0 if dry_run else len(written),
-        }
-
         if output_json:
             click.echo(json.dumps(result, indent=2))
             return
@@ -182,6 +125,86 @@ def install_skills(
         raise click.ClickException(str(exc)) from exc
 
 
+def run_install(
+    skill_names: tuple[str, ...] = (),
+    *,
+    scope: str = "local",
+    client_name: str = "common",
+    artifact: str = "skills",
+    output_dir: Path | None = None,
+    force: bool = False,
+    dry_run: bool = False,
+) -> dict:
+    """Write the requested skill artifacts and return the install summary."""
+    selected_skills = _resolve_skills(skill_names)
+    config = load_config()
+
+    operations, warnings = _build_install_operations(
+        skills=selected_skills,
+        scope=scope,
+        client_name=client_name,
+        artifact=artifact,
+        output_dir=output_dir,
+        config=config,
+    )
+
+    if not operations:
+        message = "No supported install targets were selected."
+        if warnings:
+            message = f"{message}\n" + "\n".join(f"- {w}" for w in warnings)
+        raise click.ClickException(message)
+
+    existing_paths = {str(op.path) for op in operations if op.path.exists()}
+    conflicting_ops = [op for op in operations if str(op.path) in existing_paths]
+    writable_ops = [op for op in operations if str(op.path) not in existing_paths]
+
+    skipped_existing: list[Path] = []
+    if conflicting_ops and not force and not dry_run:
+        if not writable_ops:
+            preview = "\n".join(
+                f"  - {op.path}"
+                for op in sorted(conflicting_ops, key=lambda op: str(op.path))
+            )
+            raise click.ClickException(
+                "Refusing to overwrite existing files (use --force):\n" + preview
+            )
+
+        skipped_existing = [op.path for op in conflicting_ops]
+        warnings.append(
+            f"Skipped {len(skipped_existing)} existing file(s); use --force to overwrite."
+        )
+        operations = writable_ops
+
+    written = []
+    if not dry_run:
+        for op in operations:
+            op.path.parent.mkdir(parents=True, exist_ok=True)
+            op.path.write_text(op.content, encoding="utf-8")
+            written.append(op.path)
+
+    return {
+        "skills": selected_skills,
+        "scope": scope,
+        "client": client_name,
+        "artifact": artifact,
+        "output_dir": str(output_dir) if output_dir else None,
+        "dry_run": dry_run,
+        "force": force,
+        "warnings": warnings,
+        "skipped_existing_count": len(skipped_existing),
+        "operations": [
+            {
+                "client": op.client,
+                "artifact": op.artifact,
+                "path": str(op.path),
+                "action": "planned" if dry_run else "written",
+            }
+            for op in operations
+        ],
+        "written_count": 0 if dry_run else len(written),
+    }
+
+
 def _resolve_skills(skill_names: tuple[str, ...]) -> list[str]:
     """Normalize skill selection from CLI args."""
     normalized = [name.strip().lower() for name in skill_names if name.strip()]
@@ -387,7 +410,12 @@ def _plan_ingest_max_subagents(config: dict) -> int:
 def _render_skill_files(
     skill_name: str, *, client: str, max_subagents: int
 ) -> dict[str, str]:
-    """Return a map of relative file path to file content."""
+    """Return a map of relative file path to file content.
+
+    The template builders are memoized on their arguments, so each distinct
+    (skill, client, max_subagents) body is dedented and assembled only once
+    per process.
+    """
     if skill_name == "plan-task":
         return {
             "SKILL.md": _plan_task_skill(client=client),
@@ -461,6 +489,7 @@ def _skill_frontmatter(
     return "\n".join(lines)
 
 
+@lru_cache(maxsize=None)
 def _plan_task_skill(*, client: str) -> str:
     """Codex skill template: plan-task."""
     short_description = None
@@ -513,6 +542,7 @@ def _plan_task_skill(*, client: str) -> str:
     return frontmatter + "\n\n" + body
 
 
+@lru_cache(maxsize=None)
 def _plan_ingest_skill(*, client: str, max_subagents: int) -> str:
     """Codex skill template: plan-ingest."""
     short_description = None
@@ -612,6 +642,7 @@ def _plan_ingest_skill(*, client: str, max_subagents: int) -> str:
     return frontmatter + "\n\n" + body
 
 
+@lru_cache(maxsize=None)
 def _start_tasks_skill(*, client: str) -> str:
     """Skill template: start-tasks."""
     short_description = None
@@ -667,6 +698,7 @@ def _start_tasks_skill(*, client: str) -> str:
     return frontmatter + "\n\n" + body
 
 
+@lru_cache(maxsize=None)
 def _hierarchy_reference() -> str:
     """Reference for ID formats and hierarchy."""
     return dedent(
@@ -691,6 +723,7 @@ def _hierarchy_reference() -> str:
     )
 
 
+@lru_cache(maxsize=None)
 def _tasks_cli_quick_reference() -> str:
     """Reference cheat sheet for the execution-loop command set."""
     return dedent(
@@ -719,6 +752,7 @@ def _tasks_cli_quick_reference() -> str:
     )
 
 
+@lru_cache(maxsize=None)
 def _decomposition_rubric() -> str:
     """Reference rubric used by plan-ingest."""
     return dedent(
@@ -744,6 +778,7 @@ def _decomposition_rubric() -> str:
     )
 
 
+@lru_cache(maxsize=None)
 def _plan_task_command(*, client: str) -> str:
     """Command markdown: plan-task."""
     if client == "opencode":
@@ -781,6 +816,7 @@ def _plan_task_command(*, client: str) -> str:
     )
 
 
+@lru_cache(maxsize=None)
 def _plan_ingest_command(*, client: str, max_subagents: int) -> str:
     """Command markdown: plan-ingest."""
     if client == "opencode":
@@ -822,6 +858,7 @@ def _plan_ingest_command(*, client: str, max_subagents: int) -> str:
     )
 
 
+@lru_cache(maxsize=None)
 def _start_tasks_command(*, client: str) -> str:
     """Command markdown: start-tasks."""
     if client == "opencode":
@@ -861,6 +898,7 @@ def _start_tasks_command(*, client: str) -> str:
     )
 
 
+@lru_cache(maxsize=None)
 def _backlog_howto_command(*, client: str) -> str:
     """Command markdown: backlog-howto."""
     if client == "opencode":
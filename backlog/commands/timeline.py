@@ -182,9 +182,7 @@ def _group_tasks(tree, tasks, group_by):
         else:
             label = "All"
 
-        if label not in groups:
-            groups[label] = []
-        groups[label].append(task)
+        groups.setdefault(label, []).append(task)
 
     return groups
 
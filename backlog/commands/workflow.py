@@ -54,9 +54,13 @@ def load_config():
     return cli_load_config()
 
 
-def get_default_agent():
-    """Get the default agent ID from config."""
-    config = load_config()
+def get_default_agent(config=None):
+    """Get the default agent ID from config.
+
+    Pass an already-loaded ``config`` to skip reading it again.
+    """
+    if config is None:
+        config = load_config()
     return config.get("agent", {}).get("default_agent", "cli-user")
 
 
@@ -72,7 +76,7 @@ def _find_and_reclaim_stale_task(tree, config, agent, loader):
 
     # Find all stale tasks
     for task in get_all_tasks(tree):
-        if task.status == Status.IN_PROGRESS and task.claimed_at:
+        if task.status is Status.IN_PROGRESS and task.claimed_at:
             age_minutes = (now - to_utc(task.claimed_at)).total_seconds() / 60
             if age_minutes >= error_threshold:
                 stale_tasks.append({"task": task, "age_minutes": age_minutes})
@@ -329,7 +333,7 @@ def _display_sibling_grab_results(
 def _print_in_progress_tasks(tree) -> None:
     """Show currently in-progress tasks that may be blocking progress."""
     in_progress = [
-        task for task in get_all_tasks(tree) if task.status == Status.IN_PROGRESS
+        task for task in get_all_tasks(tree) if task.status is Status.IN_PROGRESS
     ]
 
     if not in_progress:
@@ -589,11 +593,11 @@ def grab(task_ids, agent, scopes, no_content, multi, single, siblings, count):
     or --multi for independent tasks from different epics.
     """
     try:
+        config = load_config()
         if not agent:
-            agent = get_default_agent()
+            agent = get_default_agent(config)
         loader = TaskLoader()
         tree = loader.load("metadata")
-        config = load_config()
         metadata = None
 
         def _run() -> tuple[str, str] | None:
@@ -704,12 +708,12 @@ def cycle(task_id, agent, no_content):
     """
     try:
         # Use config default if agent not specified
+        config = load_config()
         if not agent:
-            agent = get_default_agent()
+            agent = get_default_agent(config)
 
         loader = TaskLoader()
         tree = loader.load("metadata")
-        config = load_config()
 
         # Get task ID from context if not provided
         if not task_id:
@@ -729,7 +733,7 @@ def cycle(task_id, agent, no_content):
             raise click.Abort()
 
         # Skip if already done
-        if task.status == Status.DONE:
+        if task.status is Status.DONE:
             console.print(f"[yellow]⚠ Already done:[/] {task.id} - {task.title}")
         else:
             # Calculate duration
@@ -990,8 +994,9 @@ def blocked(task_id, reason, agent, grab):
         from ..status import update_status
 
         # Use config default if agent not specified
+        config = load_config()
         if not agent:
-            agent = get_default_agent()
+            agent = get_default_agent(config)
 
         # Get task ID from context if not provided
         if not task_id:
@@ -1004,7 +1009,6 @@ def blocked(task_id, reason, agent, grab):
 
         loader = TaskLoader()
         tree = loader.load("metadata")
-        config = load_config()
 
         task = tree.find_task(task_id)
         if not task:
@@ -1085,8 +1089,9 @@ def skip(task_id, agent, no_grab):
         from ..status import update_status
 
         # Use config default if agent not specified
+        config = load_config()
         if not agent:
-            agent = get_default_agent()
+            agent = get_default_agent(config)
 
         # Get task ID from context if not provided
         if not task_id:
@@ -1099,7 +1104,6 @@ def skip(task_id, agent, no_grab):
 
         loader = TaskLoader()
         tree = loader.load("metadata")
-        config = load_config()
 
         task = tree.find_task(task_id)
         if not task:
@@ -1170,9 +1174,9 @@ def skip(task_id, agent, no_grab):
 def _reset_task_to_pending(task, loader):
     from ..models import Status
 
-    if task.status == Status.IN_PROGRESS:
+    if task.status is Status.IN_PROGRESS:
         update_status(task, Status.PENDING)
-    elif task.status == Status.PENDING and (task.claimed_by or task.claimed_at):
+    elif task.status is Status.PENDING and (task.claimed_by or task.claimed_at):
         task.claimed_by = None
         task.claimed_at = None
     else:
@@ -1280,7 +1284,7 @@ def handoff(task_id, to_agent, notes, force):
             console.print("[dim]Use --force to override.[/]")
             raise click.Abort()
 
-        if task.status == Status.DONE:
+        if task.status is Status.DONE:
             console.print(f"[yellow]Warning:[/] Task is already done.")
             return
 
@@ -1311,7 +1315,7 @@ def handoff(task_id, to_agent, notes, force):
         task.claimed_at = utc_now()
 
         # Keep status as in_progress
-        if task.status == Status.PENDING:
+        if task.status is Status.PENDING:
             task.status = Status.IN_PROGRESS
             task.started_at = utc_now()
 
@@ -1362,7 +1366,7 @@ def why(task_id):
         console.print(f"\n[bold]{task.id}[/] - {task.title}")
         console.print(f"Status: {task.status.value}")
 
-        if task.status.value == "done":
+        if task.status is Status.DONE:
             console.print("[green]✓ This task is complete.[/]\n")
             return
 
@@ -1381,7 +1385,7 @@ def why(task_id):
             for dep_id in task.depends_on:
                 dep = tree.find_task(dep_id)
                 if dep:
-                    if dep.status.value == "done":
+                    if dep.status is Status.DONE:
                         console.print(f"  [green]✓[/] {dep_id} - {dep.title} (done)")
                     else:
                         console.print(
@@ -1404,7 +1408,7 @@ def why(task_id):
             if task_idx and task_idx > 0 and not task.depends_on:
                 prev = epic.tasks[task_idx - 1]
                 console.print(f"\n[bold]Implicit dependency (previous in epic):[/]")
-                if prev.status.value == "done":
+                if prev.status is Status.DONE:
                     console.print(f"  [green]✓[/] {prev.id} - {prev.title} (done)")
                 else:
                     console.print(
@@ -1414,13 +1418,13 @@ def why(task_id):
         # Determine if task can be started
         can_start = calc._check_dependencies(task)
         if can_start:
-            if task.status.value == "pending":
+            if task.status is Status.PENDING:
                 if task.claimed_by:
                     console.print(f"\n[yellow]Task is claimed by {task.claimed_by}[/]")
                 else:
                     console.print(f"\n[green]✓ Task can be started![/]")
                     console.print(f"  Run: backlog grab {task.id}")
-            elif task.status.value == "in_progress":
+            elif task.status is Status.IN_PROGRESS:
                 console.print(f"\n[yellow]Task is in progress[/]")
                 console.print(f"  Claimed by: {task.claimed_by}")
         else:
@@ -0,0 +1,119 @@
+"""Shared pytest configuration for the backlog test suite.
+
+The suite is safe to run in parallel with pytest-xdist::
+
+    pytest -n auto --dist=loadgroup
+
+Ungrouped tests are balanced one at a time, so many small independent
+tests in one module (``test_skills_command``) spread across all workers.
+Modules with expensive session fixtures carry an ``xdist_group`` marker
+instead, so each such fixture is built on a single worker.
+
+Every test already builds its fixture tree under ``tmp_path`` (unique per
+worker), so the only shared state left is the user's home directory, which
+global ``skills install`` targets and the on-disk tree cache resolve against.
+
+On Linux the temp root is moved onto tmpfs (``/dev/shm``) so fixture trees
+never touch the disk. Pass ``--basetemp`` explicitly to opt out.
+"""
+
+import getpass
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+SHM_DIR = "/dev/shm"
+
+
+def pytest_configure(config):
+    """Register markers and default basetemp to a memory-backed directory."""
+    # Declared here too so the suite stays warning-free without pytest-xdist.
+    config.addinivalue_line(
+        "markers", "xdist_group(name): keep tests on one xdist worker"
+    )
+    if hasattr(config, "workerinput") or config.option.basetemp:
+        return
+    if sys.platform == "linux" and os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK):
+        config.option.basetemp = os.path.join(SHM_DIR, f"backlog-tests-{getpass.getuser()}")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_home(tmp_path_factory, monkeypatch):
+    """Point HOME (and so the tree cache) at a per-worker temp dir."""
+    home = tmp_path_factory.getbasetemp() / "home"
+    home.mkdir(exist_ok=True)
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.delenv("CODEX_HOME", raising=False)
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.delenv("BACKLOG_DISK_CACHE", raising=False)
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Shared Click CLI test runner; invoke() keeps no state between calls."""
+    return CliRunner()
+
+
+FAST_COMMANDS = ("list", "tree", "idea", "grab", "bug", "set", "show", "move", "next")
+
+
+@pytest.fixture(scope="session")
+def cli():
+    """The root CLI group, imported on first use rather than at collection."""
+    from backlog.cli import cli
+
+    return cli
+
+
+@pytest.fixture(scope="session")
+def cli_commands(cli):
+    """Resolve the hot subcommands once per session."""
+    return {name: cli.get_command(None, name) for name in FAST_COMMANDS}
+
+
+@pytest.fixture(scope="session")
+def invoke_fast(runner, cli_commands):
+    """Invoke a pre-resolved subcommand, skipping group dispatch.
+
+    The root group callback does nothing when a subcommand runs, so this is
+    equivalent to ``runner.invoke(cli, [name, *args])`` for these commands.
+    """
+
+    def invoke(name, args=()):
+        return runner.invoke(cli_commands[name], list(args), prog_name=f"backlog {name}")
+
+    return invoke
+
+
+@pytest.fixture(scope="session")
+def _canonical_tasks_tree(tmp_path_factory):
+    """Build the minimal P1 > M1 > E1 ``.tasks`` skeleton once per session."""
+    tasks_dir = tmp_path_factory.mktemp("canonical") / ".tasks"
+    (tasks_dir / "01-phase" / "01-ms" / "01-epic").mkdir(parents=True)
+    (tasks_dir / "index.yaml").write_text(
+        "project: Skeleton\nphases:\n  - id: P1\n    name: Phase\n    path: 01-phase\n",
+        encoding="utf-8",
+    )
+    (tasks_dir / "01-phase" / "index.yaml").write_text(
+        "milestones:\n  - id: M1\n    name: Milestone\n    path: 01-ms\n",
+        encoding="utf-8",
+    )
+    (tasks_dir / "01-phase" / "01-ms" / "index.yaml").write_text(
+        "epics:\n  - id: E1\n    name: Epic\n    path: 01-epic\n",
+        encoding="utf-8",
+    )
+    return tasks_dir
+
+
+@pytest.fixture
+def tasks_skeleton(_canonical_tasks_tree, tmp_path):
+    """Copy the canonical skeleton to ``tmp_path/.tasks`` and return it.
+
+    The epic directory ``01-phase/01-ms/01-epic`` exists but has no index;
+    tests write the tasks they need.
+    """
+    return Path(shutil.copytree(_canonical_tasks_tree, tmp_path / ".tasks"))
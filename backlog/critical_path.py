@@ -1,10 +1,17 @@
 """Critical Chain Project Management (CCPM) critical path calculation."""
 
+from __future__ import annotations
+
+import hashlib
 import re
-import networkx as nx
-from typing import List, Dict, Tuple, Optional
+from typing import TYPE_CHECKING, List, Dict, Tuple, Optional
 from .models import TaskTree, Task, Epic, Milestone, Phase, Status
 
+if TYPE_CHECKING:
+    import networkx as nx
+
+    from ._cache import GraphResultCache
+
 
 class CriticalPathCalculator:
     """Calculate critical path using CCPM principles."""
@@ -22,9 +29,15 @@ class CriticalPathCalculator:
         "idea": 2,
     }
 
-    def __init__(self, tree: TaskTree, complexity_multipliers: Dict[str, float]):
+    def __init__(
+        self,
+        tree: TaskTree,
+        complexity_multipliers: Dict[str, float],
+        result_cache: Optional[GraphResultCache] = None,
+    ):
         self.tree = tree
         self.complexity_multipliers = complexity_multipliers
+        self.result_cache = result_cache
 
     def calculate(self, explicit_only: bool = False) -> Tuple[List[str], Optional[str]]:
         """
@@ -33,6 +46,13 @@ class CriticalPathCalculator:
         Returns:
             (critical_path, next_available_task_id)
         """
+        critical_path, next_task = self._cached_result(
+            f"calculate:{explicit_only}",
+            lambda: self._calculate(explicit_only),
+        )
+        return critical_path, next_task
+
+    def _calculate(self, explicit_only: bool) -> List:
         graph = self._build_graph(explicit_only=explicit_only)
 
         # Find longest path (critical path)
@@ -41,12 +61,60 @@ class CriticalPathCalculator:
         # Find next available task on critical path
         next_task = self._find_next_available(critical_path)
 
-        return critical_path, next_task
+        return [critical_path, next_task]
+
+    def _cached_result(self, name: str, compute):
+        """Return compute(), reusing result_cache's entry for unchanged trees.
+
+        Without a result_cache this is just compute(). With one, entries are
+        keyed by a digest of everything the graph code reads, so an unchanged
+        tree skips building the graph (and importing networkx).
+        """
+        if self.result_cache is None:
+            return compute()
+        digest = self._content_digest()
+        results = self.result_cache.load(digest)
+        if name in results:
+            return results[name]
+        value = compute()
+        self.result_cache.store(digest, name, value)
+        return value
+
+    def _content_digest(self) -> str:
+        """Hash every tree field that calculate() depends on, in tree order."""
+
+        def task_key(task: Task) -> tuple:
+            return (
+                task.id,
+                task.status.value,
+                task.estimate_hours,
+                task.complexity.value,
+                task.priority.value,
+                bool(task.claimed_by),
+                task.depends_on,
+                task.epic_id,
+                task.milestone_id,
+                task.phase_id,
+            )
+
+        parts = [sorted(self.complexity_multipliers.items())]
+        for phase in self.tree.phases:
+            parts.append(("P", phase.id, phase.depends_on))
+            for milestone in phase.milestones:
+                parts.append(("M", milestone.id, milestone.depends_on))
+                for epic in milestone.epics:
+                    parts.append(("E", epic.id, epic.depends_on))
+                    parts.extend(task_key(task) for task in epic.tasks)
+        parts.append("aux")
+        parts.extend(task_key(task) for task in self._iter_aux_tasks())
+        return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
 
     def find_cycle(self, explicit_only: bool = False) -> Optional[List[str]]:
         """Return the first cycle found in the requested dependency graph."""
-        graph = self._build_graph(explicit_only=explicit_only)
-        return self._find_first_cycle(graph)
+        return self._cached_result(
+            f"cycle:{explicit_only}",
+            lambda: self._find_first_cycle(self._build_graph(explicit_only=explicit_only)),
+        )
 
     def _build_graph(self, explicit_only: bool = False) -> nx.DiGraph:
         """Build the requested dependency graph."""
@@ -55,6 +123,9 @@ class CriticalPathCalculator:
         return self._build_full_dependency_graph()
 
     def _build_base_graph(self) -> nx.DiGraph:
+        # networkx is slow to import; only load it once a graph is needed.
+        import networkx as nx
+
         graph = nx.DiGraph()
         # Add all tasks as nodes
         for phase in self.tree.phases:
@@ -97,7 +168,7 @@ class CriticalPathCalculator:
     def _add_bug_node(self, graph: nx.DiGraph, bug: Task) -> None:
         """Add a bug as a weighted graph node."""
         multiplier = self.complexity_multipliers.get(bug.complexity.value, 1.0)
-        weight = 0 if bug.status == Status.DONE else bug.estimate_hours * multiplier
+        weight = 0 if bug.status is Status.DONE else bug.estimate_hours * multiplier
 
         graph.add_node(
             bug.id,
@@ -128,7 +199,7 @@ class CriticalPathCalculator:
                     )
 
                     # If task is done, weight is 0 (no remaining time)
-                    if task.status == Status.DONE:
+                    if task.status is Status.DONE:
                         weight = 0
                     else:
                         weight = task.estimate_hours * multiplier
@@ -210,6 +281,8 @@ class CriticalPathCalculator:
         if cycle:
             raise RuntimeError(f"task dependency cycle detected: {' -> '.join(cycle)}")
 
+        import networkx as nx
+
         try:
             # Use topological sort to order nodes
             topo_order = list(nx.topological_sort(graph))
@@ -403,7 +476,7 @@ class CriticalPathCalculator:
                 # Dependency not found - assume not satisfied
                 return False
 
-            if any(dep_task.status != Status.DONE for dep_task in dep_tasks):
+            if any(dep_task.status is not Status.DONE for dep_task in dep_tasks):
                 return False
 
         # Check implicit dependencies (previous task in epic)
@@ -415,7 +488,7 @@ class CriticalPathCalculator:
                 )
                 if task_index and task_index > 0:
                     prev_task = epic.tasks[task_index - 1]
-                    if prev_task.status != Status.DONE:
+                    if prev_task.status is not Status.DONE:
                         return False
 
         # Check phase-level dependencies
@@ -473,7 +546,7 @@ class CriticalPathCalculator:
 
     def _is_epic_complete(self, epic: Epic) -> bool:
         """Check if all tasks in an epic are complete."""
-        return all(task.status == Status.DONE for task in epic.tasks)
+        return all(task.status is Status.DONE for task in epic.tasks)
 
     def find_all_available(self) -> List[str]:
         """Find all tasks that are currently available (unblocked)."""
@@ -484,7 +557,7 @@ class CriticalPathCalculator:
                 for epic in milestone.epics:
                     for task in epic.tasks:
                         if (
-                            task.status == Status.PENDING
+                            task.status is Status.PENDING
                             and not task.claimed_by
                             and self._check_dependencies(task)
                         ):
@@ -492,7 +565,7 @@ class CriticalPathCalculator:
 
         for aux_task in self._iter_aux_tasks():
             if (
-                aux_task.status == Status.PENDING
+                aux_task.status is Status.PENDING
                 and not aux_task.claimed_by
                 and self._check_dependencies(aux_task)
             ):
@@ -535,7 +608,7 @@ class CriticalPathCalculator:
                 break
 
             # Must be pending and unclaimed
-            if task.status != Status.PENDING or task.claimed_by:
+            if task.status is not Status.PENDING or task.claimed_by:
                 continue
 
             # Check if dependencies are satisfied within batch context
@@ -567,7 +640,7 @@ class CriticalPathCalculator:
             if dep_tasks is None:
                 return False
             if any(
-                dep_task.status != Status.DONE and dep_task.id not in batch_task_ids
+                dep_task.status is not Status.DONE and dep_task.id not in batch_task_ids
                 for dep_task in dep_tasks
             ):
                 return False
@@ -582,7 +655,7 @@ class CriticalPathCalculator:
                 if task_index and task_index > 0:
                     prev_task = epic.tasks[task_index - 1]
                     if (
-                        prev_task.status != Status.DONE
+                        prev_task.status is not Status.DONE
                         and prev_task.id not in batch_task_ids
                     ):
                         return False
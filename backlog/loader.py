@@ -1,13 +1,16 @@
 """Load task tree from YAML files."""
 
+import copy
+import hashlib
 import os
 import re
 import shutil
 import yaml
 from pathlib import Path
 from datetime import datetime, timezone
-from time import perf_counter
-from typing import Dict, Any, Optional, Literal, Union
+from functools import lru_cache
+from time import perf_counter, time_ns
+from typing import Dict, Any, Optional, Literal, Union, get_args
 from .models import (
     TaskTree,
     Phase,
@@ -20,6 +23,107 @@ from .models import (
     TaskPath,
 )
 from .data_dir import get_data_dir, BACKLOG_DIR, TASKS_DIR
+from . import _cache
+from ._fsutil import _ensure_dir, _forget_dir
+from ._yaml import parse_events, safe_dump_bytes, safe_load
+from ._yaml_fast import dump_milestone_index
+
+# Parsed trees keyed by (data dir, load options) -> (signature, tree).
+_TREE_CACHE: Dict[tuple, tuple] = {}
+# Keys loaded before in this process; only repeat loads pay for a signature.
+_LOADED_KEYS: set = set()
+# Files modified this recently may share an mtime tick with a pending write,
+# so trees that include them are not cached (same idea as git's racy-clean).
+_RACY_WINDOW_NS = 20_000_000
+# Filesystems with whole-second timestamps (HFS+, FAT, some network mounts)
+# get a window covering their coarsest tick instead.
+_COARSE_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _racy_window_ns(mtime_ns: int) -> int:
+    """Return how long after mtime_ns a same-size rewrite may go unnoticed."""
+    if mtime_ns % 1_000_000_000 == 0:
+        return _COARSE_RACY_WINDOW_NS
+    return _RACY_WINDOW_NS
+
+
+def _is_racy(mtime_ns: int) -> bool:
+    """Whether stat fields with this mtime are too fresh to key a cache on."""
+    return time_ns() - mtime_ns <= _racy_window_ns(mtime_ns)
+
+
+# Legacy status spellings, after lowercasing and "-"/" " -> "_".
+_STATUS_ALIASES = {
+    "complete": "done",
+    "completed": "done",
+}
+# Exact spellings resolved without normalizing: the canonical values plus aliases.
+_STATUS_LOOKUP = {
+    **{status.value: status for status in Status},
+    **{alias: Status(value) for alias, value in _STATUS_ALIASES.items()},
+}
+
+# A "---" fence line; frontmatter is read in blocks until the closing one.
+_FENCE_RE = re.compile(rb"^[ \t]*---[ \t]*\r?$", re.MULTILINE)
+_FRONTMATTER_BLOCK = 8192
+
+
+def _read_frontmatter(filepath: Path) -> Optional[bytes]:
+    """Return the raw bytes between a .todo file's "---" fences.
+
+    Stops reading at the closing fence, so task bodies are neither read nor
+    decoded. Returns None when the file does not open with a fence; an
+    unterminated frontmatter runs to end of file.
+    """
+    with open(filepath, "rb") as f:
+        buf = f.read(_FRONTMATTER_BLOCK)
+        eof = len(buf) < _FRONTMATTER_BLOCK
+        while b"\n" not in buf and not eof:
+            block = f.read(_FRONTMATTER_BLOCK)
+            buf += block
+            eof = len(block) < _FRONTMATTER_BLOCK
+
+        if buf.startswith(b"\xef\xbb\xbf"):
+            buf = buf[3:]
+        opening = _FENCE_RE.match(buf)
+        if opening is None:
+            return None
+        start = opening.end() + 1
+        while True:
+            closing = _FENCE_RE.search(buf, start)
+            # A match at the very end of a partial read may be a longer line.
+            if closing is not None and (closing.end() < len(buf) or eof):
+                return buf[start:closing.start()]
+            if eof:
+                return buf[start:]
+            block = f.read(_FRONTMATTER_BLOCK)
+            buf += block
+            eof = len(block) < _FRONTMATTER_BLOCK
+
+
+# Parsed YAML files keyed by path -> ((mtime_ns, size, inode), data).
+_YAML_CACHE: Dict[str, tuple] = {}
+
+
+def _parse_yaml_file(path: str, stamp: tuple) -> Any:
+    """Parse a YAML file, reusing the last parse while its stat stamp matches."""
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with open(path, "rb") as f:
+        data = safe_load(f)
+    _YAML_CACHE[path] = (stamp, data)
+    return data
+
+
+@lru_cache(maxsize=1024)
+def _parse_yaml_bytes(data: bytes) -> Any:
+    """Parse YAML content, keyed on the bytes themselves.
+
+    Used for files modified too recently for their stat fields to be
+    trusted; rewrites that leave the content unchanged still hit.
+    """
+    return safe_load(data)
 
 
 class TaskLoader:
@@ -84,13 +188,12 @@ class TaskLoader:
         path: Path,
         elapsed_ms: float,
     ) -> None:
-        benchmark["files"]["total"] += 1
-        benchmark["files"]["by_type"][file_type] = (
-            benchmark["files"]["by_type"].get(file_type, 0) + 1
-        )
-        benchmark["files"]["by_type_ms"][file_type] = (
-            benchmark["files"]["by_type_ms"].get(file_type, 0.0) + elapsed_ms
-        )
+        files = benchmark["files"]
+        files["total"] += 1
+        by_type = files["by_type"]
+        by_type[file_type] = by_type.get(file_type, 0) + 1
+        by_type_ms = files["by_type_ms"]
+        by_type_ms[file_type] = by_type_ms.get(file_type, 0.0) + elapsed_ms
         if file_type.endswith("_index"):
             benchmark["index_parse_ms"] += elapsed_ms
 
@@ -106,13 +209,118 @@ class TaskLoader:
         include_bugs: bool = True,
         include_ideas: bool = True,
     ) -> TaskTree:
-        """Load complete task tree."""
-        return self._load_tree(
-            mode=mode,
-            include_bugs=include_bugs,
-            include_ideas=include_ideas,
+        """Load complete task tree.
+
+        Results are memoized per data dir, in memory and, when
+        BACKLOG_DISK_CACHE is set, in the user cache dir. They are reused
+        until any index or task file changes; callers always receive their
+        own copy of the tree. Without the disk cache, the first load of a
+        data dir in a process is not memoized, so one-shot commands skip
+        the stat walk.
+        """
+        key = (str(self.tasks_dir.resolve()), mode, include_bugs, include_ideas)
+        signature = None
+        if key in _LOADED_KEYS or _cache.enabled():
+            signature = self._tree_signature()
+        else:
+            _LOADED_KEYS.add(key)
+        if signature is None:
+            return self._load_tree(
+                mode=mode,
+                include_bugs=include_bugs,
+                include_ideas=include_ideas,
+            )
+        cached = _TREE_CACHE.get(key)
+        if cached is not None and cached[0] == signature:
+            return copy.deepcopy(cached[1])
+
+        cacheable = not _is_racy(signature[1])
+        use_disk = cacheable and _cache.enabled()
+        tree = _cache.load_tree(key, signature) if use_disk else None
+        if tree is None:
+            tree = self._load_tree(
+                mode=mode,
+                include_bugs=include_bugs,
+                include_ideas=include_ideas,
+            )
+            if use_disk:
+                _cache.store_tree(key, signature, tree)
+        if cacheable:
+            _TREE_CACHE[key] = (signature, copy.deepcopy(tree))
+        else:
+            _TREE_CACHE.pop(key, None)
+        return tree
+
+    def _forget_written(self, path: Path) -> None:
+        """Drop memoized trees and path's parsed YAML before the loader changes path.
+
+        Stat-based keys cannot see a same-size rewrite within one timestamp
+        tick, so the loader's own writes invalidate explicitly, both in
+        memory and in the user cache dir.
+        """
+        _YAML_CACHE.pop(os.path.abspath(path), None)
+        _TREE_CACHE.clear()
+        if not _cache.enabled():
+            return
+        data_dir = str(self.tasks_dir.resolve())
+        _cache.forget_trees(
+            (data_dir, mode, include_bugs, include_ideas)
+            for mode in get_args(self.LoadMode)
+            for include_bugs in (True, False)
+            for include_ideas in (True, False)
         )
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all memoized task trees and parsed YAML files."""
+        _TREE_CACHE.clear()
+        _LOADED_KEYS.clear()
+        _YAML_CACHE.clear()
+        _parse_yaml_bytes.cache_clear()
+
+    def _tree_signature(self) -> Optional[tuple]:
+        """Return (digest of per-entry stat fields, newest mtime_ns) for the data dir.
+
+        Each directory, index and task file contributes its path, mtime_ns,
+        size and inode, so any single-file change alters the digest. Returns
+        None when the data dir contains a symlink: changes behind it would
+        not show up in the digest, so such trees are never cached.
+        """
+        root_stat = os.stat(self.tasks_dir)
+        newest = root_stat.st_mtime_ns
+        h = hashlib.blake2b(digest_size=16)
+        h.update(repr((root_stat.st_mtime_ns, root_stat.st_size, root_stat.st_ino)).encode())
+        for entry in self._scan_data_dir():
+            if entry.is_symlink():
+                return None
+            if not entry.is_dir(follow_symlinks=False) and not entry.name.endswith(
+                (".yaml", ".todo")
+            ):
+                continue
+            st = entry.stat()
+            h.update(
+                f"{entry.path}\0{st.st_mtime_ns}\0{st.st_size}\0{st.st_ino}\n".encode(
+                    "utf-8", "surrogateescape"
+                )
+            )
+            if st.st_mtime_ns > newest:
+                newest = st.st_mtime_ns
+        return (h.hexdigest(), newest)
+
+    def _scan_data_dir(self):
+        """Yield every directory and file entry below the data dir.
+
+        A single os.scandir DFS; DirEntry caches type info, so callers can
+        filter without extra stat calls.
+        """
+        stack = [str(self.tasks_dir)]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    yield entry
+
     def load_with_benchmark(
         self,
         mode: "TaskLoader.LoadMode" = "full",
@@ -156,7 +364,7 @@ class TaskLoader:
             project=root_index["project"],
             description=root_index.get("description", ""),
             timeline_weeks=root_index.get("timeline_weeks", 0),
-            critical_path=root_index.get("critical_path", []),
+            critical_path=list(root_index.get("critical_path", [])),
             next_available=root_index.get("next_available"),
         )
 
@@ -277,7 +485,7 @@ class TaskLoader:
                 project=root_index["project"],
                 description=root_index.get("description", ""),
                 timeline_weeks=root_index.get("timeline_weeks", 0),
-                critical_path=root_index.get("critical_path", []),
+                critical_path=list(root_index.get("critical_path", [])),
                 next_available=root_index.get("next_available"),
             )
 
@@ -332,13 +540,11 @@ class TaskLoader:
             return value
 
         if isinstance(value, str):
+            status = _STATUS_LOOKUP.get(value)
+            if status is not None:
+                return status
             normalized = value.strip().lower().replace("-", "_").replace(" ", "_")
-            aliases = {
-                "complete": "done",
-                "completed": "done",
-            }
-            normalized = aliases.get(normalized, normalized)
-            return Status(normalized)
+            return Status(_STATUS_ALIASES.get(normalized, normalized))
 
         return Status(str(value))
 
@@ -370,7 +576,7 @@ class TaskLoader:
                     weeks=phase_data.get("weeks", 0),
                     estimate_hours=self._get_estimate_hours(phase_data, 0.0),
                     priority=Priority(phase_data.get("priority", "medium")),
-                    depends_on=phase_data.get("depends_on", []),
+                    depends_on=list(phase_data.get("depends_on", [])),
                     description=phase_data.get("description"),
                     locked=bool(phase_data.get("locked", False)),
                 )
@@ -397,7 +603,7 @@ class TaskLoader:
                 weeks=phase_data.get("weeks", 0),
                 estimate_hours=self._get_estimate_hours(phase_data, 0.0),
                 priority=Priority(phase_data.get("priority", "medium")),
-                depends_on=phase_data.get("depends_on", []),
+                depends_on=list(phase_data.get("depends_on", [])),
                 description=phase_data.get("description"),
                 locked=bool(phase_data.get("locked", phase_index.get("locked", False))),
             )
@@ -483,7 +689,7 @@ class TaskLoader:
                 status=self._coerce_status(milestone_data.get("status", "pending")),
                 estimate_hours=self._get_estimate_hours(milestone_data, 0.0),
                 complexity=Complexity(milestone_data.get("complexity", "medium")),
-                depends_on=milestone_data.get("depends_on", []),
+                depends_on=list(milestone_data.get("depends_on", [])),
                 description=milestone_data.get("description"),
                 phase_id=phase_id,
                 locked=bool(
@@ -564,8 +770,12 @@ class TaskLoader:
         # Build fully qualified epic ID using TaskPath
         epic_path = ms_path.with_epic(epic_data["id"])
 
+        # One directory read answers every existence check for this epic
+        present_files = self._list_files(epic_file_path)
+        epic_rel_dir = os.fspath(epic_file_path.relative_to(self.tasks_dir))
+
         # Load epic index (may not exist if not yet populated)
-        if (epic_file_path / "index.yaml").exists():
+        if "index.yaml" in present_files:
             epic_index = self._load_yaml(
                 epic_file_path / "index.yaml",
                 benchmark=benchmark,
@@ -581,7 +791,7 @@ class TaskLoader:
             status=self._coerce_status(epic_data.get("status", "pending")),
             estimate_hours=self._get_estimate_hours(epic_data, 0.0),
             complexity=Complexity(epic_data.get("complexity", "medium")),
-            depends_on=epic_data.get("depends_on", []),
+            depends_on=list(epic_data.get("depends_on", [])),
             description=epic_data.get("description"),
             milestone_id=ms_path.full_id,  # Fully qualified: "P1.M1"
             phase_id=ms_path.phase,
@@ -589,20 +799,31 @@ class TaskLoader:
         )
 
         # Load tasks
-        for task_data in epic_index.get("tasks", []):
-            if task_filter and not self._task_matches_filter(task_data, epic_path, task_filter):
-                continue
-            task = self._load_task(
+        task_entries = epic_index.get("tasks", [])
+
+        def load_task(task_data):
+            return self._load_task(
                 epic_file_path,
                 task_data,
                 epic_path,
                 benchmark=benchmark,
                 load_mode=load_mode,
                 parse_task_body=parse_task_body,
+                present_files=present_files,
+                epic_rel_dir=epic_rel_dir,
             )
-            epic.tasks.append(task)
-            if task_filter and self._ids_match(task.id, task_filter):
-                break
+
+        if task_filter:
+            for task_data in task_entries:
+                if not self._task_matches_filter(task_data, epic_path, task_filter):
+                    continue
+                task = load_task(task_data)
+                epic.tasks.append(task)
+                if self._ids_match(task.id, task_filter):
+                    break
+        else:
+            # Unfiltered: the index gives the full list, built in one pass
+            epic.tasks = [load_task(task_data) for task_data in task_entries]
 
         if benchmark is not None:
             self._record_timing(
@@ -621,6 +842,15 @@ class TaskLoader:
             return True
         return candidate.endswith(f".{target}") or target.endswith(f".{candidate}")
 
+    @staticmethod
+    def _list_files(directory: Path) -> set:
+        """Return the names of regular files directly inside directory."""
+        try:
+            with os.scandir(directory) as it:
+                return {entry.name for entry in it if entry.is_file(follow_symlinks=False)}
+        except (FileNotFoundError, NotADirectoryError):
+            return set()
+
     @staticmethod
     def _task_matches_filter(
         task_data: Dict[str, Any] | str, epic_path: TaskPath, task_filter: str
@@ -657,8 +887,16 @@ class TaskLoader:
         benchmark: Optional[Dict[str, Any]] = None,
         load_mode: "TaskLoader.LoadMode" = "full",
         parse_task_body: bool = True,
+        present_files: Optional[set] = None,
+        epic_rel_dir: Optional[str] = None,
     ) -> Task:
-        """Load a task from its .todo file."""
+        """Load a task from its .todo file.
+
+        present_files, when given, holds the epic directory's file names and
+        saves a stat per task; names not in it (nested paths, symlinks) are
+        still checked on disk. epic_rel_dir is epic_file_path relative to
+        the data dir; callers loading many tasks pass it to skip recomputing.
+        """
         # Handle both formats: dict with metadata or simple string filename
         if isinstance(task_data, str):
             # Simple format: just a filename
@@ -680,7 +918,10 @@ class TaskLoader:
                 f"Task data missing 'file' or 'path' key. Task data: {task_data}"
             )
 
-        task_file = epic_file_path / filename
+        # Plain strings: one join per task instead of Path objects
+        if epic_rel_dir is None:
+            epic_rel_dir = os.fspath(epic_file_path.relative_to(self.tasks_dir))
+        task_file = os.path.join(epic_file_path, filename)
         parse_ms = 0.0
         parse_start = perf_counter() if benchmark is not None else None
 
@@ -688,7 +929,7 @@ class TaskLoader:
         if load_mode == "index":
             if isinstance(task_data, dict):
                 frontmatter = dict(task_data)
-        elif task_file.exists():
+        elif (present_files is not None and filename in present_files) or os.path.exists(task_file):
             if load_mode == "full":
                 frontmatter, _ = self._parse_todo_file(
                     task_file,
@@ -749,14 +990,14 @@ class TaskLoader:
             benchmark["counts"]["tasks"] += 1
             self._record_timing(
                 benchmark["task_timings"],
-                {"id": task_id, "path": task_file.as_posix(), "epic_id": epic_path.full_id},
+                {"id": task_id, "path": task_file.replace(os.sep, "/"), "epic_id": epic_path.full_id},
                 parse_ms,
             )
 
         task = Task(
             id=task_id,
             title=title,
-            file=str(task_file.relative_to(self.tasks_dir)),
+            file=os.path.join(epic_rel_dir, filename),
             status=self._coerce_status(status),
             estimate_hours=float(estimate_hours),
             complexity=Complexity(complexity),
@@ -782,19 +1023,32 @@ class TaskLoader:
         benchmark: Optional[Dict[str, Any]] = None,
         file_type: str = "yaml",
     ) -> Dict[str, Any]:
-        """Load YAML file."""
+        """Load YAML file.
+
+        Parses are cached by (path, mtime, size, inode), so unchanged files
+        are not re-read; files inside the racy window are cached by content
+        instead, and the loader's own writes drop the path's entry. The
+        result is shared with the cache and must be treated as read-only;
+        use _load_yaml_for_update to change and write back a file.
+        """
         start = perf_counter()
         try:
-            with open(filepath, "r") as f:
-                data = yaml.safe_load(f)
-                if data is None:
-                    raise ValueError(f"YAML file is empty or invalid: {filepath}")
-                if not isinstance(data, dict):
-                    raise ValueError(
-                        f"YAML file does not contain a dictionary. "
-                        f"Got {type(data).__name__}: {filepath}"
-                    )
-                return data
+            st = os.stat(filepath)
+            if not _is_racy(st.st_mtime_ns):
+                data = _parse_yaml_file(
+                    os.path.abspath(filepath), (st.st_mtime_ns, st.st_size, st.st_ino)
+                )
+            else:
+                with open(filepath, "rb") as f:
+                    data = _parse_yaml_bytes(f.read())
+            if data is None:
+                raise ValueError(f"YAML file is empty or invalid: {filepath}")
+            if not isinstance(data, dict):
+                raise ValueError(
+                    f"YAML file does not contain a dictionary. "
+                    f"Got {type(data).__name__}: {filepath}"
+                )
+            return data
         except yaml.YAMLError as e:
             raise RuntimeError(f"YAML parsing error in {filepath}: {str(e)}") from e
         except FileNotFoundError:
@@ -805,6 +1059,10 @@ class TaskLoader:
             if benchmark is not None:
                 self._record_file(benchmark, file_type, filepath, (perf_counter() - start) * 1000)
 
+    def _load_yaml_for_update(self, filepath: Path) -> Dict[str, Any]:
+        """Load a YAML file as a private copy the caller may modify."""
+        return copy.deepcopy(self._load_yaml(filepath))
+
     def _parse_todo_file(
         self,
         filepath: Path,
@@ -827,7 +1085,7 @@ class TaskLoader:
             if len(parts) >= 3:
                 frontmatter_str = parts[1]
                 frontmatter_parse_start = perf_counter()
-                frontmatter = yaml.safe_load(frontmatter_str) or {}
+                frontmatter = safe_load(frontmatter_str) or {}
                 frontmatter_parse_ms = (perf_counter() - frontmatter_parse_start) * 1000
 
                 body_start = perf_counter()
@@ -837,21 +1095,12 @@ class TaskLoader:
             else:
                 result = ({}, content)
         else:
-            with open(filepath, "r") as f:
-                first_line = f.readline()
-                if first_line.replace("\ufeff", "").strip() != "---":
-                    result = ({}, "")
-                else:
-                    lines = []
-                    for line in f:
-                        if line.strip() == "---":
-                            break
-                        lines.append(line)
-                    if lines:
-                        frontmatter_parse_start = perf_counter()
-                        frontmatter = yaml.safe_load("".join(lines)) or {}
-                        frontmatter_parse_ms = (perf_counter() - frontmatter_parse_start) * 1000
-                    result = (frontmatter, "")
+            raw = _read_frontmatter(filepath)
+            if raw:
+                frontmatter_parse_start = perf_counter()
+                frontmatter = safe_load(raw) or {}
+                frontmatter_parse_ms = (perf_counter() - frontmatter_parse_start) * 1000
+            result = (frontmatter, "")
 
         if benchmark is not None:
             self._record_file(benchmark, file_type, filepath, (perf_counter() - start) * 1000)
@@ -871,21 +1120,11 @@ class TaskLoader:
         frontmatter_parse_ms = 0.0
 
         try:
-            with open(filepath, "r") as f:
-                first_line = f.readline()
-                if first_line.replace("\ufeff", "").strip() != "---":
-                    return {}
-
-                lines = []
-                for line in f:
-                    if line.strip() == "---":
-                        break
-                    lines.append(line)
-
-                if lines:
-                    parse_start = perf_counter()
-                    frontmatter = yaml.safe_load("".join(lines)) or {}
-                    frontmatter_parse_ms = (perf_counter() - parse_start) * 1000
+            raw = _read_frontmatter(filepath)
+            if raw:
+                parse_start = perf_counter()
+                frontmatter = safe_load(raw) or {}
+                frontmatter_parse_ms = (perf_counter() - parse_start) * 1000
         finally:
             if benchmark is not None:
                 self._record_file(
@@ -979,23 +1218,19 @@ class TaskLoader:
                     body = existing_body + "\n\n" + body
 
         # Write back
-        with open(task_file, "w") as f:
-            f.write("---\n")
-            yaml.dump(frontmatter, f, default_flow_style=False, sort_keys=False)
-            f.write("---\n")
-            f.write(body)
-
-    def save_stats(self, tree: TaskTree) -> None:
-        """Update statistics in index files."""
+        self._write_todo_file(task_file, frontmatter, body)
+
+    def save_stats(self, tree: TaskTree) -> Dict[str, Any]:
+        """Update statistics in index files and return the root stats."""
         # Update root index
         root_index_path = self.tasks_dir / "index.yaml"
-        root_index = self._load_yaml(root_index_path)
-        root_index["stats"] = tree.stats
+        root_index = self._load_yaml_for_update(root_index_path)
+        stats = tree.stats
+        root_index["stats"] = stats
         root_index["critical_path"] = tree.critical_path
         root_index["next_available"] = tree.next_available
 
-        with open(root_index_path, "w") as f:
-            yaml.dump(root_index, f, default_flow_style=False, sort_keys=False)
+        self._write_yaml(root_index_path, root_index)
 
         # Update phase indices
         for phase in tree.phases:
@@ -1005,11 +1240,10 @@ class TaskLoader:
             if not phase_index_path.exists():
                 continue
 
-            phase_index = self._load_yaml(phase_index_path)
+            phase_index = self._load_yaml_for_update(phase_index_path)
             phase_index["stats"] = phase.stats
 
-            with open(phase_index_path, "w") as f:
-                yaml.dump(phase_index, f, default_flow_style=False, sort_keys=False)
+            self._write_yaml(phase_index_path, phase_index)
 
             # Update milestone indices
             for milestone in phase.milestones:
@@ -1017,15 +1251,9 @@ class TaskLoader:
                     self.tasks_dir / phase.path / milestone.path / "index.yaml"
                 )
                 if milestone_index_path.exists():
-                    milestone_index = self._load_yaml(milestone_index_path)
+                    milestone_index = self._load_yaml_for_update(milestone_index_path)
                     milestone_index["stats"] = milestone.stats
-                    with open(milestone_index_path, "w") as f:
-                        yaml.dump(
-                            milestone_index,
-                            f,
-                            default_flow_style=False,
-                            sort_keys=False,
-                        )
+                    self._write_yaml(milestone_index_path, milestone_index)
 
                 # Update epic indices
                 for epic in milestone.epics:
@@ -1038,15 +1266,11 @@ class TaskLoader:
                     )
                     if not epic_index_path.exists():
                         continue
-                    epic_index = self._load_yaml(epic_index_path)
+                    epic_index = self._load_yaml_for_update(epic_index_path)
                     epic_index["stats"] = epic.stats
-                    with open(epic_index_path, "w") as f:
-                        yaml.dump(
-                            epic_index,
-                            f,
-                            default_flow_style=False,
-                            sort_keys=False,
-                        )
+                    self._write_yaml(epic_index_path, epic_index)
+
+        return stats
 
     def _load_bugs(
         self,
@@ -1207,7 +1431,7 @@ class TaskLoader:
     def create_fixed(self, fixed_data: dict) -> Task:
         """Create a completed ad-hoc fix note."""
         fixes_dir = self.tasks_dir / "fixes"
-        fixes_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(fixes_dir)
         index_path = fixes_dir / "index.yaml"
 
         raw_at = fixed_data.get("at")
@@ -1222,11 +1446,11 @@ class TaskLoader:
 
         month_dir_name = created_at.strftime("%Y-%m")
         month_dir = fixes_dir / month_dir_name
-        month_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(month_dir)
 
         next_num = 1
         if index_path.exists():
-            idx = self._load_yaml(index_path)
+            idx = self._load_yaml_for_update(index_path)
             existing = idx.get("fixes", [])
             nums = []
             for entry in existing:
@@ -1265,22 +1489,17 @@ class TaskLoader:
             "completed_at": created_at.isoformat(),
         }
 
-        with open(file_path, "w") as f:
-            f.write("---\n")
-            yaml.dump(frontmatter, f, default_flow_style=False, sort_keys=False)
-            f.write("---\n")
-            f.write(body)
+        self._write_todo_file(file_path, frontmatter, body)
 
         if index_path.exists():
-            idx = self._load_yaml(index_path)
+            idx = self._load_yaml_for_update(index_path)
         else:
             idx = {"fixes": []}
 
         fixes_list = idx.get("fixes", [])
         fixes_list.append({"id": fixed_id, "file": f"{month_dir_name}/{filename}"})
         idx["fixes"] = fixes_list
-        with open(index_path, "w") as f:
-            yaml.dump(idx, f, default_flow_style=False, sort_keys=False)
+        self._write_yaml(index_path, idx)
 
         return Task(
             id=fixed_id,
@@ -1309,13 +1528,13 @@ class TaskLoader:
             The created Task object
         """
         bugs_dir = self.tasks_dir / "bugs"
-        bugs_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(bugs_dir)
         index_path = bugs_dir / "index.yaml"
 
         # Determine next bug number
         next_num = 1
         if index_path.exists():
-            idx = self._load_yaml(index_path)
+            idx = self._load_yaml_for_update(index_path)
             existing = idx.get("bugs", [])
             nums = []
             for entry in existing:
@@ -1363,22 +1582,17 @@ TODO: Describe expected behavior
 TODO: Describe actual behavior
 """
 
-        with open(file_path, "w") as f:
-            f.write("---\n")
-            yaml.dump(frontmatter, f, default_flow_style=False, sort_keys=False)
-            f.write("---\n")
-            f.write(body)
+        self._write_todo_file(file_path, frontmatter, body)
 
         # Update bugs index
         if index_path.exists():
-            idx = self._load_yaml(index_path)
+            idx = self._load_yaml_for_update(index_path)
         else:
             idx = {"bugs": []}
         bugs_list = idx.get("bugs", [])
         bugs_list.append({"file": filename})
         idx["bugs"] = bugs_list
-        with open(index_path, "w") as f:
-            yaml.dump(idx, f, default_flow_style=False, sort_keys=False)
+        self._write_yaml(index_path, idx)
 
         return Task(
             id=bug_id,
@@ -1398,13 +1612,13 @@ TODO: Describe actual behavior
     def create_idea(self, idea_data: dict) -> Task:
         """Create a new idea intake item for later planning and ingestion."""
         ideas_dir = self.tasks_dir / "ideas"
-        ideas_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(ideas_dir)
         index_path = ideas_dir / "index.yaml"
 
         # Determine next idea number
         next_num = 1
         if index_path.exists():
-            idx = self._load_yaml(index_path)
+            idx = self._load_yaml_for_update(index_path)
             existing = idx.get("ideas", [])
             nums = []
             for entry in existing:
@@ -1469,14 +1683,10 @@ TODO: Describe actual behavior
 - This idea intake is updated with created IDs and marked done.
 """
 
-        with open(file_path, "w") as f:
-            f.write("---\n")
-            yaml.dump(frontmatter, f, default_flow_style=False, sort_keys=False)
-            f.write("---\n")
-            f.write(rendered_body)
+        self._write_todo_file(file_path, frontmatter, rendered_body)
 
         if index_path.exists():
-            idx = self._load_yaml(index_path)
+            idx = self._load_yaml_for_update(index_path)
         else:
             idx = {"ideas": []}
 
@@ -1484,8 +1694,7 @@ TODO: Describe actual behavior
         ideas_list.append({"id": idea_id, "file": filename})
         idx["ideas"] = ideas_list
 
-        with open(index_path, "w") as f:
-            yaml.dump(idx, f, default_flow_style=False, sort_keys=False)
+        self._write_yaml(index_path, idx)
 
         return Task(
             id=idea_id,
@@ -1591,11 +1800,7 @@ TODO: Describe actual behavior
 """
 
         # Write .todo file
-        with open(task_file, "w") as f:
-            f.write("---\n")
-            yaml.dump(frontmatter, f, default_flow_style=False, sort_keys=False)
-            f.write("---\n")
-            f.write(body)
+        self._write_todo_file(task_file, frontmatter, body)
 
         # Update epic index.yaml to include the new task
         self._add_task_to_epic_index(epic_dir, task_short_id, filename, task_data)
@@ -1668,7 +1873,7 @@ TODO: Describe actual behavior
         epic_dir = milestone_dir / dir_name
 
         # Create epic directory
-        epic_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(epic_dir)
 
         # Create epic index.yaml
         epic_index = {
@@ -1691,10 +1896,12 @@ TODO: Describe actual behavior
 
         # Add description as a comment at the top
         epic_index_path = epic_dir / "index.yaml"
-        with open(epic_index_path, "w") as f:
-            f.write(f"# Epic: {epic_data['name']}\n")
-            f.write(f"# {milestone_id}, Epic {next_num} ({full_epic_id})\n\n")
-            yaml.dump(epic_index, f, default_flow_style=False, sort_keys=False)
+        self._write_yaml(
+            epic_index_path,
+            epic_index,
+            header=f"# Epic: {epic_data['name']}\n"
+            f"# {milestone_id}, Epic {next_num} ({full_epic_id})\n\n",
+        )
 
         # Update milestone index.yaml to include the new epic
         self._add_epic_to_milestone_index(
@@ -1765,7 +1972,7 @@ TODO: Describe actual behavior
         milestone_dir = phase_dir / dir_name
 
         # Create milestone directory
-        milestone_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(milestone_dir)
 
         # Create milestone index.yaml
         milestone_index = {
@@ -1787,10 +1994,14 @@ TODO: Describe actual behavior
         }
 
         milestone_index_path = milestone_dir / "index.yaml"
-        with open(milestone_index_path, "w") as f:
-            f.write(f"# Milestone: {milestone_data['name']}\n")
-            f.write(f"# {phase_id}, Milestone {next_num} ({full_milestone_id})\n\n")
-            yaml.dump(milestone_index, f, default_flow_style=False, sort_keys=False)
+        self._forget_written(milestone_index_path)
+        milestone_index_path.write_bytes(
+            (
+                f"# Milestone: {milestone_data['name']}\n"
+                f"# {phase_id}, Milestone {next_num} ({full_milestone_id})\n\n"
+                + dump_milestone_index(milestone_index)
+            ).encode("utf-8")
+        )
 
         # Update phase index.yaml
         self._add_milestone_to_phase_index(
@@ -1845,7 +2056,7 @@ TODO: Describe actual behavior
             raise ValueError(f"Phase directory already exists: {dir_name}")
 
         # Create phase directory
-        phase_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(phase_dir)
 
         # Create phase index.yaml
         phase_index = {
@@ -1868,10 +2079,12 @@ TODO: Describe actual behavior
         }
 
         phase_index_path = phase_dir / "index.yaml"
-        with open(phase_index_path, "w") as f:
-            f.write(f"# Phase: {phase_data['name']}\n")
-            f.write(f"# Phase {next_num} ({phase_id})\n\n")
-            yaml.dump(phase_index, f, default_flow_style=False, sort_keys=False)
+        self._write_yaml(
+            phase_index_path,
+            phase_index,
+            header=f"# Phase: {phase_data['name']}\n"
+            f"# Phase {next_num} ({phase_id})\n\n",
+        )
 
         # Update root index.yaml
         self._add_phase_to_root_index(phase_id, dir_name, phase_data)
@@ -1929,6 +2142,49 @@ TODO: Describe actual behavior
 
         return self.tasks_dir / phase.path / milestone.path
 
+    def _scan_index_ids(self, index_path: Path, key: str) -> list[str]:
+        """Return the id of every entry in an index file's top-level key list.
+
+        Walks the YAML event stream rather than building the document, so
+        descriptions, stats and other entry fields are never constructed.
+        """
+        ids: list[str] = []
+        # One frame per open collection: [is_mapping, next_node_is_key, last_key]
+        stack: list[list] = []
+        try:
+            with open(index_path, "rb") as f:
+                for event in parse_events(f):
+                    is_start = isinstance(
+                        event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)
+                    )
+                    if is_start or isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent)):
+                        top = stack[-1] if stack else None
+                        if top is not None and top[0]:
+                            if top[1]:
+                                top[1] = False
+                                top[2] = (
+                                    event.value if isinstance(event, yaml.ScalarEvent) else None
+                                )
+                            else:
+                                top[1] = True
+                                if (
+                                    len(stack) == 3
+                                    and top[2] == "id"
+                                    and isinstance(event, yaml.ScalarEvent)
+                                    and stack[0][2] == key
+                                    and not stack[1][0]
+                                ):
+                                    ids.append(event.value)
+                        if is_start:
+                            stack.append(
+                                [isinstance(event, yaml.MappingStartEvent), True, None]
+                            )
+                    elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                        stack.pop()
+        except yaml.YAMLError as e:
+            raise RuntimeError(f"YAML parsing error in {index_path}: {str(e)}") from e
+        return ids
+
     def _get_next_task_number(self, epic_dir: Path) -> int:
         """Get the next task number for an epic."""
         existing_tasks = list(epic_dir.glob("T*.todo"))
@@ -1952,14 +2208,8 @@ TODO: Describe actual behavior
         if not index_path.exists():
             return 1
 
-        index = self._load_yaml(index_path)
-        epics = index.get("epics", [])
-        if not epics:
-            return 1
-
         max_num = 0
-        for epic in epics:
-            epic_id = epic.get("id", "")
+        for epic_id in self._scan_index_ids(index_path, "epics"):
             match = re.search(r"(?:^|\.)E(\d+)$", epic_id)
             if match:
                 num = int(match.group(1))
@@ -1982,14 +2232,8 @@ TODO: Describe actual behavior
         if not index_path.exists():
             return 1
 
-        index = self._load_yaml(index_path)
-        milestones = index.get("milestones", [])
-        if not milestones:
-            return 1
-
         max_num = 0
-        for milestone in milestones:
-            milestone_id = milestone.get("id", "")
+        for milestone_id in self._scan_index_ids(index_path, "milestones"):
             match = re.search(r"(?:^|\.)M(\d+)$", milestone_id)
             if match:
                 num = int(match.group(1))
@@ -2004,14 +2248,8 @@ TODO: Describe actual behavior
         if not root_index_path.exists():
             return 1
 
-        index = self._load_yaml(root_index_path)
-        phases = index.get("phases", [])
-        if not phases:
-            return 1
-
         max_num = 0
-        for phase in phases:
-            phase_id = phase.get("id", "")
+        for phase_id in self._scan_index_ids(root_index_path, "phases"):
             match = re.match(r"P(\d+)", phase_id)
             if match:
                 num = int(match.group(1))
@@ -2033,7 +2271,7 @@ TODO: Describe actual behavior
         if not index_path.exists():
             raise ValueError(f"Phase index not found: {index_path}")
 
-        index = self._load_yaml(index_path)
+        index = self._load_yaml_for_update(index_path)
 
         milestone_entry = {
             "id": milestone_short_id,
@@ -2051,8 +2289,7 @@ TODO: Describe actual behavior
             index["milestones"] = []
         index["milestones"].append(milestone_entry)
 
-        with open(index_path, "w") as f:
-            yaml.dump(index, f, default_flow_style=False, sort_keys=False)
+        self._write_yaml(index_path, index)
 
     def _add_phase_to_root_index(
         self, phase_id: str, dir_name: str, phase_data: dict
@@ -2063,7 +2300,7 @@ TODO: Describe actual behavior
         if not root_index_path.exists():
             raise ValueError(f"Root index not found: {root_index_path}")
 
-        index = self._load_yaml(root_index_path)
+        index = self._load_yaml_for_update(root_index_path)
 
         phase_entry = {
             "id": phase_id,
@@ -2082,8 +2319,7 @@ TODO: Describe actual behavior
             index["phases"] = []
         index["phases"].append(phase_entry)
 
-        with open(root_index_path, "w") as f:
-            yaml.dump(index, f, default_flow_style=False, sort_keys=False)
+        self._write_yaml(root_index_path, index)
 
     def _slugify(self, text: str, max_length: int = 30) -> str:
         """Convert text to a slug for filenames."""
@@ -2121,7 +2357,7 @@ TODO: Describe actual behavior
         index_path = epic_dir / "index.yaml"
 
         if index_path.exists():
-            index = self._load_yaml(index_path)
+            index = self._load_yaml_for_update(index_path)
         else:
             # Create minimal epic index if it doesn't exist
             index = {"tasks": [], "stats": {}}
@@ -2150,8 +2386,7 @@ TODO: Describe actual behavior
         stats["pending"] = stats.get("pending", 0) + 1
 
         # Write back
-        with open(index_path, "w") as f:
-            yaml.dump(index, f, default_flow_style=False, sort_keys=False)
+        self._write_yaml(index_path, index)
 
     def _add_epic_to_milestone_index(
         self, milestone_dir: Path, epic_short_id: str, dir_name: str, epic_data: dict
@@ -2162,7 +2397,7 @@ TODO: Describe actual behavior
         if not index_path.exists():
             raise ValueError(f"Milestone index not found: {index_path}")
 
-        index = self._load_yaml(index_path)
+        index = self._load_yaml_for_update(index_path)
 
         # Add epic to list
         epic_entry = {
@@ -2182,13 +2417,25 @@ TODO: Describe actual behavior
         index["epics"].append(epic_entry)
 
         # Write back
-        with open(index_path, "w") as f:
-            yaml.dump(index, f, default_flow_style=False, sort_keys=False)
+        self._write_yaml(index_path, index)
+
+    def _write_yaml(self, filepath: Path, data: Dict[str, Any], header: str = "") -> None:
+        """Write a YAML dictionary preserving key order, after an optional comment header."""
+        self._forget_written(filepath)
+        filepath.write_bytes(
+            header.encode("utf-8")
+            + safe_dump_bytes(data, default_flow_style=False, sort_keys=False)
+        )
 
-    def _write_yaml(self, filepath: Path, data: Dict[str, Any]) -> None:
-        """Write a YAML dictionary preserving key order."""
-        with open(filepath, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+    def _write_todo_file(self, filepath: Path, frontmatter: Dict[str, Any], body: str) -> None:
+        """Write a .todo file: fenced YAML frontmatter followed by the Markdown body."""
+        self._forget_written(filepath)
+        filepath.write_bytes(
+            b"---\n"
+            + safe_dump_bytes(frontmatter, default_flow_style=False, sort_keys=False)
+            + b"---\n"
+            + body.encode("utf-8")
+        )
 
     def _leaf_id(self, full_id: str) -> str:
         """Return the leaf token of a hierarchical ID."""
@@ -2222,28 +2469,40 @@ TODO: Describe actual behavior
         if not remap:
             return
 
-        # Update YAML files
-        for yaml_path in self.tasks_dir.rglob("index.yaml"):
+        index_paths = []
+        todo_paths = []
+        for entry in self._scan_data_dir():
+            if entry.name == "index.yaml":
+                index_paths.append(Path(entry.path))
+            elif entry.name.endswith(".todo") and entry.is_file():
+                todo_paths.append(Path(entry.path))
+
+        # Update YAML files; only those that reference a remapped ID are rewritten
+        for yaml_path in index_paths:
             data = self._load_yaml(yaml_path)
             updated = self._replace_mapped_values(data, remap)
-            self._write_yaml(yaml_path, updated)
+            if updated != data:
+                self._write_yaml(yaml_path, updated)
 
         for runtime_name in [".context.yaml", ".sessions.yaml"]:
             runtime_path = self.tasks_dir / runtime_name
             if runtime_path.exists():
                 data = self._load_yaml(runtime_path)
                 updated = self._replace_mapped_values(data, remap)
-                self._write_yaml(runtime_path, updated)
-
-        # Update task/bug/idea file frontmatter
-        for todo_path in self.tasks_dir.rglob("*.todo"):
+                if updated != data:
+                    self._write_yaml(runtime_path, updated)
+
+        # Update task/bug/idea file frontmatter. Files whose raw frontmatter
+        # never mentions an old ID are skipped without reading their body.
+        old_ids = [old_id.encode("utf-8") for old_id in remap]
+        for todo_path in todo_paths:
+            raw = _read_frontmatter(todo_path)
+            if not raw or not any(old_id in raw for old_id in old_ids):
+                continue
             frontmatter, body = self._parse_todo_file(todo_path)
             updated = self._replace_mapped_values(frontmatter, remap)
-            with open(todo_path, "w") as f:
-                f.write("---\n")
-                yaml.dump(updated, f, default_flow_style=False, sort_keys=False)
-                f.write("---\n")
-                f.write(body)
+            if updated != frontmatter:
+                self._write_todo_file(todo_path, updated, body)
 
     def _next_epic_number_for_milestone(self, milestone_dir: Path) -> int:
         """Find the next epic number for a milestone directory."""
@@ -2295,12 +2554,14 @@ TODO: Describe actual behavior
             new_filename = f"{new_short}-{self._slugify(src_task.title)}.todo"
             new_file = dst_epic_dir / new_filename
 
-            shutil.move(str(old_file), str(new_file))
+            _ensure_dir(dst_epic_dir)
+            self._forget_written(old_file)
+            os.rename(old_file, new_file)
 
             # Update source epic index
             src_index_path = src_epic_dir / "index.yaml"
             src_index = (
-                self._load_yaml(src_index_path)
+                self._load_yaml_for_update(src_index_path)
                 if src_index_path.exists()
                 else {"tasks": []}
             )
@@ -2328,7 +2589,7 @@ TODO: Describe actual behavior
             # Update destination epic index
             dst_index_path = dst_epic_dir / "index.yaml"
             dst_index = (
-                self._load_yaml(dst_index_path)
+                self._load_yaml_for_update(dst_index_path)
                 if dst_index_path.exists()
                 else {"tasks": []}
             )
@@ -2374,11 +2635,14 @@ TODO: Describe actual behavior
             new_epic_dir_name = f"{next_num:02d}-{self._slugify(src_epic.name)}"
             dst_epic_dir = dst_milestone_dir / new_epic_dir_name
 
+            _ensure_dir(dst_milestone_dir)
+            self._forget_written(src_epic_dir)
             shutil.move(str(src_epic_dir), str(dst_epic_dir))
+            _forget_dir(src_epic_dir)
 
             # Update source milestone index
             src_ms_index_path = src_milestone_dir / "index.yaml"
-            src_ms_index = self._load_yaml(src_ms_index_path)
+            src_ms_index = self._load_yaml_for_update(src_ms_index_path)
             src_epics = []
             old_leaf = self._leaf_id(source_id)
             for entry in src_ms_index.get("epics", []):
@@ -2397,7 +2661,7 @@ TODO: Describe actual behavior
 
             # Update destination milestone index
             dst_ms_index_path = dst_milestone_dir / "index.yaml"
-            dst_ms_index = self._load_yaml(dst_ms_index_path)
+            dst_ms_index = self._load_yaml_for_update(dst_ms_index_path)
             dst_epics = list(dst_ms_index.get("epics", []))
             dst_epics.append(
                 {
@@ -2444,11 +2708,14 @@ TODO: Describe actual behavior
             new_ms_dir_name = f"{next_num:02d}-{self._slugify(src_milestone.name)}"
             dst_ms_dir = dst_phase_dir / new_ms_dir_name
 
+            _ensure_dir(dst_phase_dir)
+            self._forget_written(src_ms_dir)
             shutil.move(str(src_ms_dir), str(dst_ms_dir))
+            _forget_dir(src_ms_dir)
 
             # Update source phase index
             src_phase_index_path = src_phase_dir / "index.yaml"
-            src_phase_index = self._load_yaml(src_phase_index_path)
+            src_phase_index = self._load_yaml_for_update(src_phase_index_path)
             src_milestones = []
             old_leaf = self._leaf_id(source_id)
             for entry in src_phase_index.get("milestones", []):
@@ -2467,7 +2734,7 @@ TODO: Describe actual behavior
 
             # Update destination phase index
             dst_phase_index_path = dst_phase_dir / "index.yaml"
-            dst_phase_index = self._load_yaml(dst_phase_index_path)
+            dst_phase_index = self._load_yaml_for_update(dst_phase_index_path)
             dst_milestones = list(dst_phase_index.get("milestones", []))
             dst_milestones.append(
                 {
@@ -2526,7 +2793,7 @@ TODO: Describe actual behavior
             if not phase:
                 raise ValueError(f"Phase not found: {item_id}")
             root_path = self.tasks_dir / "index.yaml"
-            root = self._load_yaml(root_path)
+            root = self._load_yaml_for_update(root_path)
             for entry in root.get("phases", []):
                 if entry.get("id") in {phase.id, path.phase}:
                     entry["locked"] = desired
@@ -2534,7 +2801,7 @@ TODO: Describe actual behavior
             self._write_yaml(root_path, root)
             phase_index_path = self.tasks_dir / phase.path / "index.yaml"
             if phase_index_path.exists():
-                phase_index = self._load_yaml(phase_index_path)
+                phase_index = self._load_yaml_for_update(phase_index_path)
                 phase_index["locked"] = desired
                 self._write_yaml(phase_index_path, phase_index)
             return phase.id
@@ -2547,7 +2814,7 @@ TODO: Describe actual behavior
             if not phase:
                 raise ValueError(f"Phase not found for milestone: {item_id}")
             phase_index_path = self.tasks_dir / phase.path / "index.yaml"
-            phase_index = self._load_yaml(phase_index_path)
+            phase_index = self._load_yaml_for_update(phase_index_path)
             for entry in phase_index.get("milestones", []):
                 if entry.get("id") in {milestone.id, path.milestone}:
                     entry["locked"] = desired
@@ -2555,7 +2822,7 @@ TODO: Describe actual behavior
             self._write_yaml(phase_index_path, phase_index)
             ms_index_path = self.tasks_dir / phase.path / milestone.path / "index.yaml"
             if ms_index_path.exists():
-                ms_index = self._load_yaml(ms_index_path)
+                ms_index = self._load_yaml_for_update(ms_index_path)
                 ms_index["locked"] = desired
                 self._write_yaml(ms_index_path, ms_index)
             return milestone.id
@@ -2569,7 +2836,7 @@ TODO: Describe actual behavior
             if not milestone or not phase:
                 raise ValueError(f"Could not resolve parent paths for epic: {item_id}")
             ms_index_path = self.tasks_dir / phase.path / milestone.path / "index.yaml"
-            ms_index = self._load_yaml(ms_index_path)
+            ms_index = self._load_yaml_for_update(ms_index_path)
             for entry in ms_index.get("epics", []):
                 if entry.get("id") in {epic.id, path.epic}:
                     entry["locked"] = desired
@@ -2579,7 +2846,7 @@ TODO: Describe actual behavior
                 self.tasks_dir / phase.path / milestone.path / epic.path / "index.yaml"
             )
             if epic_index_path.exists():
-                epic_index = self._load_yaml(epic_index_path)
+                epic_index = self._load_yaml_for_update(epic_index_path)
                 epic_index["locked"] = desired
                 self._write_yaml(epic_index_path, epic_index)
             return epic.id
@@ -2613,7 +2880,7 @@ TODO: Describe actual behavior
                 raise ValueError(f"Phase not found: {item_id}")
 
             root_path = self.tasks_dir / "index.yaml"
-            root = self._load_yaml(root_path)
+            root = self._load_yaml_for_update(root_path)
             for entry in root.get("phases", []):
                 if entry.get("id") in {phase.id, path.phase}:
                     entry["status"] = Status.PENDING.value
@@ -2622,7 +2889,7 @@ TODO: Describe actual behavior
 
             phase_index_path = self.tasks_dir / phase.path / "index.yaml"
             if phase_index_path.exists():
-                phase_index = self._load_yaml(phase_index_path)
+                phase_index = self._load_yaml_for_update(phase_index_path)
                 phase_index["status"] = Status.PENDING.value
                 for entry in phase_index.get("milestones", []):
                     entry["status"] = Status.PENDING.value
@@ -2632,7 +2899,7 @@ TODO: Describe actual behavior
             for milestone in phase.milestones:
                 ms_index_path = self.tasks_dir / phase.path / milestone.path / "index.yaml"
                 if ms_index_path.exists():
-                    ms_index = self._load_yaml(ms_index_path)
+                    ms_index = self._load_yaml_for_update(ms_index_path)
                     ms_index["status"] = Status.PENDING.value
                     for entry in ms_index.get("epics", []):
                         entry["status"] = Status.PENDING.value
@@ -2643,7 +2910,7 @@ TODO: Describe actual behavior
                         self.tasks_dir / phase.path / milestone.path / epic.path / "index.yaml"
                     )
                     if epic_index_path.exists():
-                        epic_index = self._load_yaml(epic_index_path)
+                        epic_index = self._load_yaml_for_update(epic_index_path)
                         epic_index["status"] = Status.PENDING.value
                         self._write_yaml(epic_index_path, epic_index)
                     for t in epic.tasks:
@@ -2660,7 +2927,7 @@ TODO: Describe actual behavior
                 raise ValueError(f"Phase not found for milestone: {item_id}")
 
             phase_index_path = self.tasks_dir / phase.path / "index.yaml"
-            phase_index = self._load_yaml(phase_index_path)
+            phase_index = self._load_yaml_for_update(phase_index_path)
             for entry in phase_index.get("milestones", []):
                 if entry.get("id") in {milestone.id, path.milestone}:
                     entry["status"] = Status.PENDING.value
@@ -2669,7 +2936,7 @@ TODO: Describe actual behavior
 
             ms_index_path = self.tasks_dir / phase.path / milestone.path / "index.yaml"
             if ms_index_path.exists():
-                ms_index = self._load_yaml(ms_index_path)
+                ms_index = self._load_yaml_for_update(ms_index_path)
                 ms_index["status"] = Status.PENDING.value
                 for entry in ms_index.get("epics", []):
                     entry["status"] = Status.PENDING.value
@@ -2681,7 +2948,7 @@ TODO: Describe actual behavior
                     self.tasks_dir / phase.path / milestone.path / epic.path / "index.yaml"
                 )
                 if epic_index_path.exists():
-                    epic_index = self._load_yaml(epic_index_path)
+                    epic_index = self._load_yaml_for_update(epic_index_path)
                     epic_index["status"] = Status.PENDING.value
                     self._write_yaml(epic_index_path, epic_index)
                 for t in epic.tasks:
@@ -2699,7 +2966,7 @@ TODO: Describe actual behavior
                 raise ValueError(f"Could not resolve parent paths for epic: {item_id}")
 
             ms_index_path = self.tasks_dir / phase.path / milestone.path / "index.yaml"
-            ms_index = self._load_yaml(ms_index_path)
+            ms_index = self._load_yaml_for_update(ms_index_path)
             for entry in ms_index.get("epics", []):
                 if entry.get("id") in {epic.id, path.epic}:
                     entry["status"] = Status.PENDING.value
@@ -2710,7 +2977,7 @@ TODO: Describe actual behavior
                 self.tasks_dir / phase.path / milestone.path / epic.path / "index.yaml"
             )
             if epic_index_path.exists():
-                epic_index = self._load_yaml(epic_index_path)
+                epic_index = self._load_yaml_for_update(epic_index_path)
                 epic_index["status"] = Status.PENDING.value
                 self._write_yaml(epic_index_path, epic_index)
 
@@ -2762,7 +3029,7 @@ TODO: Describe actual behavior
             )
 
         root_path = self.tasks_dir / "index.yaml"
-        root_index = self._load_yaml(root_path)
+        root_index = self._load_yaml_for_update(root_path)
         for entry in root_index.get("phases", []):
             if _matches_index_id(entry.get("id"), phase.id):
                 if phase_completed:
@@ -2775,7 +3042,7 @@ TODO: Describe actual behavior
 
         phase_index_path = self.tasks_dir / phase.path / "index.yaml"
         if phase_index_path.exists():
-            phase_index = self._load_yaml(phase_index_path)
+            phase_index = self._load_yaml_for_update(phase_index_path)
             if phase_completed:
                 phase_index["status"] = Status.DONE.value
                 phase_index["locked"] = True
@@ -2788,7 +3055,7 @@ TODO: Describe actual behavior
 
         ms_index_path = self.tasks_dir / phase.path / milestone.path / "index.yaml"
         if ms_index_path.exists():
-            milestone_index = self._load_yaml(ms_index_path)
+            milestone_index = self._load_yaml_for_update(ms_index_path)
             if milestone_completed:
                 milestone_index["status"] = Status.DONE.value
             if epic_completed:
@@ -2800,7 +3067,7 @@ TODO: Describe actual behavior
 
         epic_index_path = self.tasks_dir / phase.path / milestone.path / epic.path / "index.yaml"
         if epic_index_path.exists():
-            epic_index = self._load_yaml(epic_index_path)
+            epic_index = self._load_yaml_for_update(epic_index_path)
             if epic_completed:
                 epic_index["status"] = Status.DONE.value
             self._write_yaml(epic_index_path, epic_index)
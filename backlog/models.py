@@ -1,8 +1,10 @@
 """Data models for task management system."""
 
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, List, Union
 
 from .time_utils import utc_now, to_utc
@@ -172,6 +174,22 @@ class TaskPath:
         return f"TaskPath({self.full_id!r})"
 
 
+@lru_cache(maxsize=65536)
+def _match_path(compiled: tuple, candidate: str) -> bool:
+    """Match candidate against PathQuery._compiled; memoized across queries."""
+    parts = candidate.split(".")
+    if len(parts) < len(compiled):
+        return False
+    for (exact, prefix), part in zip(compiled, parts):
+        if prefix is None:
+            if part != exact:
+                return False
+        elif not part.startswith(prefix):
+            return False
+    return True
+
+
+@dataclass(frozen=True)
 class PathQuery:
     """Parse and match hierarchical path queries with optional trailing wildcards.
 
@@ -185,9 +203,22 @@ class PathQuery:
     Wildcards are optional and must only appear at the end of a segment.
     """
 
-    def __init__(self, raw: str, segments: list[str]):
-        self.raw = raw
-        self.segments = tuple(segments)
+    raw: str
+    segments: tuple[str, ...]
+    # (exact, prefix) per segment: prefix is None for literal segments,
+    # and the text before the trailing "*" for wildcard ones.
+    _compiled: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "segments", tuple(self.segments))
+        object.__setattr__(
+            self,
+            "_compiled",
+            tuple(
+                (seg, seg[:-1]) if seg.endswith("*") else (seg, None)
+                for seg in self.segments
+            ),
+        )
 
     @classmethod
     def parse(cls, query: str) -> "PathQuery":
@@ -214,24 +245,11 @@ class PathQuery:
                     f"Invalid wildcard in path query segment '{part}': {query}"
                 )
 
-        return cls(raw=raw, segments=list(parts))
-
-    def _matches_segment(self, pattern: str, segment: str) -> bool:
-        if pattern == "*":
-            return True
-        if pattern.endswith("*"):
-            return segment.startswith(pattern[:-1])
-        return pattern == segment
+        return cls(raw=raw, segments=tuple(parts))
 
     def matches(self, candidate: str) -> bool:
         """Return True when candidate matches this query."""
-        parts = candidate.split(".")
-        if len(parts) < len(self.segments):
-            return False
-        return all(
-            self._matches_segment(pattern, candidate_part)
-            for pattern, candidate_part in zip(self.segments, parts)
-        )
+        return _match_path(self._compiled, candidate)
 class Status(str, Enum):
     """Task status values."""
 
@@ -296,7 +314,7 @@ class Task:
     @property
     def is_available(self) -> bool:
         """Check if task is available to claim."""
-        return self.status == Status.PENDING and not self.claimed_by
+        return self.status is Status.PENDING and not self.claimed_by
 
     @property
     def is_stale(self) -> bool:
@@ -329,18 +347,32 @@ class Epic:
     @property
     def stats(self):
         """Compute task statistics."""
+        counts = Counter(t.status for t in self.tasks)
         return {
             "total": len(self.tasks),
-            "done": sum(1 for t in self.tasks if t.status == Status.DONE),
-            "in_progress": sum(1 for t in self.tasks if t.status == Status.IN_PROGRESS),
-            "blocked": sum(1 for t in self.tasks if t.status == Status.BLOCKED),
-            "pending": sum(1 for t in self.tasks if t.status == Status.PENDING),
+            "done": counts[Status.DONE],
+            "in_progress": counts[Status.IN_PROGRESS],
+            "blocked": counts[Status.BLOCKED],
+            "pending": counts[Status.PENDING],
         }
 
     @property
     def is_complete(self) -> bool:
         """Check if all tasks are done."""
-        return all(t.status == Status.DONE for t in self.tasks)
+        return all(t.status is Status.DONE for t in self.tasks)
+
+
+def _sum_stats(child_stats):
+    """Add up child ``stats`` dicts, computing each child's stats only once."""
+    totals = {"total_tasks": 0, "done": 0, "in_progress": 0, "blocked": 0, "pending": 0}
+    for stats in child_stats:
+        # Epic stats name the task count "total"; every other level "total_tasks".
+        totals["total_tasks"] += stats.get("total_tasks", stats.get("total", 0))
+        totals["done"] += stats["done"]
+        totals["in_progress"] += stats["in_progress"]
+        totals["blocked"] += stats["blocked"]
+        totals["pending"] += stats["pending"]
+    return totals
 
 
 @dataclass
@@ -364,19 +396,7 @@ class Milestone:
     @property
     def stats(self):
         """Compute aggregate statistics."""
-        total_tasks = sum(len(e.tasks) for e in self.epics)
-        done = sum(e.stats["done"] for e in self.epics)
-        in_progress = sum(e.stats["in_progress"] for e in self.epics)
-        blocked = sum(e.stats["blocked"] for e in self.epics)
-        pending = sum(e.stats["pending"] for e in self.epics)
-
-        return {
-            "total_tasks": total_tasks,
-            "done": done,
-            "in_progress": in_progress,
-            "blocked": blocked,
-            "pending": pending,
-        }
+        return _sum_stats(e.stats for e in self.epics)
 
     @property
     def is_complete(self) -> bool:
@@ -403,19 +423,7 @@ class Phase:
     @property
     def stats(self):
         """Compute aggregate statistics."""
-        total_tasks = sum(m.stats["total_tasks"] for m in self.milestones)
-        done = sum(m.stats["done"] for m in self.milestones)
-        in_progress = sum(m.stats["in_progress"] for m in self.milestones)
-        blocked = sum(m.stats["blocked"] for m in self.milestones)
-        pending = sum(m.stats["pending"] for m in self.milestones)
-
-        return {
-            "total_tasks": total_tasks,
-            "done": done,
-            "in_progress": in_progress,
-            "blocked": blocked,
-            "pending": pending,
-        }
+        return _sum_stats(m.stats for m in self.milestones)
 
     @property
     def is_complete(self) -> bool:
@@ -439,22 +447,9 @@ class TaskTree:
     @property
     def stats(self):
         """Compute global statistics."""
-        total_tasks = sum(p.stats["total_tasks"] for p in self.phases)
-        done = sum(p.stats["done"] for p in self.phases)
-        in_progress = sum(p.stats["in_progress"] for p in self.phases)
-        blocked = sum(p.stats["blocked"] for p in self.phases)
-        pending = sum(p.stats["pending"] for p in self.phases)
-
-        total_estimate_hours = sum(p.estimate_hours for p in self.phases)
-
-        return {
-            "total_tasks": total_tasks,
-            "done": done,
-            "in_progress": in_progress,
-            "blocked": blocked,
-            "pending": pending,
-            "total_estimate_hours": total_estimate_hours,
-        }
+        stats = _sum_stats(p.stats for p in self.phases)
+        stats["total_estimate_hours"] = sum(p.estimate_hours for p in self.phases)
+        return stats
 
     @staticmethod
     def _ids_match(candidate: str, target: str) -> bool:
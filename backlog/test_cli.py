@@ -4,18 +4,22 @@ import pytest
 import json
 import yaml
 import os
+import re
 import subprocess
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
-from click.testing import CliRunner
-from backlog.cli import cli
+from backlog._yaml import safe_load
+from backlog.cli import cli, render_tree
 from backlog.loader import TaskLoader
 
+TREE_BRANCH_RE = re.compile(r"[├└]── ")
+STATUS_ICON_RE = re.compile(r"\[([✓→✗X ])\]")
 
-@pytest.fixture
-def runner():
-    """Create a Click CLI test runner."""
-    return CliRunner()
+
+def load_yaml(path):
+    """Parse a YAML file from raw bytes, via libyaml when available."""
+    with open(path, "rb") as f:
+        return safe_load(f)
 
 
 @pytest.fixture
@@ -349,8 +353,7 @@ Test task description.
     # Update epic index.yaml with task entry
     epic_index_path = epic_dir / "index.yaml"
     if epic_index_path.exists():
-        with open(epic_index_path) as f:
-            epic_index = yaml.safe_load(f) or {}
+        epic_index = load_yaml(epic_index_path) or {}
     else:
         epic_index = {}
 
@@ -416,8 +419,7 @@ def create_bug_file(tasks_dir, bug_id, title, status="pending", depends_on=None)
     bug_index_path = bugs_dir / "index.yaml"
     bug_index = {"bugs": []}
     if bug_index_path.exists():
-        with open(bug_index_path) as f:
-            bug_index = yaml.safe_load(f) or {"bugs": []}
+        bug_index = load_yaml(bug_index_path) or {"bugs": []}
     bug_index.setdefault("bugs", []).append({"id": bug_id, "file": bug_filename})
 
     with open(bug_index_path, "w") as f:
@@ -426,6 +428,16 @@ def create_bug_file(tasks_dir, bug_id, title, status="pending", depends_on=None)
     return bug_file
 
 
+def assert_contains_all(output, needles):
+    """Assert every needle appears in output, scanning it once with a regex."""
+    ordered = sorted(set(needles), key=len, reverse=True)
+    pattern = re.compile("|".join(map(re.escape, ordered)))
+    found = set(pattern.findall(output))
+    # Needles nested inside a longer match are not reported by findall.
+    missing = [n for n in ordered if n not in found and n not in output]
+    assert not missing, f"missing from output: {missing}"
+
+
 def run_git(tasks_dir, *args):
     """Run a git command in a backlog fixture directory."""
     result = subprocess.run(["git", *args], cwd=str(tasks_dir), capture_output=True, text=True)
@@ -548,8 +560,8 @@ class TestClaimCommand:
         idea_result = runner.invoke(cli, ["idea", "Add onboarding docs"])
         assert idea_result.exit_code == 0
 
-        ideas_index = yaml.safe_load(
-            (tmp_tasks_dir / ".tasks" / "ideas" / "index.yaml").read_text()
+        ideas_index = load_yaml(
+            tmp_tasks_dir / ".tasks" / "ideas" / "index.yaml"
         )
         idea_entry = ideas_index["ideas"][0]
         idea_file = tmp_tasks_dir / ".tasks" / "ideas" / idea_entry["file"]
@@ -1875,19 +1887,19 @@ class TestCycleCommand:
         assert "MILESTONE COMPLETE" not in result.output
         assert "PHASE COMPLETE" in result.output
 
-        root_index = yaml.safe_load((tmp_tasks_dir / ".tasks" / "index.yaml").read_text())
+        root_index = load_yaml(tmp_tasks_dir / ".tasks" / "index.yaml")
         phase_entry = next(
             entry for entry in root_index["phases"] if entry["id"] == "P1"
         )
         assert phase_entry["status"] == "done"
         assert phase_entry["locked"] is True
 
-        phase_index = yaml.safe_load((tmp_tasks_dir / ".tasks" / "01-test-phase" / "index.yaml").read_text())
+        phase_index = load_yaml(tmp_tasks_dir / ".tasks" / "01-test-phase" / "index.yaml")
         assert phase_index["status"] == "done"
         assert phase_index["locked"] is True
 
-        milestone_index = yaml.safe_load(
-            (tmp_tasks_dir / ".tasks" / "01-test-phase" / "01-test-milestone" / "index.yaml").read_text()
+        milestone_index = load_yaml(
+            tmp_tasks_dir / ".tasks" / "01-test-phase" / "01-test-milestone" / "index.yaml"
         )
         assert milestone_index["status"] == "done"
         assert any(
@@ -1895,7 +1907,7 @@ class TestCycleCommand:
             for entry in milestone_index["epics"]
         )
 
-        epic_index = yaml.safe_load(
+        epic_index = load_yaml(
             (
                 tmp_tasks_dir
                 / ".tasks"
@@ -1903,7 +1915,7 @@ class TestCycleCommand:
                 / "01-test-milestone"
                 / "01-test-epic"
                 / "index.yaml"
-            ).read_text()
+            )
         )
         assert epic_index["status"] == "done"
 
@@ -1925,7 +1937,7 @@ class TestCycleCommand:
         """done should show milestone review prompt when milestone has more than one epic."""
         tasks_root = tmp_tasks_dir / ".tasks"
         milestone_index_path = tasks_root / "01-test-phase" / "01-test-milestone" / "index.yaml"
-        milestone_index = yaml.safe_load(milestone_index_path.read_text())
+        milestone_index = load_yaml(milestone_index_path)
         milestone_index.setdefault("epics", []).append(
             {
                 "id": "P1.M1.E2",
@@ -2039,8 +2051,6 @@ def test_list_json_includes_milestone_metadata(runner, tmp_tasks_dir):
     result = runner.invoke(cli, ["list", "--json"])
     assert result.exit_code == 0
 
-    import json
-
     data = json.loads(result.output)
     assert "phases" in data
     assert len(data["phases"]) > 0
@@ -2088,7 +2098,7 @@ def test_list_all_implies_show_completed_aux_for_ideas(runner, tmp_tasks_dir):
     assert create_task.exit_code == 0
 
     ideas_index_path = tmp_tasks_dir / ".tasks" / "ideas" / "index.yaml"
-    ideas_index = yaml.safe_load(ideas_index_path.read_text())
+    ideas_index = load_yaml(ideas_index_path)
     idea_file = ideas_index["ideas"][0]["file"]
     idea_path = tmp_tasks_dir / ".tasks" / "ideas" / idea_file
     idea_text = idea_path.read_text().replace("status: pending", "status: done", 1)
@@ -2108,8 +2118,6 @@ def test_list_json_hides_completed_bugs_by_default(runner, tmp_tasks_dir):
     result = runner.invoke(cli, ["list", "--json"])
     assert result.exit_code == 0
 
-    import json
-
     data = json.loads(result.output)
     bug_ids = {b["id"] for b in data.get("bugs", [])}
     assert "B002" in bug_ids
@@ -2190,13 +2198,18 @@ def test_tree_command_shows_full_hierarchy(runner, tmp_tasks_dir):
 
     result = runner.invoke(cli, ["tree"])
     assert result.exit_code == 0
-    assert "Test Phase" in result.output
-    assert "Test Milestone (0/2)" in result.output
-    assert "Test Epic (0/2)" in result.output
-    assert "P1.M1.E1.T001" in result.output
-    assert "P1.M1.E1.T002" in result.output
+    assert_contains_all(
+        result.output,
+        [
+            "Test Phase",
+            "Test Milestone (0/2)",
+            "Test Epic (0/2)",
+            "P1.M1.E1.T001",
+            "P1.M1.E1.T002",
+        ],
+    )
     # Check for tree characters
-    assert "├──" in result.output or "└──" in result.output
+    assert TREE_BRANCH_RE.search(result.output)
 
 
 def test_tree_unfinished_filters_completed(runner, tmp_tasks_dir):
@@ -2244,35 +2257,42 @@ def test_tree_details_shows_metadata(runner, tmp_tasks_dir):
 
     result = runner.invoke(cli, ["tree", "--details"])
     assert result.exit_code == 0
-    assert "@agent-x" in result.output
-    assert "h)" in result.output  # estimate hours (format may be 1h or 2.0h)
+    # "h)" is the estimate suffix (format may be 1h or 2.0h)
+    assert_contains_all(result.output, ["@agent-x", "h)"])
+    assert TREE_BRANCH_RE.search(result.output)
     # Status is shown via icon [→] for in_progress
+    assert "→" in STATUS_ICON_RE.findall(result.output)
 
 
 def test_tree_depth_limits_expansion(runner, tmp_tasks_dir):
     """Test tree --depth limits expansion correctly."""
     create_task_file(tmp_tasks_dir, "P1.M1.E1.T001", "Task 1", status="pending")
 
-    # Depth 1: Only phases
     result = runner.invoke(cli, ["tree", "--depth", "1"])
     assert result.exit_code == 0
     assert "Test Phase" in result.output
     assert "Test Milestone" not in result.output
 
+    # Render the remaining depths from one parsed tree.
+    tree = TaskLoader().load("metadata")
+    rendered = {
+        depth: "\n".join(render_tree(tree, [], depth=depth)) for depth in (1, 2, 3)
+    }
+
+    # Depth 1: Only phases
+    assert "Test Phase" in rendered[1]
+    assert "Test Milestone" not in rendered[1]
+
     # Depth 2: Phases and milestones
-    result = runner.invoke(cli, ["tree", "--depth", "2"])
-    assert result.exit_code == 0
-    assert "Test Phase" in result.output
-    assert "Test Milestone" in result.output
-    assert "Test Epic" not in result.output
+    assert "Test Phase" in rendered[2]
+    assert "Test Milestone" in rendered[2]
+    assert "Test Epic" not in rendered[2]
 
     # Depth 3: Phases, milestones, and epics
-    result = runner.invoke(cli, ["tree", "--depth", "3"])
-    assert result.exit_code == 0
-    assert "Test Phase" in result.output
-    assert "Test Milestone" in result.output
-    assert "Test Epic" in result.output
-    assert "P1.M1.E1.T001" not in result.output
+    assert "Test Phase" in rendered[3]
+    assert "Test Milestone" in rendered[3]
+    assert "Test Epic" in rendered[3]
+    assert "P1.M1.E1.T001" not in rendered[3]
 
 
 def test_tree_json_outputs_complete_hierarchy(runner, tmp_tasks_dir):
@@ -2283,8 +2303,6 @@ def test_tree_json_outputs_complete_hierarchy(runner, tmp_tasks_dir):
     result = runner.invoke(cli, ["tree", "--json"])
     assert result.exit_code == 0
 
-    import json
-
     data = json.loads(result.output)
     assert data["max_depth"] == 4
     assert data["show_details"] is False
@@ -2377,19 +2395,17 @@ def test_tree_path_query_no_match_json_returns_empty_phases(runner, tmp_tasks_di
     result = runner.invoke(cli, ["tree", "P9", "--json"])
     assert result.exit_code == 0
 
-    import json
-
     payload = json.loads(result.output)
     assert payload["phases"] == []
 
 
-def test_list_and_tree_consistent_task_counts(runner, tmp_tasks_dir):
+def test_list_and_tree_consistent_task_counts(invoke_fast, tmp_tasks_dir):
     """Test list and tree show consistent task counts."""
     create_task_file(tmp_tasks_dir, "P1.M1.E1.T001", "Task 1", status="done")
     create_task_file(tmp_tasks_dir, "P1.M1.E1.T002", "Task 2", status="pending")
 
-    list_result = runner.invoke(cli, ["list"])
-    tree_result = runner.invoke(cli, ["tree"])
+    list_result = invoke_fast("list")
+    tree_result = invoke_fast("tree")
 
     assert list_result.exit_code == 0
     assert tree_result.exit_code == 0
@@ -2414,7 +2430,7 @@ def test_idea_command_creates_planning_intake_todo(runner, tmp_tasks_dir):
     ideas_index_path = tmp_tasks_dir / ".tasks" / "ideas" / "index.yaml"
     assert ideas_index_path.exists()
 
-    ideas_index = yaml.safe_load(ideas_index_path.read_text())
+    ideas_index = load_yaml(ideas_index_path)
     assert "ideas" in ideas_index
     assert len(ideas_index["ideas"]) == 1
     assert ideas_index["ideas"][0]["id"] == "I001"
@@ -2455,7 +2471,7 @@ def test_idea_command_accepts_body_and_metadata_flags(runner, tmp_tasks_dir):
     assert "Created idea:" in result.output
 
     ideas_index_path = tmp_tasks_dir / ".tasks" / "ideas" / "index.yaml"
-    ideas_index = yaml.safe_load(ideas_index_path.read_text())
+    ideas_index = load_yaml(ideas_index_path)
     assert ideas_index["ideas"][0]["id"] == "I001"
     idea_file = tmp_tasks_dir / ".tasks" / "ideas" / ideas_index["ideas"][0]["file"]
     content = idea_file.read_text()
@@ -2560,7 +2576,7 @@ def test_idea_command_increments_idea_ids(runner, tmp_tasks_dir):
     assert second.exit_code == 0
 
     ideas_index_path = tmp_tasks_dir / ".tasks" / "ideas" / "index.yaml"
-    ideas_index = yaml.safe_load(ideas_index_path.read_text())
+    ideas_index = load_yaml(ideas_index_path)
     ids = [entry["id"] for entry in ideas_index["ideas"]]
     assert ids == ["I001", "I002"]
 
@@ -2684,8 +2700,8 @@ def test_grab_can_claim_idea(runner, tmp_tasks_dir):
     assert result.exit_code == 0
     assert "I001" in result.output
 
-    ideas_index = yaml.safe_load(
-        (tmp_tasks_dir / ".tasks" / "ideas" / "index.yaml").read_text()
+    ideas_index = load_yaml(
+        tmp_tasks_dir / ".tasks" / "ideas" / "index.yaml"
     )
     idea_path = tmp_tasks_dir / ".tasks" / "ideas" / ideas_index["ideas"][0]["file"]
     idea_content = idea_path.read_text()
@@ -2693,21 +2709,21 @@ def test_grab_can_claim_idea(runner, tmp_tasks_dir):
     assert "claimed_by: test-agent" in idea_content
 
 
-def test_list_bugs_and_ideas_flags(runner, tmp_tasks_dir):
-    bug_result = runner.invoke(cli, ["bug", "--title", "critical bug", "--simple"])
+def test_list_bugs_and_ideas_flags(invoke_fast, tmp_tasks_dir):
+    bug_result = invoke_fast("bug", ["--title", "critical bug", "--simple"])
     assert bug_result.exit_code == 0
 
-    idea_result = runner.invoke(cli, ["idea", "future planning idea"])
+    idea_result = invoke_fast("idea", ["future planning idea"])
     assert idea_result.exit_code == 0
 
-    bugs_only = runner.invoke(cli, ["list", "--bugs"])
+    bugs_only = invoke_fast("list", ["--bugs"])
     assert bugs_only.exit_code == 0
     assert "Bugs" in bugs_only.output
     assert "B001" in bugs_only.output
     assert "Ideas" not in bugs_only.output
     assert "Phase" not in bugs_only.output
 
-    ideas_only = runner.invoke(cli, ["list", "--ideas"])
+    ideas_only = invoke_fast("list", ["--ideas"])
     assert ideas_only.exit_code == 0
     assert "Ideas" in ideas_only.output
     assert "I001" in ideas_only.output
@@ -2745,13 +2761,13 @@ def test_list_aux_fallback_title_from_filename(runner, tmp_tasks_dir):
     assert idea_result.exit_code == 0
 
     bugs_index_path = tmp_tasks_dir / ".tasks" / "bugs" / "index.yaml"
-    bugs_index = yaml.safe_load(bugs_index_path.read_text()) or {"bugs": []}
+    bugs_index = load_yaml(bugs_index_path) or {"bugs": []}
     if bugs_index.get("bugs"):
         bugs_index["bugs"][0].pop("title", None)
     bugs_index_path.write_text(yaml.safe_dump(bugs_index))
 
     ideas_index_path = tmp_tasks_dir / ".tasks" / "ideas" / "index.yaml"
-    ideas_index = yaml.safe_load(ideas_index_path.read_text()) or {"ideas": []}
+    ideas_index = load_yaml(ideas_index_path) or {"ideas": []}
     if ideas_index.get("ideas"):
         ideas_index["ideas"][0].pop("title", None)
     ideas_index_path.write_text(yaml.safe_dump(ideas_index))
@@ -2989,7 +3005,7 @@ def test_add_commands_accept_optional_descriptions(runner, tmp_tasks_dir):
     assert "Next:" in phase_result.output
     assert "backlog show P2" in phase_result.output
     assert "backlog add-milestone P2" in phase_result.output
-    root_index = yaml.safe_load((tmp_tasks_dir / ".tasks" / "index.yaml").read_text())
+    root_index = load_yaml(tmp_tasks_dir / ".tasks" / "index.yaml")
     phase_entry = next(entry for entry in root_index["phases"] if entry["id"] == "P2")
     assert phase_entry["description"] == phase_description
 
@@ -3004,8 +3020,8 @@ def test_add_commands_accept_optional_descriptions(runner, tmp_tasks_dir):
     assert "  - backlog add-epic P1.M2" in milestone_result.output
 
     milestone_id = milestone_result.output.split("Created milestone: ", 1)[1].split("\n", 1)[0].strip()
-    milestone_index = yaml.safe_load(
-        (tmp_tasks_dir / ".tasks" / "01-test-phase" / "index.yaml").read_text()
+    milestone_index = load_yaml(
+        tmp_tasks_dir / ".tasks" / "01-test-phase" / "index.yaml"
     )
     milestone_entry = next(
         entry
@@ -3026,8 +3042,8 @@ def test_add_commands_accept_optional_descriptions(runner, tmp_tasks_dir):
     assert (
         f'  - backlog add {epic_id} --title "<task title>"' in epic_result.output
     )
-    epic_index = yaml.safe_load(
-        (tmp_tasks_dir / ".tasks" / "01-test-phase" / "01-test-milestone" / "index.yaml").read_text()
+    epic_index = load_yaml(
+        tmp_tasks_dir / ".tasks" / "01-test-phase" / "01-test-milestone" / "index.yaml"
     )
     epic_entry = next(
         entry for entry in epic_index["epics"] if entry.get("description") == epic_description
@@ -3133,6 +3149,19 @@ def test_show_task_long_prints_entire_body(runner, tmp_tasks_dir):
     assert "To view the full file, run: cat" not in result.output
 
 
+def test_show_task_long_keeps_body_after_horizontal_rule(runner, tmp_tasks_dir):
+    """A "---" rule inside the body does not cut off the text below it."""
+    task_file = create_task_file(tmp_tasks_dir, "P1.M1.E1.T001", "Test Task")
+    task_file.write_text(
+        task_file.read_text() + "\n---\n\nNotes below the rule.\n", encoding="utf-8"
+    )
+
+    result = runner.invoke(cli, ["show", "P1.M1.E1.T001", "--long"])
+    assert result.exit_code == 0
+    assert "- Acceptance criterion 2" in result.output
+    assert "Notes below the rule." in result.output
+
+
 def test_show_task_all_prints_entire_task_file(runner, tmp_tasks_dir):
     """show --all should print the complete .todo file including frontmatter."""
     task_file = create_task_file(tmp_tasks_dir, "P1.M1.E1.T001", "Test Task")
@@ -3355,26 +3384,15 @@ def test_move_task_to_different_epic_renumbers_id(runner, tmp_tasks_dir_short_id
     milestone_index_path = (
         tasks_root / "01-test-phase" / "01-test-milestone" / "index.yaml"
     )
-    milestone_index = yaml.safe_load(milestone_index_path.read_text())
-    milestone_index.setdefault("epics", []).append(
-        {
-            "id": "E2",
-            "name": "Target Epic",
-            "path": "02-target-epic",
-            "status": "pending",
-        }
+    milestone_index = load_yaml(milestone_index_path)
+    milestone_index["epics"].append(
+        {"id": "E2", "name": "Target Epic", "path": "02-target-epic", "status": "pending"}
     )
-    milestone_index_path.write_text(yaml.dump(milestone_index))
+    milestone_index_path.write_text(yaml.safe_dump(milestone_index, sort_keys=False))
 
     # Create destination epic index
     (target_epic_dir / "index.yaml").write_text(
-        yaml.dump(
-            {
-                "id": "P1.M1.E2",
-                "name": "Target Epic",
-                "tasks": [],
-            }
-        )
+        "id: P1.M1.E2\nname: Target Epic\ntasks: []\n"
     )
 
     # Existing task in source epic
@@ -3415,19 +3433,14 @@ def test_move_epic_to_different_milestone_remaps_descendant_ids(
 
     # Add second milestone under phase
     phase_index_path = phase_dir / "index.yaml"
-    phase_index = yaml.safe_load(phase_index_path.read_text())
-    phase_index.setdefault("milestones", []).append(
-        {
-            "id": "M2",
-            "name": "Target Milestone",
-            "path": "02-target-ms",
-            "status": "pending",
-        }
+    phase_index = load_yaml(phase_index_path)
+    phase_index["milestones"].append(
+        {"id": "M2", "name": "Target Milestone", "path": "02-target-ms", "status": "pending"}
     )
-    phase_index_path.write_text(yaml.dump(phase_index))
+    phase_index_path.write_text(yaml.safe_dump(phase_index, sort_keys=False))
 
     # Create destination milestone index
-    (target_ms_dir / "index.yaml").write_text(yaml.dump({"epics": []}))
+    (target_ms_dir / "index.yaml").write_text("epics: []\n")
 
     create_task_file(tmp_tasks_dir_short_ids, "P1.M1.E1.T001", "A", status="pending")
 
@@ -3517,3 +3530,152 @@ def test_benchmark_command_reports_summary(runner, tmp_tasks_dir):
     assert "Task frontmatter parse time" in text_result.output
     assert "Task body parse time" in text_result.output
     assert "Parse mode" in text_result.output
+
+
+def test_load_config_merges_defaults_and_reuses_parse(tmp_path, monkeypatch):
+    """Config is parsed once while unchanged and callers get private copies."""
+    import backlog.cli as cli_module
+
+    monkeypatch.chdir(tmp_path)
+    config_path = tmp_path / ".tasks" / "config.yaml"
+    config_path.parent.mkdir()
+    config_path.write_text("agent:\n  default_agent: bot\n", encoding="utf-8")
+    old = (datetime.now() - timedelta(minutes=5)).timestamp()
+    os.utime(config_path, (old, old))
+
+    calls = {"parse": 0}
+    original_safe_load = cli_module.safe_load
+
+    def counting_safe_load(stream):
+        calls["parse"] += 1
+        return original_safe_load(stream)
+
+    monkeypatch.setattr(cli_module, "safe_load", counting_safe_load)
+    cli_module._load_config_cached.cache_clear()
+
+    first = cli_module.load_config()
+    assert first["agent"] == {"default_agent": "bot", "auto_claim_after_done": False}
+    assert first["session"] == {"heartbeat_timeout_minutes": 15}
+    first["agent"]["default_agent"] = "mutated"
+
+    assert cli_module.get_default_agent() == "bot"
+    assert calls["parse"] == 1
+
+    config_path.write_text("agent:\n  default_agent: other\n", encoding="utf-8")
+    assert cli_module.get_default_agent() == "other"
+    assert calls["parse"] == 2
+
+
+def test_get_default_agent_uses_passed_config(monkeypatch):
+    """A config the caller already loaded is used without reading it again."""
+    import backlog.cli as cli_module
+    from backlog.commands import workflow
+
+    def fail_load():
+        raise AssertionError("config read again")
+
+    monkeypatch.setattr(cli_module, "load_config", fail_load)
+    config = {"agent": {"default_agent": "bot"}}
+    assert cli_module.get_default_agent(config) == "bot"
+    assert workflow.get_default_agent(config) == "bot"
+    assert workflow.get_default_agent({}) == "cli-user"
+
+
+def test_lazy_command_map_matches_command_modules():
+    """Every command a commands/ module registers is listed under that module."""
+    import pkgutil
+    from importlib import import_module
+
+    import click
+
+    import backlog.commands
+    from backlog.cli import _LAZY_COMMAND_MODULES
+
+    expected = {}
+    for info in pkgutil.iter_modules(backlog.commands.__path__):
+        module = import_module(f"backlog.commands.{info.name}")
+        if not hasattr(module, "register_commands"):
+            continue
+        group = click.Group()
+        module.register_commands(group)
+        expected.update(dict.fromkeys(group.commands, info.name))
+
+    assert _LAZY_COMMAND_MODULES == expected
+
+
+def test_filtered_index_counts_match_node_stats(tmp_tasks_dir):
+    """One filtered walk yields the same per-node counts as the model stats."""
+    from backlog.cli import _index_filtered_tasks
+    from backlog.models import Status
+
+    create_task_file(tmp_tasks_dir, "P1.M1.E1.T001", "Done", status="done")
+    create_task_file(tmp_tasks_dir, "P1.M1.E1.T002", "Active", status="in_progress")
+    create_task_file(tmp_tasks_dir, "P1.M1.E1.T003", "Stuck", status="blocked")
+    create_task_file(tmp_tasks_dir, "P1.M1.E1.T004", "Todo")
+
+    tree = TaskLoader().load("metadata")
+    phase = tree.phases[0]
+    milestone = phase.milestones[0]
+    index = _index_filtered_tasks(tree.phases, complexity="medium")
+
+    for node in (phase, milestone):
+        tasks, counts = index[node.id]
+        stats = node.stats
+        assert len(tasks) == stats["total_tasks"] == 4
+        assert counts[Status.DONE] == stats["done"] == 1
+        assert counts[Status.IN_PROGRESS] == stats["in_progress"] == 1
+        assert counts[Status.BLOCKED] == stats["blocked"] == 1
+        assert counts[Status.PENDING] == stats["pending"] == 1
+    assert tree.stats["total_tasks"] == milestone.epics[0].stats["total"] == 4
+
+    assert _index_filtered_tasks(tree.phases, priority="low")[phase.id] == ([], {})
+
+
+def test_tree_json_multi_phase_output_parses(runner, tasks_skeleton, monkeypatch):
+    """tree --json output for several phases is one valid document."""
+    (tasks_skeleton / "02-phase").mkdir()
+    (tasks_skeleton / "02-phase" / "index.yaml").write_text("milestones: []\n")
+    (tasks_skeleton / "index.yaml").write_text(
+        "project: Skeleton\nphases:\n"
+        "  - id: P1\n    name: Phase\n    path: 01-phase\n"
+        "  - id: P2\n    name: Second\n    path: 02-phase\n"
+    )
+    (tasks_skeleton / "01-phase" / "01-ms" / "01-epic" / "index.yaml").write_text(
+        "tasks: []\n"
+    )
+    monkeypatch.chdir(tasks_skeleton.parent)
+
+    result = runner.invoke(cli, ["tree", "--json"])
+    assert result.exit_code == 0
+    payload = json.loads(result.output)
+    assert [p["id"] for p in payload["phases"]] == ["P1", "P2"]
+    assert payload["max_depth"] == 4
+
+
+@pytest.mark.parametrize("command", ["list", "tree", "next"])
+def test_graph_views_skip_result_cache_unless_enabled(
+    runner, tasks_skeleton, monkeypatch, command
+):
+    """Without BACKLOG_DISK_CACHE, critical-path views never touch the user cache dir."""
+    from backlog import _cache
+
+    monkeypatch.chdir(tasks_skeleton.parent)
+    monkeypatch.setattr(_cache, "_cache_dir", lambda: pytest.fail("cache dir touched"))
+    result = runner.invoke(cli, [command])
+    assert result.exit_code == 0, result.output
+
+
+def test_done_totals_index_covers_every_node(tmp_tasks_dir):
+    """The render stats index has done/total counts for each phase, milestone and epic."""
+    from backlog.cli import _done_totals_index
+
+    create_task_file(tmp_tasks_dir, "P1.M1.E1.T001", "Done", status="done")
+    create_task_file(tmp_tasks_dir, "P1.M1.E1.T002", "Todo")
+
+    tree = TaskLoader().load("metadata")
+    index = _done_totals_index(tree.phases)
+
+    phase = tree.phases[0]
+    milestone = phase.milestones[0]
+    for node in (phase, milestone, milestone.epics[0]):
+        assert index[node.id] == {"done": 1, "total": 2}
@@ -232,6 +232,19 @@ def test_data_summary_json_reports_status_counts(runner, tmp_feature_tasks_dir):
     assert payload["overall"]["blocked"] == 1
 
 
+def test_unclaim_stale_uses_threshold_cutoff(runner, tmp_feature_tasks_dir):
+    # P1.M1.E1.T002 was claimed three hours ago.
+    fresh = runner.invoke(cli, ["unclaim-stale", "--dry-run", "--threshold", "200"])
+    assert fresh.exit_code == 0
+    assert "No stale claims found" in fresh.output
+
+    stale = runner.invoke(cli, ["unclaim-stale", "--dry-run", "--threshold", "170"])
+    assert stale.exit_code == 0
+    assert "Found 1 stale claim(s)" in stale.output
+    assert "P1.M1.E1.T002" in stale.output
+    assert "Age: 180 minutes" in stale.output
+
+
 def test_sync_writes_stats_to_nested_indexes(runner, tmp_feature_tasks_dir):
     result = runner.invoke(cli, ["sync"])
     assert result.exit_code == 0
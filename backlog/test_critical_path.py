@@ -1,201 +1,50 @@
 """Tests for CriticalPathCalculator, especially multi-task selection diversity."""
 
+import copy
+import hashlib
+import itertools
+import os
+import pickle
+
 import pytest
-import yaml
 from pathlib import Path
+from backlog._yaml import safe_dump
 from backlog.loader import TaskLoader
 from backlog.critical_path import CriticalPathCalculator
-from backlog.models import Status
-
-
-@pytest.fixture
-def tmp_diverse_tasks_dir(tmp_path):
-    """Create a task tree with multiple phases, milestones, and epics for diversity testing."""
-    tasks_dir = tmp_path / ".tasks"
-    tasks_dir.mkdir()
-
-    # Create root index with multiple phases
-    root_index = {
-        "project": "Test Project",
-        "description": "Test project for diversity testing",
-        "timeline_weeks": 4,
-        "phases": [
-            {
-                "id": "P1",
-                "name": "Phase 1",
-                "path": "01-phase-1",
-                "status": "in_progress",
-            },
-            {
-                "id": "P2",
-                "name": "Phase 2",
-                "path": "02-phase-2",
-                "status": "in_progress",
-            },
-            {
-                "id": "P3",
-                "name": "Phase 3",
-                "path": "03-phase-3",
-                "status": "in_progress",
-            },
-        ],
-    }
-    with open(tasks_dir / "index.yaml", "w") as f:
-        yaml.dump(root_index, f)
-
-    # Create Phase 1 with 2 milestones
-    phase1_dir = tasks_dir / "01-phase-1"
-    phase1_dir.mkdir()
-    phase1_index = {
-        "milestones": [
-            {
-                "id": "M1",
-                "name": "Milestone 1",
-                "path": "01-milestone-1",
-                "status": "in_progress",
-            },
-            {
-                "id": "M2",
-                "name": "Milestone 2",
-                "path": "02-milestone-2",
-                "status": "in_progress",
-            },
-        ],
-    }
-    with open(phase1_dir / "index.yaml", "w") as f:
-        yaml.dump(phase1_index, f)
-
-    # Create P1.M1 with 2 epics
-    milestone_p1m1_dir = phase1_dir / "01-milestone-1"
-    milestone_p1m1_dir.mkdir()
-    milestone_p1m1_index = {
-        "epics": [
-            {
-                "id": "E1",
-                "name": "Epic 1",
-                "path": "01-epic-1",
-                "status": "in_progress",
-            },
-            {
-                "id": "E2",
-                "name": "Epic 2",
-                "path": "02-epic-2",
-                "status": "in_progress",
-            },
-        ],
-    }
-    with open(milestone_p1m1_dir / "index.yaml", "w") as f:
-        yaml.dump(milestone_p1m1_index, f)
-
-    # Create P1.M2 with 1 epic
-    milestone_p1m2_dir = phase1_dir / "02-milestone-2"
-    milestone_p1m2_dir.mkdir()
-    milestone_p1m2_index = {
-        "epics": [
-            {
-                "id": "E1",
-                "name": "Epic 3",
-                "path": "01-epic-3",
-                "status": "in_progress",
-            },
-        ],
-    }
-    with open(milestone_p1m2_dir / "index.yaml", "w") as f:
-        yaml.dump(milestone_p1m2_index, f)
-
-    # Create Phase 2 with 1 milestone and 1 epic
-    phase2_dir = tasks_dir / "02-phase-2"
-    phase2_dir.mkdir()
-    phase2_index = {
-        "milestones": [
-            {
-                "id": "M1",
-                "name": "Milestone 3",
-                "path": "01-milestone-3",
-                "status": "in_progress",
-            },
-        ],
-    }
-    with open(phase2_dir / "index.yaml", "w") as f:
-        yaml.dump(phase2_index, f)
-
-    milestone_p2m1_dir = phase2_dir / "01-milestone-3"
-    milestone_p2m1_dir.mkdir()
-    milestone_p2m1_index = {
-        "epics": [
-            {
-                "id": "E1",
-                "name": "Epic 4",
-                "path": "01-epic-4",
-                "status": "in_progress",
-            },
-        ],
-    }
-    with open(milestone_p2m1_dir / "index.yaml", "w") as f:
-        yaml.dump(milestone_p2m1_index, f)
-
-    # Create Phase 3 with 1 milestone and 1 epic
-    phase3_dir = tasks_dir / "03-phase-3"
-    phase3_dir.mkdir()
-    phase3_index = {
-        "milestones": [
-            {
-                "id": "M1",
-                "name": "Milestone 4",
-                "path": "01-milestone-4",
-                "status": "in_progress",
-            },
-        ],
-    }
-    with open(phase3_dir / "index.yaml", "w") as f:
-        yaml.dump(phase3_index, f)
-
-    milestone_p3m1_dir = phase3_dir / "01-milestone-4"
-    milestone_p3m1_dir.mkdir()
-    milestone_p3m1_index = {
-        "epics": [
-            {
-                "id": "E1",
-                "name": "Epic 5",
-                "path": "01-epic-5",
-                "status": "in_progress",
-            },
-        ],
-    }
-    with open(milestone_p3m1_dir / "index.yaml", "w") as f:
-        yaml.dump(milestone_p3m1_index, f)
-
-    # Create tasks in each epic
-    epic_configs = [
-        ("P1.M1.E1", milestone_p1m1_dir / "01-epic-1"),
-        ("P1.M1.E2", milestone_p1m1_dir / "02-epic-2"),
-        ("P1.M2.E1", milestone_p1m2_dir / "01-epic-3"),
-        ("P2.M1.E1", milestone_p2m1_dir / "01-epic-4"),
-        ("P3.M1.E1", milestone_p3m1_dir / "01-epic-5"),
-    ]
-
-    for epic_id, epic_dir in epic_configs:
-        epic_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create 2 tasks per epic
-        tasks_list = []
-        for task_num in range(1, 3):
-            task_id = f"{epic_id}.T{task_num:03d}"
-            task_file = epic_dir / f"T{task_num:03d}-task.todo"
-
-            frontmatter = {
-                "id": task_id,
-                "title": f"Task {task_id}",
-                "status": "pending",
-                "estimate_hours": 2.0,
-                "complexity": "medium",
-                "priority": "high",
-                "depends_on": [],
-                "tags": ["test"],
-            }
-
-            content = f"""---
-{yaml.dump(frontmatter, default_flow_style=False)}---
+from backlog.models import (
+    Complexity,
+    Epic,
+    Milestone,
+    Phase,
+    Priority,
+    Status,
+    Task,
+    TaskTree,
+)
+
+# Session fixtures below are built once per worker; keep this module together.
+pytestmark = pytest.mark.xdist_group("critical_path")
+
+DIVERSITY_MULTIPLIERS = {"low": 1.0, "medium": 1.5, "high": 2.0, "critical": 3.0}
+
+# Frontmatter fields shared by every fixture task; only id/title vary.
+_TASK_FRONTMATTER_COMMON = safe_dump(
+    {
+        "status": "pending",
+        "estimate_hours": 2.0,
+        "complexity": "medium",
+        "priority": "high",
+        "depends_on": [],
+        "tags": ["test"],
+    },
+    default_flow_style=False,
+)
+_TASK_FILE_TEMPLATE = (
+    "---\n"
+    "id: {task_id}\n"
+    "title: Task {task_id}\n"
+    + _TASK_FRONTMATTER_COMMON.replace("{", "{{").replace("}", "}}")
+    + """---
 
 # Task {task_id}
 
@@ -210,26 +59,209 @@ Test task description.
 
 - Criterion 1
 """
+)
+
+# (phase id, name, path, [(milestone id, name, path, [(epic id, name, path)])])
+_PHASE_SPEC = [
+    ("P1", "Phase 1", "01-phase-1", [
+        ("M1", "Milestone 1", "01-milestone-1", [
+            ("E1", "Epic 1", "01-epic-1"),
+            ("E2", "Epic 2", "02-epic-2"),
+        ]),
+        ("M2", "Milestone 2", "02-milestone-2", [
+            ("E1", "Epic 3", "01-epic-3"),
+        ]),
+    ]),
+    ("P2", "Phase 2", "02-phase-2", [
+        ("M1", "Milestone 3", "01-milestone-3", [
+            ("E1", "Epic 4", "01-epic-4"),
+        ]),
+    ]),
+    ("P3", "Phase 3", "03-phase-3", [
+        ("M1", "Milestone 4", "01-milestone-4", [
+            ("E1", "Epic 5", "01-epic-5"),
+        ]),
+    ]),
+]
+
+
+def build_tree_in_memory() -> TaskTree:
+    """Build the diverse task tree directly, matching what TaskLoader yields."""
+    tree = TaskTree(
+        project="Test Project",
+        description="Test project for diversity testing",
+        timeline_weeks=4,
+    )
+    for phase_id, phase_name, phase_path, milestones in _PHASE_SPEC:
+        phase = Phase(
+            id=phase_id,
+            name=phase_name,
+            path=phase_path,
+            status=Status.IN_PROGRESS,
+            weeks=0,
+            estimate_hours=0.0,
+            priority=Priority.MEDIUM,
+        )
+        for ms_short, ms_name, ms_path, epics in milestones:
+            milestone_id = f"{phase_id}.{ms_short}"
+            milestone = Milestone(
+                id=milestone_id,
+                name=ms_name,
+                path=ms_path,
+                status=Status.IN_PROGRESS,
+                estimate_hours=0.0,
+                complexity=Complexity.MEDIUM,
+                phase_id=phase_id,
+            )
+            for epic_short, epic_name, epic_path in epics:
+                epic_id = f"{milestone_id}.{epic_short}"
+                epic = Epic(
+                    id=epic_id,
+                    name=epic_name,
+                    path=epic_path,
+                    status=Status.IN_PROGRESS,
+                    estimate_hours=0.0,
+                    complexity=Complexity.MEDIUM,
+                    milestone_id=milestone_id,
+                    phase_id=phase_id,
+                )
+                for task_num in range(1, 3):
+                    task_id = f"{epic_id}.T{task_num:03d}"
+                    epic.tasks.append(
+                        Task(
+                            id=task_id,
+                            title=f"Task {task_id}",
+                            file=f"{phase_path}/{ms_path}/{epic_path}/T{task_num:03d}-task.todo",
+                            status=Status.PENDING,
+                            estimate_hours=2.0,
+                            complexity=Complexity.MEDIUM,
+                            priority=Priority.HIGH,
+                            tags=["test"],
+                            epic_id=epic_id,
+                            milestone_id=milestone_id,
+                            phase_id=phase_id,
+                        )
+                    )
+                milestone.epics.append(epic)
+            phase.milestones.append(milestone)
+        tree.phases.append(phase)
+    return tree
+
+
+def _dump(data) -> str:
+    return safe_dump(data, default_flow_style=False)
+
+
+def _index_entry(item_id: str, name: str, path: str) -> dict:
+    return {"id": item_id, "name": name, "path": path, "status": "in_progress"}
+
+
+@pytest.fixture(scope="session")
+def tmp_diverse_tasks_dir(tmp_path_factory):
+    """Create a task tree with multiple phases, milestones, and epics for diversity testing.
+
+    The layout comes from ``_PHASE_SPEC``. Built once per session; tests must
+    not modify the files.
+    """
+    tmp_path = tmp_path_factory.mktemp("diverse")
+    tasks_dir = tmp_path / ".tasks"
+    tasks_dir.mkdir()
+    (tasks_dir / "index.yaml").write_text(_dump({
+        "project": "Test Project",
+        "description": "Test project for diversity testing",
+        "timeline_weeks": 4,
+        "phases": [_index_entry(*spec[:3]) for spec in _PHASE_SPEC],
+    }))
+
+    for phase_id, _, phase_path, milestones in _PHASE_SPEC:
+        phase_dir = tasks_dir / phase_path
+        phase_dir.mkdir()
+        (phase_dir / "index.yaml").write_text(
+            _dump({"milestones": [_index_entry(*spec[:3]) for spec in milestones]})
+        )
 
-            with open(task_file, "w") as f:
-                f.write(content)
+        for ms_short, _, ms_path, epics in milestones:
+            milestone_dir = phase_dir / ms_path
+            milestone_dir.mkdir()
+            (milestone_dir / "index.yaml").write_text(
+                _dump({"epics": [_index_entry(*spec) for spec in epics]})
+            )
+
+            for epic_short, _, epic_path in epics:
+                epic_id = f"{phase_id}.{ms_short}.{epic_short}"
+                epic_dir = milestone_dir / epic_path
+                epic_dir.mkdir()
+
+                # 2 tasks per epic
+                tasks_list = []
+                for task_num in range(1, 3):
+                    task_id = f"{epic_id}.T{task_num:03d}"
+                    filename = f"T{task_num:03d}-task.todo"
+                    (epic_dir / filename).write_text(_TASK_FILE_TEMPLATE.format(task_id=task_id))
+                    tasks_list.append({
+                        "id": task_id,
+                        "title": f"Task {task_id}",
+                        "file": filename,
+                        "status": "pending",
+                        "estimate_hours": 2.0,
+                        "complexity": "medium",
+                        "priority": "high",
+                    })
+                (epic_dir / "index.yaml").write_text(_dump({"tasks": tasks_list}))
 
-            tasks_list.append({
-                "id": task_id,
-                "title": f"Task {task_id}",
-                "file": f"T{task_num:03d}-task.todo",
-                "status": "pending",
-                "estimate_hours": 2.0,
-                "complexity": "medium",
-                "priority": "high",
-            })
+    return tmp_path
 
-        # Create epic index
-        epic_index = {"tasks": tasks_list}
-        with open(epic_dir / "index.yaml", "w") as f:
-            yaml.dump(epic_index, f)
 
-    return tmp_path
+def _get_tree(tasks_dir: Path, cache_dir: Path):
+    """Load a fixture tree, reusing a pickle keyed on the files' content hash."""
+    digest = hashlib.sha256()
+    for path in sorted(tasks_dir.rglob("*")):
+        if path.is_file():
+            digest.update(str(path.relative_to(tasks_dir)).encode())
+            digest.update(path.read_bytes())
+    cache_path = cache_dir / f"tree-{digest.hexdigest()[:16]}.pkl"
+    try:
+        return pickle.loads(cache_path.read_bytes())
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    tree = TaskLoader(tasks_dir).load()
+    tmp_cache = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_cache.write_bytes(pickle.dumps(tree, protocol=5))
+    os.replace(tmp_cache, cache_path)  # atomic, so xdist workers never see partial files
+    return tree
+
+
+@pytest.fixture(scope="session")
+def loaded_tree(tmp_path_factory, tmp_diverse_tasks_dir):
+    """The diverse task tree, loaded once; deep-copy it before mutating.
+
+    The parsed tree is pickled next to the xdist worker dirs so other workers
+    skip YAML parsing.
+    """
+    cache_dir = tmp_path_factory.getbasetemp()
+    if "PYTEST_XDIST_WORKER" in os.environ:
+        cache_dir = cache_dir.parent
+    return _get_tree(tmp_diverse_tasks_dir / ".tasks", cache_dir)
+
+
+@pytest.fixture(scope="session")
+def diverse_tree():
+    """The diverse task tree built without YAML; deep-copy it before mutating.
+
+    ``tree._task_index`` maps task id -> Task for O(1) lookups in tests.
+    """
+    tree = build_tree_in_memory()
+    tree._task_index = {
+        t.id: t for p in tree.phases for m in p.milestones for e in m.epics for t in e.tasks
+    }
+    return tree
+
+
+@pytest.fixture(scope="session")
+def calculator(diverse_tree):
+    """Calculator shared by the read-only diversity tests."""
+    return CriticalPathCalculator(diverse_tree, DIVERSITY_MULTIPLIERS)
 
 
 def _create_epic_dependency_tree(tmp_path: Path) -> Path:
@@ -238,8 +270,7 @@ def _create_epic_dependency_tree(tmp_path: Path) -> Path:
 
     def write_yaml(path: Path, data: dict) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False)
+        path.write_text(safe_dump(data, default_flow_style=False))
 
     write_yaml(
         tasks_dir / "index.yaml",
@@ -379,18 +410,16 @@ def test_critical_path_respects_epic_dependencies(tmp_path):
 class TestDiversitySelection:
     """Test that find_independent_tasks selects diverse tasks across the codebase."""
 
-    def test_selects_different_phases_over_same_milestone(self, tmp_diverse_tasks_dir):
-        """When selecting multiple tasks, should prioritize different phases over same milestone."""
-        # Load the task tree
-        loader = TaskLoader(tmp_diverse_tasks_dir / ".tasks")
-        tree = loader.load()
+    def test_in_memory_tree_matches_loaded_tree(self, diverse_tree, loaded_tree):
+        """The YAML-free builder must stay in sync with the on-disk fixture."""
+        assert diverse_tree == loaded_tree
 
-        # Create calculator
-        complexity_multipliers = {"low": 1.0, "medium": 1.5, "high": 2.0, "critical": 3.0}
-        calculator = CriticalPathCalculator(tree, complexity_multipliers)
+    def test_selects_different_phases_over_same_milestone(self, diverse_tree, calculator):
+        """When selecting multiple tasks, should prioritize different phases over same milestone."""
+        tree = diverse_tree
 
         # Use P1.M1.E1.T001 as primary task
-        primary_task = tree.find_task("P1.M1.E1.T001")
+        primary_task = tree._task_index["P1.M1.E1.T001"]
         assert primary_task is not None
 
         # Find 3 independent tasks
@@ -403,7 +432,7 @@ class TestDiversitySelection:
         selected_phases = set()
         selected_milestones = set()
         for task_id in independent:
-            task = tree.find_task(task_id)
+            task = tree._task_index[task_id]
             assert task is not None
             selected_phases.add(task.phase_id)
             selected_milestones.add(task.milestone_id)
@@ -416,26 +445,20 @@ class TestDiversitySelection:
         assert "P2" in selected_phases or "P3" in selected_phases, \
             f"Expected tasks from P2 or P3, got phases: {selected_phases}"
 
-    def test_selects_different_milestones_when_no_other_phases(self, tmp_diverse_tasks_dir):
+    def test_selects_different_milestones_when_no_other_phases(self, diverse_tree):
         """When only one phase available, should still spread across milestones."""
-        # Load the task tree
-        loader = TaskLoader(tmp_diverse_tasks_dir / ".tasks")
-        tree = loader.load()
+        tree = copy.deepcopy(diverse_tree)
 
         # Mark all tasks in P2 and P3 as done to limit available tasks
-        for phase in tree.phases:
-            if phase.id in ["P2", "P3"]:
-                for milestone in phase.milestones:
-                    for epic in milestone.epics:
-                        for task in epic.tasks:
-                            task.status = "done"
+        for task in tree._task_index.values():
+            if task.phase_id in ("P2", "P3"):
+                task.status = Status.DONE
 
         # Create calculator
-        complexity_multipliers = {"low": 1.0, "medium": 1.5, "high": 2.0, "critical": 3.0}
-        calculator = CriticalPathCalculator(tree, complexity_multipliers)
+        calculator = CriticalPathCalculator(tree, DIVERSITY_MULTIPLIERS)
 
         # Use P1.M1.E1.T001 as primary task
-        primary_task = tree.find_task("P1.M1.E1.T001")
+        primary_task = tree._task_index["P1.M1.E1.T001"]
         assert primary_task is not None
 
         # Find 2 independent tasks (should get from P1.M1.E2 and P1.M2.E1)
@@ -447,29 +470,23 @@ class TestDiversitySelection:
         # Extract milestone IDs
         selected_milestones = set()
         for task_id in independent:
-            task = tree.find_task(task_id)
+            task = tree._task_index[task_id]
             assert task is not None
             selected_milestones.add(task.milestone_id)
 
         # Should prioritize P1.M2 (different milestone) over P1.M1.E2 (same milestone)
         if len(independent) >= 1:
             # At least one should be from P1.M2
-            milestone_ids = [tree.find_task(tid).milestone_id for tid in independent]
+            milestone_ids = [tree._task_index[tid].milestone_id for tid in independent]
             assert "P1.M2" in milestone_ids, \
                 f"Expected task from P1.M2, got: {milestone_ids}"
 
-    def test_all_selected_tasks_are_independent(self, tmp_diverse_tasks_dir):
+    def test_all_selected_tasks_are_independent(self, diverse_tree, calculator):
         """All selected tasks should be from different epics and have no dependencies."""
-        # Load the task tree
-        loader = TaskLoader(tmp_diverse_tasks_dir / ".tasks")
-        tree = loader.load()
-
-        # Create calculator
-        complexity_multipliers = {"low": 1.0, "medium": 1.5, "high": 2.0, "critical": 3.0}
-        calculator = CriticalPathCalculator(tree, complexity_multipliers)
+        tree = diverse_tree
 
         # Use P1.M1.E1.T001 as primary task
-        primary_task = tree.find_task("P1.M1.E1.T001")
+        primary_task = tree._task_index["P1.M1.E1.T001"]
         assert primary_task is not None
 
         # Find 4 independent tasks
@@ -481,7 +498,7 @@ class TestDiversitySelection:
         # All should be from different epics
         epic_ids = set()
         for task_id in independent:
-            task = tree.find_task(task_id)
+            task = tree._task_index[task_id]
             assert task is not None
             assert task.epic_id not in epic_ids, f"Found duplicate epic: {task.epic_id}"
             epic_ids.add(task.epic_id)
@@ -490,27 +507,23 @@ class TestDiversitySelection:
         assert primary_task.epic_id not in epic_ids
 
         # None should have dependency relationships with each other
-        tasks = [tree.find_task(tid) for tid in independent]
-        for i, task_a in enumerate(tasks):
-            for task_b in tasks[i+1:]:
-                assert not calculator._has_dependency_relationship(task_a, task_b), \
-                    f"Found dependency between {task_a.id} and {task_b.id}"
-
-    def test_diversity_score_calculation(self, tmp_diverse_tasks_dir):
+        tasks = [tree._task_index[tid] for tid in independent]
+        related = [
+            (task_a.id, task_b.id)
+            for task_a, task_b in itertools.combinations(tasks, 2)
+            if calculator._has_dependency_relationship(task_a, task_b)
+        ]
+        assert not related, f"Found dependencies between: {related}"
+
+    def test_diversity_score_calculation(self, diverse_tree, calculator):
         """Test that diversity scores are calculated correctly."""
-        # Load the task tree
-        loader = TaskLoader(tmp_diverse_tasks_dir / ".tasks")
-        tree = loader.load()
-
-        # Create calculator
-        complexity_multipliers = {"low": 1.0, "medium": 1.5, "high": 2.0, "critical": 3.0}
-        calculator = CriticalPathCalculator(tree, complexity_multipliers)
+        tree = diverse_tree
 
         # Get tasks from different locations
-        primary_task = tree.find_task("P1.M1.E1.T001")  # Phase 1, Milestone 1, Epic 1
-        same_milestone_task = tree.find_task("P1.M1.E2.T001")  # Phase 1, Milestone 1, Epic 2
-        diff_milestone_task = tree.find_task("P1.M2.E1.T001")  # Phase 1, Milestone 2
-        diff_phase_task = tree.find_task("P2.M1.E1.T001")  # Phase 2
+        primary_task = tree._task_index["P1.M1.E1.T001"]  # Phase 1, Milestone 1, Epic 1
+        same_milestone_task = tree._task_index["P1.M1.E2.T001"]  # Phase 1, Milestone 1, Epic 2
+        diff_milestone_task = tree._task_index["P1.M2.E1.T001"]  # Phase 1, Milestone 2
+        diff_phase_task = tree._task_index["P2.M1.E1.T001"]  # Phase 2
 
         assert all([primary_task, same_milestone_task, diff_milestone_task, diff_phase_task])
 
@@ -538,20 +551,14 @@ class TestDiversitySelection:
         assert score_diff_milestone >= 100, "Different milestone should score at least 100"
         assert score_same_milestone >= 10, "Different epic in same milestone should score at least 10"
 
-    def test_diversity_with_selected_tasks(self, tmp_diverse_tasks_dir):
+    def test_diversity_with_selected_tasks(self, diverse_tree, calculator):
         """Test that diversity score accounts for already selected tasks."""
-        # Load the task tree
-        loader = TaskLoader(tmp_diverse_tasks_dir / ".tasks")
-        tree = loader.load()
-
-        # Create calculator
-        complexity_multipliers = {"low": 1.0, "medium": 1.5, "high": 2.0, "critical": 3.0}
-        calculator = CriticalPathCalculator(tree, complexity_multipliers)
+        tree = diverse_tree
 
         # Get tasks
-        primary_task = tree.find_task("P1.M1.E1.T001")  # Phase 1, Milestone 1
-        candidate_task = tree.find_task("P2.M1.E1.T001")  # Phase 2
-        selected_task = tree.find_task("P1.M2.E1.T001")  # Phase 1, Milestone 2
+        primary_task = tree._task_index["P1.M1.E1.T001"]  # Phase 1, Milestone 1
+        candidate_task = tree._task_index["P2.M1.E1.T001"]  # Phase 2
+        selected_task = tree._task_index["P1.M2.E1.T001"]  # Phase 1, Milestone 2
 
         assert all([primary_task, candidate_task, selected_task])
 
@@ -570,23 +577,17 @@ class TestDiversitySelection:
         assert score_with_selected > score_no_selected, \
             "Score should increase when candidate is different from selected tasks"
 
-    def test_realistic_multi_selection_scenario(self, tmp_diverse_tasks_dir):
+    def test_realistic_multi_selection_scenario(self, diverse_tree, calculator):
         """
         Realistic scenario: grab --multi should select tasks spread across the codebase.
 
         Given a primary task from P1.M1.E1, when selecting 3 additional tasks,
         they should be maximally spread out (ideally from P2, P3, and P1.M2).
         """
-        # Load the task tree
-        loader = TaskLoader(tmp_diverse_tasks_dir / ".tasks")
-        tree = loader.load()
-
-        # Create calculator
-        complexity_multipliers = {"low": 1.0, "medium": 1.5, "high": 2.0, "critical": 3.0}
-        calculator = CriticalPathCalculator(tree, complexity_multipliers)
+        tree = diverse_tree
 
         # Use P1.M1.E1.T001 as primary task
-        primary_task = tree.find_task("P1.M1.E1.T001")
+        primary_task = tree._task_index["P1.M1.E1.T001"]
         assert primary_task is not None
 
         # Find 3 independent tasks - this simulates `grab --multi --count=3`
@@ -596,7 +597,7 @@ class TestDiversitySelection:
         assert len(independent) == 3
 
         # Analyze distribution
-        selected_tasks = [tree.find_task(tid) for tid in independent]
+        selected_tasks = [tree._task_index[tid] for tid in independent]
         phase_distribution = {}
         milestone_distribution = {}
 
@@ -625,3 +626,51 @@ class TestDiversitySelection:
 
         # None should be from the same epic as primary
         assert primary_task.epic_id not in epic_ids, "No task should be from primary task's epic"
+
+
+def test_calculate_reuses_cached_result_until_tree_changes(diverse_tree, tmp_path, monkeypatch):
+    """With a result cache, an unchanged tree skips building the graph."""
+    from backlog._cache import GraphResultCache
+
+    builds = []
+    build_graph = CriticalPathCalculator._build_graph
+
+    def counting_build_graph(self, explicit_only=False):
+        builds.append(explicit_only)
+        return build_graph(self, explicit_only=explicit_only)
+
+    monkeypatch.setattr(CriticalPathCalculator, "_build_graph", counting_build_graph)
+    tree = copy.deepcopy(diverse_tree)
+
+    expected = CriticalPathCalculator(tree, DIVERSITY_MULTIPLIERS).calculate()
+    assert len(builds) == 1
+    for _ in range(2):
+        calc = CriticalPathCalculator(tree, DIVERSITY_MULTIPLIERS, GraphResultCache(tmp_path))
+        assert calc.calculate() == expected
+    assert len(builds) == 2
+
+    tree.phases[0].milestones[0].epics[0].tasks[0].status = Status.DONE
+    CriticalPathCalculator(tree, DIVERSITY_MULTIPLIERS, GraphResultCache(tmp_path)).calculate()
+    assert len(builds) == 3
+
+
+def test_graph_result_cache_is_keyed_on_data_dir(diverse_tree, tmp_path, monkeypatch):
+    """Results stored for one data dir are not served for another from the same cwd."""
+    from backlog._cache import GraphResultCache
+
+    monkeypatch.chdir(tmp_path)
+    first = GraphResultCache(tmp_path / "a")
+    first.store("digest", "critical_path", ["P1.M1.E1.T001"])
+    assert first.load("digest") == {"critical_path": ["P1.M1.E1.T001"]}
+    assert GraphResultCache(tmp_path / "b").load("digest") == {}
+
+
+def test_calculate_without_result_cache_does_no_io(diverse_tree, tmp_path, monkeypatch):
+    """The calculator on its own never reads or writes the user cache dir."""
+    from backlog import _cache
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(_cache, "_cache_dir", lambda: pytest.fail("cache dir touched"))
+    calc = CriticalPathCalculator(copy.deepcopy(diverse_tree), DIVERSITY_MULTIPLIERS)
+    calc.calculate()
+    calc.find_cycle()
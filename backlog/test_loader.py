@@ -1,9 +1,14 @@
 """Tests for TaskLoader creation helpers."""
 
-import yaml
+import os
+import time
+
 import pytest
 
+from backlog._yaml import safe_dump_bytes, safe_load
+from backlog._fsutil import _ensure_dir, _forget_dir
 from backlog.loader import TaskLoader
+from backlog.models import Status
 
 
 @pytest.fixture
@@ -25,13 +30,11 @@ def tmp_empty_phase_dir(tmp_path, monkeypatch):
             }
         ],
     }
-    with open(tasks_dir / "index.yaml", "w") as f:
-        yaml.dump(root_index, f)
+    (tasks_dir / "index.yaml").write_bytes(safe_dump_bytes(root_index))
 
     phase_dir = tasks_dir / "01-phase-one"
     phase_dir.mkdir()
-    with open(phase_dir / "index.yaml", "w") as f:
-        yaml.dump({"milestones": []}, f)
+    (phase_dir / "index.yaml").write_bytes(safe_dump_bytes({"milestones": []}))
 
     monkeypatch.chdir(tmp_path)
     return tmp_path
@@ -48,17 +51,26 @@ def test_create_milestone_starts_numbering_at_m1(tmp_empty_phase_dir):
 
     phase_index_path = tmp_empty_phase_dir / ".tasks" / "01-phase-one" / "index.yaml"
     with open(phase_index_path) as f:
-        phase_index = yaml.safe_load(f)
+        phase_index = safe_load(f)
 
     assert phase_index["milestones"][0]["id"] == "M1"
 
 
+def test_create_milestone_with_emoji_name_keeps_tree_loadable(tmp_empty_phase_dir):
+    """Names outside the BMP are written with escapes libyaml can read back."""
+    loader = TaskLoader()
+    loader.create_milestone("P1", {"name": "Launch 🚀"})
+
+    tree = TaskLoader().load("metadata")
+    assert tree.phases[0].milestones[0].name == "Launch 🚀"
+
+
 def test_create_milestone_after_legacy_m0_uses_m1(tmp_empty_phase_dir):
     """Legacy M0 data should lead to next milestone being M1."""
     phase_dir = tmp_empty_phase_dir / ".tasks" / "01-phase-one"
 
-    with open(phase_dir / "index.yaml", "w") as f:
-        yaml.dump(
+    (phase_dir / "index.yaml").write_bytes(
+        safe_dump_bytes(
             {
                 "milestones": [
                     {
@@ -69,13 +81,12 @@ def test_create_milestone_after_legacy_m0_uses_m1(tmp_empty_phase_dir):
                     }
                 ]
             },
-            f,
         )
+    )
 
     legacy_dir = phase_dir / "00-legacy-milestone"
     legacy_dir.mkdir()
-    with open(legacy_dir / "index.yaml", "w") as f:
-        yaml.dump({"epics": []}, f)
+    (legacy_dir / "index.yaml").write_bytes(safe_dump_bytes({"epics": []}))
 
     loader = TaskLoader()
     milestone = loader.create_milestone("P1", {"name": "New Milestone"})
@@ -90,8 +101,8 @@ def test_loader_accepts_estimated_hours_alias(tmp_path, monkeypatch):
     epic_dir = tasks_dir / "01-phase" / "01-milestone" / "01-epic"
     epic_dir.mkdir(parents=True)
 
-    with open(tasks_dir / "index.yaml", "w") as f:
-        yaml.dump(
+    (tasks_dir / "index.yaml").write_bytes(
+        safe_dump_bytes(
             {
                 "project": "Alias Test",
                 "phases": [
@@ -103,12 +114,12 @@ def test_loader_accepts_estimated_hours_alias(tmp_path, monkeypatch):
                     }
                 ],
             },
-            f,
             sort_keys=False,
         )
+    )
 
-    with open(tasks_dir / "01-phase" / "index.yaml", "w") as f:
-        yaml.dump(
+    (tasks_dir / "01-phase" / "index.yaml").write_bytes(
+        safe_dump_bytes(
             {
                 "milestones": [
                     {
@@ -119,12 +130,12 @@ def test_loader_accepts_estimated_hours_alias(tmp_path, monkeypatch):
                     }
                 ]
             },
-            f,
             sort_keys=False,
         )
+    )
 
-    with open(tasks_dir / "01-phase" / "01-milestone" / "index.yaml", "w") as f:
-        yaml.dump(
+    (tasks_dir / "01-phase" / "01-milestone" / "index.yaml").write_bytes(
+        safe_dump_bytes(
             {
                 "epics": [
                     {
@@ -135,12 +146,12 @@ def test_loader_accepts_estimated_hours_alias(tmp_path, monkeypatch):
                     }
                 ]
             },
-            f,
             sort_keys=False,
         )
+    )
 
-    with open(epic_dir / "index.yaml", "w") as f:
-        yaml.dump(
+    (epic_dir / "index.yaml").write_bytes(
+        safe_dump_bytes(
             {
                 "tasks": [
                     {
@@ -155,9 +166,9 @@ def test_loader_accepts_estimated_hours_alias(tmp_path, monkeypatch):
                     }
                 ]
             },
-            f,
             sort_keys=False,
         )
+    )
 
     with open(epic_dir / "T001-alias.todo", "w") as f:
         f.write(
@@ -191,8 +202,8 @@ def test_loader_accepts_completed_status_alias(tmp_path, monkeypatch):
     epic_dir = tasks_dir / "01-phase" / "01-milestone" / "01-epic"
     epic_dir.mkdir(parents=True)
 
-    with open(tasks_dir / "index.yaml", "w") as f:
-        yaml.dump(
+    (tasks_dir / "index.yaml").write_bytes(
+        safe_dump_bytes(
             {
                 "project": "Status Alias Test",
                 "phases": [
@@ -203,12 +214,12 @@ def test_loader_accepts_completed_status_alias(tmp_path, monkeypatch):
                     }
                 ],
             },
-            f,
             sort_keys=False,
         )
+    )
 
-    with open(tasks_dir / "01-phase" / "index.yaml", "w") as f:
-        yaml.dump(
+    (tasks_dir / "01-phase" / "index.yaml").write_bytes(
+        safe_dump_bytes(
             {
                 "milestones": [
                     {
@@ -218,12 +229,12 @@ def test_loader_accepts_completed_status_alias(tmp_path, monkeypatch):
                     }
                 ]
             },
-            f,
             sort_keys=False,
         )
+    )
 
-    with open(tasks_dir / "01-phase" / "01-milestone" / "index.yaml", "w") as f:
-        yaml.dump(
+    (tasks_dir / "01-phase" / "01-milestone" / "index.yaml").write_bytes(
+        safe_dump_bytes(
             {
                 "epics": [
                     {
@@ -233,12 +244,12 @@ def test_loader_accepts_completed_status_alias(tmp_path, monkeypatch):
                     }
                 ]
             },
-            f,
             sort_keys=False,
         )
+    )
 
-    with open(epic_dir / "index.yaml", "w") as f:
-        yaml.dump(
+    (epic_dir / "index.yaml").write_bytes(
+        safe_dump_bytes(
             {
                 "tasks": [
                     {
@@ -253,9 +264,9 @@ def test_loader_accepts_completed_status_alias(tmp_path, monkeypatch):
                     }
                 ]
             },
-            f,
             sort_keys=False,
         )
+    )
 
     with open(epic_dir / "T001-status.todo", "w") as f:
         f.write(
@@ -288,8 +299,8 @@ def test_move_task_to_another_epic_renumbers_and_updates_ids(tmp_path, monkeypat
     src_epic_dir.mkdir(parents=True)
     dst_epic_dir.mkdir(parents=True)
 
-    (tasks_dir / "index.yaml").write_text(
-        yaml.dump(
+    (tasks_dir / "index.yaml").write_bytes(
+        safe_dump_bytes(
             {
                 "project": "Move Test",
                 "phases": [{"id": "P1", "name": "Phase", "path": "01-phase"}],
@@ -297,16 +308,16 @@ def test_move_task_to_another_epic_renumbers_and_updates_ids(tmp_path, monkeypat
             sort_keys=False,
         )
     )
-    (tasks_dir / "01-phase" / "index.yaml").write_text(
-        yaml.dump(
+    (tasks_dir / "01-phase" / "index.yaml").write_bytes(
+        safe_dump_bytes(
             {
                 "milestones": [{"id": "M1", "name": "M", "path": "01-milestone"}],
             },
             sort_keys=False,
         )
     )
-    (tasks_dir / "01-phase" / "01-milestone" / "index.yaml").write_text(
-        yaml.dump(
+    (tasks_dir / "01-phase" / "01-milestone" / "index.yaml").write_bytes(
+        safe_dump_bytes(
             {
                 "epics": [
                     {"id": "E1", "name": "Source", "path": "01-epic"},
@@ -316,8 +327,8 @@ def test_move_task_to_another_epic_renumbers_and_updates_ids(tmp_path, monkeypat
             sort_keys=False,
         )
     )
-    (src_epic_dir / "index.yaml").write_text(
-        yaml.dump(
+    (src_epic_dir / "index.yaml").write_bytes(
+        safe_dump_bytes(
             {
                 "id": "P1.M1.E1",
                 "name": "Source",
@@ -337,8 +348,8 @@ def test_move_task_to_another_epic_renumbers_and_updates_ids(tmp_path, monkeypat
             sort_keys=False,
         )
     )
-    (dst_epic_dir / "index.yaml").write_text(
-        yaml.dump({"id": "P1.M1.E2", "name": "Dest", "tasks": []}, sort_keys=False)
+    (dst_epic_dir / "index.yaml").write_bytes(
+        safe_dump_bytes({"id": "P1.M1.E2", "name": "Dest", "tasks": []}, sort_keys=False)
     )
     (src_epic_dir / "T001-move-me.todo").write_text(
         "---\n"
@@ -376,8 +387,8 @@ def test_move_epic_to_another_milestone_remaps_descendant_task_ids(
     src_epic_dir.mkdir(parents=True)
     dst_ms_dir.mkdir(parents=True)
 
-    (tasks_dir / "index.yaml").write_text(
-        yaml.dump(
+    (tasks_dir / "index.yaml").write_bytes(
+        safe_dump_bytes(
             {
                 "project": "Move Epic Test",
                 "phases": [{"id": "P1", "name": "Phase", "path": "01-phase"}],
@@ -385,8 +396,8 @@ def test_move_epic_to_another_milestone_remaps_descendant_task_ids(
             sort_keys=False,
         )
     )
-    (tasks_dir / "01-phase" / "index.yaml").write_text(
-        yaml.dump(
+    (tasks_dir / "01-phase" / "index.yaml").write_bytes(
+        safe_dump_bytes(
             {
                 "milestones": [
                     {"id": "M1", "name": "MS1", "path": "01-ms"},
@@ -396,15 +407,15 @@ def test_move_epic_to_another_milestone_remaps_descendant_task_ids(
             sort_keys=False,
         )
     )
-    (tasks_dir / "01-phase" / "01-ms" / "index.yaml").write_text(
-        yaml.dump(
+    (tasks_dir / "01-phase" / "01-ms" / "index.yaml").write_bytes(
+        safe_dump_bytes(
             {"epics": [{"id": "E1", "name": "Source Epic", "path": "01-epic"}]},
             sort_keys=False,
         )
     )
-    (dst_ms_dir / "index.yaml").write_text(yaml.dump({"epics": []}, sort_keys=False))
-    (src_epic_dir / "index.yaml").write_text(
-        yaml.dump(
+    (dst_ms_dir / "index.yaml").write_bytes(safe_dump_bytes({"epics": []}, sort_keys=False))
+    (src_epic_dir / "index.yaml").write_bytes(
+        safe_dump_bytes(
             {
                 "id": "P1.M1.E1",
                 "name": "Source Epic",
@@ -438,55 +449,21 @@ def test_move_epic_to_another_milestone_remaps_descendant_task_ids(
     assert "id: P1.M2.E1.T001" in moved_task_text
 
 
-def test_load_with_benchmark_counts_tree_and_missing_files(tmp_path, monkeypatch):
-    """load_with_benchmark should return timing and file counts for normal loading."""
-    tasks_dir = tmp_path / ".tasks"
-    tasks_dir.mkdir()
-    phase_dir = tasks_dir / "01-phase"
-    milestone_dir = phase_dir / "01-ms"
-    epic_dir = milestone_dir / "01-epic"
-    epic_dir.mkdir(parents=True)
-
-    (tasks_dir / "index.yaml").write_text(
-        """
-project: Benchmark
-phases:
-  - id: P1
-    name: Phase
-    path: 01-phase
-""",
-        encoding="utf-8",
-    )
-    (phase_dir / "index.yaml").write_text(
-        """
-milestones:
-  - id: M1
-    name: Milestone
-    path: 01-ms
-""",
-        encoding="utf-8",
-    )
-    (milestone_dir / "index.yaml").write_text(
-        """
-epics:
-  - id: E1
-    name: Epic
-    path: 01-epic
-""",
-        encoding="utf-8",
-    )
-    (epic_dir / "index.yaml").write_text(
-        """
+# Epic files for the benchmark count test: T002 is listed but has no file.
+_BENCH_EPIC_FILES = (
+    (
+        "index.yaml",
+        b"""
 tasks:
   - id: T001
     file: T001-existing.todo
   - id: T002
     file: T002-missing.todo
 """,
-        encoding="utf-8",
-    )
-    (epic_dir / "T001-existing.todo").write_text(
-        """
+    ),
+    (
+        "T001-existing.todo",
+        b"""
 ---
 id: P1.M1.E1.T001
 title: Existing
@@ -495,8 +472,21 @@ status: pending
 
 Existing task body
 """,
-        encoding="utf-8",
-    )
+    ),
+)
+
+
+def test_load_with_benchmark_counts_tree_and_missing_files(tmp_path, monkeypatch, tasks_skeleton):
+    """load_with_benchmark should return timing and file counts for normal loading."""
+    tasks_dir = tasks_skeleton
+    epic_dir = tasks_dir / "01-phase" / "01-ms" / "01-epic"
+    for name, content in _BENCH_EPIC_FILES:
+        (epic_dir / name).write_bytes(content)
+    # Counts follow the indexes, not the directory layout: unlisted dirs and
+    # .todo files must not be counted.
+    orphan_dir = tasks_dir / "02-unlisted-phase" / "01-ms" / "01-epic"
+    orphan_dir.mkdir(parents=True)
+    (orphan_dir / "T001-orphan.todo").write_text("---\nid: P2.M1.E1.T001\n---\n")
 
     monkeypatch.chdir(tmp_path)
     tree, benchmark = TaskLoader(tasks_dir=str(tasks_dir)).load_with_benchmark()
@@ -514,42 +504,11 @@ Existing task body
     assert benchmark["task_body_parse_ms"] >= 0
 
 
-def test_load_metadata_uses_frontmatter_only(tmp_path, monkeypatch):
+def test_load_metadata_uses_frontmatter_only(tmp_path, monkeypatch, tasks_skeleton):
     """Metadata mode should avoid full .todo parsing."""
-    tasks_dir = tmp_path / ".tasks"
-    phase_dir = tasks_dir / "01-phase"
-    milestone_dir = phase_dir / "01-ms"
-    epic_dir = milestone_dir / "01-epic"
-    epic_dir.mkdir(parents=True)
+    tasks_dir = tasks_skeleton
+    epic_dir = tasks_dir / "01-phase" / "01-ms" / "01-epic"
 
-    (tasks_dir / "index.yaml").write_text(
-        """
-project: Metadata Load
-phases:
-  - id: P1
-    name: Phase
-    path: 01-phase
-""",
-        encoding="utf-8",
-    )
-    (phase_dir / "index.yaml").write_text(
-        """
-milestones:
-  - id: M1
-    name: Milestone
-    path: 01-ms
-""",
-        encoding="utf-8",
-    )
-    (milestone_dir / "index.yaml").write_text(
-        """
-epics:
-  - id: E1
-    name: Epic
-    path: 01-epic
-""",
-        encoding="utf-8",
-    )
     (epic_dir / "index.yaml").write_text(
         """
 tasks:
@@ -605,45 +564,15 @@ tasks:
     assert calls["todo_frontmatter"] == 1
 
 
-def test_load_metadata_can_disable_aux_loading(tmp_path, monkeypatch):
+def test_load_metadata_can_disable_aux_loading(tmp_path, monkeypatch, tasks_skeleton):
     """Metadata mode can skip bugs and ideas when aux parsing is disabled."""
-    tasks_dir = tmp_path / ".tasks"
-    phase_dir = tasks_dir / "01-phase"
-    milestone_dir = phase_dir / "01-ms"
-    epic_dir = milestone_dir / "01-epic"
+    tasks_dir = tasks_skeleton
+    epic_dir = tasks_dir / "01-phase" / "01-ms" / "01-epic"
     bugs_dir = tasks_dir / "bugs"
     ideas_dir = tasks_dir / "ideas"
-    for path in (epic_dir, bugs_dir, ideas_dir):
-        path.mkdir(parents=True)
+    bugs_dir.mkdir()
+    ideas_dir.mkdir()
 
-    (tasks_dir / "index.yaml").write_text(
-        """
-project: Metadata Aux Filter
-phases:
-  - id: P1
-    name: Phase
-    path: 01-phase
-""",
-        encoding="utf-8",
-    )
-    (phase_dir / "index.yaml").write_text(
-        """
-milestones:
-  - id: M1
-    name: Milestone
-    path: 01-ms
-""",
-        encoding="utf-8",
-    )
-    (milestone_dir / "index.yaml").write_text(
-        """
-epics:
-  - id: E1
-    name: Epic
-    path: 01-epic
-""",
-        encoding="utf-8",
-    )
     (epic_dir / "index.yaml").write_text(
         """
 tasks:
@@ -759,42 +688,11 @@ tags: []
     assert calls["todo_frontmatter"] == 1
 
 
-def test_load_index_mode_skips_task_file_reads(tmp_path, monkeypatch):
+def test_load_index_mode_skips_task_file_reads(tmp_path, monkeypatch, tasks_skeleton):
     """Index mode should load task metadata directly from index entries."""
-    tasks_dir = tmp_path / ".tasks"
-    phase_dir = tasks_dir / "01-phase"
-    milestone_dir = phase_dir / "01-ms"
-    epic_dir = milestone_dir / "01-epic"
-    epic_dir.mkdir(parents=True)
+    tasks_dir = tasks_skeleton
+    epic_dir = tasks_dir / "01-phase" / "01-ms" / "01-epic"
 
-    (tasks_dir / "index.yaml").write_text(
-        """
-project: Index Load
-phases:
-  - id: P1
-    name: Phase
-    path: 01-phase
-""",
-        encoding="utf-8",
-    )
-    (phase_dir / "index.yaml").write_text(
-        """
-milestones:
-  - id: M1
-    name: Milestone
-    path: 01-ms
-""",
-        encoding="utf-8",
-    )
-    (milestone_dir / "index.yaml").write_text(
-        """
-epics:
-  - id: E1
-    name: Epic
-    path: 01-epic
-""",
-        encoding="utf-8",
-    )
     (epic_dir / "index.yaml").write_text(
         """
 tasks:
@@ -857,40 +755,11 @@ tasks:
     assert calls["todo_frontmatter"] == 0
 
 
-def test_load_with_benchmark_full_mode_can_skip_task_body_parsing(tmp_path, monkeypatch):
+def test_load_with_benchmark_full_mode_can_skip_task_body_parsing(tmp_path, monkeypatch, tasks_skeleton):
     """Benchmark full mode can skip task body parsing when requested."""
-    tasks_dir = tmp_path / ".tasks"
+    tasks_dir = tasks_skeleton
     epic_dir = tasks_dir / "01-phase" / "01-ms" / "01-epic"
-    epic_dir.mkdir(parents=True)
 
-    (tasks_dir / "index.yaml").write_text(
-        """
-project: Benchmark Fast
-phases:
-  - id: P1
-    name: Phase
-    path: 01-phase
-""",
-        encoding="utf-8",
-    )
-    (tasks_dir / "01-phase" / "index.yaml").write_text(
-        """
-milestones:
-  - id: M1
-    name: Milestone
-    path: 01-ms
-""",
-        encoding="utf-8",
-    )
-    (tasks_dir / "01-phase" / "01-ms" / "index.yaml").write_text(
-        """
-epics:
-  - id: E1
-    name: Epic
-    path: 01-epic
-""",
-        encoding="utf-8",
-    )
     (epic_dir / "index.yaml").write_text(
         """
 tasks:
@@ -940,40 +809,11 @@ tasks:
     assert benchmark["task_body_parse_ms"] == 0
 
 
-def test_load_with_benchmark_index_mode_does_not_read_todo_files(tmp_path, monkeypatch):
+def test_load_with_benchmark_index_mode_does_not_read_todo_files(tmp_path, monkeypatch, tasks_skeleton):
     """Index benchmark mode should still count tasks without reading .todo files."""
-    tasks_dir = tmp_path / ".tasks"
+    tasks_dir = tasks_skeleton
     epic_dir = tasks_dir / "01-phase" / "01-ms" / "01-epic"
-    epic_dir.mkdir(parents=True)
 
-    (tasks_dir / "index.yaml").write_text(
-        """
-project: Benchmark Index
-phases:
-  - id: P1
-    name: Phase
-    path: 01-phase
-""",
-        encoding="utf-8",
-    )
-    (tasks_dir / "01-phase" / "index.yaml").write_text(
-        """
-milestones:
-  - id: M1
-    name: Milestone
-    path: 01-ms
-""",
-        encoding="utf-8",
-    )
-    (tasks_dir / "01-phase" / "01-ms" / "index.yaml").write_text(
-        """
-epics:
-  - id: E1
-    name: Epic
-    path: 01-epic
-""",
-        encoding="utf-8",
-    )
     (epic_dir / "index.yaml").write_text(
         """
 tasks:
@@ -1207,3 +1047,439 @@ tags: []
     tasks = task_tree.phases[0].milestones[0].epics[0].tasks
     assert len(tasks) == 1
     assert tasks[0].id == "P1.M1.E1.T002"
+
+
+def _age_tree(root, seconds=60):
+    """Push every mtime in a fixture tree into the past."""
+    stamp = time.time() - seconds
+    for path in [root, *root.rglob("*")]:
+        os.utime(path, (stamp, stamp))
+
+
+def test_load_reuses_cached_tree_until_files_change(tmp_path, monkeypatch):
+    """Repeated loads share one parse until an index or task file changes."""
+    tasks_dir = tmp_path / ".tasks"
+    epic_dir = tasks_dir / "01-phase" / "01-ms" / "01-epic"
+    epic_dir.mkdir(parents=True)
+    (tasks_dir / "index.yaml").write_text(
+        "project: Cached\nphases:\n  - id: P1\n    name: Phase\n    path: 01-phase\n",
+        encoding="utf-8",
+    )
+    (tasks_dir / "01-phase" / "index.yaml").write_text(
+        "milestones:\n  - id: M1\n    name: Milestone\n    path: 01-ms\n",
+        encoding="utf-8",
+    )
+    (tasks_dir / "01-phase" / "01-ms" / "index.yaml").write_text(
+        "epics:\n  - id: E1\n    name: Epic\n    path: 01-epic\n",
+        encoding="utf-8",
+    )
+    (epic_dir / "index.yaml").write_text(
+        "tasks:\n  - id: T001\n    file: T001-cached.todo\n",
+        encoding="utf-8",
+    )
+    todo_path = epic_dir / "T001-cached.todo"
+    todo_path.write_text(
+        "---\nid: P1.M1.E1.T001\ntitle: Cached\nstatus: pending\n---\n",
+        encoding="utf-8",
+    )
+    _age_tree(tasks_dir)
+
+    monkeypatch.chdir(tmp_path)
+    TaskLoader.clear_cache()
+    loader = TaskLoader()
+    calls = {"load_tree": 0}
+    original_load_tree = loader._load_tree
+
+    def load_tree(*args, **kwargs):
+        calls["load_tree"] += 1
+        return original_load_tree(*args, **kwargs)
+
+    monkeypatch.setattr(loader, "_load_tree", load_tree)
+
+    # The first load in a process is not memoized; the second one is.
+    loader.load()
+    first = loader.load()
+    first.find_task("P1.M1.E1.T001").title = "Mutated in memory"
+    second = loader.load()
+    assert calls["load_tree"] == 2
+    assert second.find_task("P1.M1.E1.T001").title == "Cached"
+
+    todo_path.write_text(
+        "---\nid: P1.M1.E1.T001\ntitle: Edited\nstatus: pending\n---\n",
+        encoding="utf-8",
+    )
+    third = loader.load()
+    assert calls["load_tree"] == 3
+    assert third.find_task("P1.M1.E1.T001").title == "Edited"
+
+
+def test_first_load_skips_tree_signature(tasks_skeleton, monkeypatch):
+    """A one-shot load with no disk cache does not walk the data dir for a signature."""
+    TaskLoader.clear_cache()
+    loader = TaskLoader(tasks_skeleton)
+    monkeypatch.setattr(loader, "_tree_signature", lambda: pytest.fail("signature computed"))
+    loader.load()
+
+
+def test_loaded_tree_does_not_alias_parsed_yaml(tasks_skeleton):
+    """Editing a loaded tree's lists leaves the shared parse cache untouched."""
+    milestone_index = tasks_skeleton / "01-phase" / "01-ms" / "index.yaml"
+    milestone_index.write_text(
+        "epics:\n  - id: E1\n    name: Epic\n    path: 01-epic\n    depends_on: [E0]\n"
+    )
+    _age_tree(tasks_skeleton)
+
+    TaskLoader.clear_cache()
+    loader = TaskLoader(tasks_skeleton)
+    epic = loader.load().phases[0].milestones[0].epics[0]
+    epic.depends_on.append("E9")
+    assert loader._load_yaml(milestone_index)["epics"][0]["depends_on"] == ["E0"]
+
+
+def test_load_sees_same_size_save_within_one_mtime_tick(tasks_skeleton):
+    """The loader's own writes invalidate memoized trees, even when stat fields match."""
+    epic_dir = tasks_skeleton / "01-phase" / "01-ms" / "01-epic"
+    (epic_dir / "index.yaml").write_text("tasks:\n  - id: T001\n    file: T001-a.todo\n")
+    todo_path = epic_dir / "T001-a.todo"
+    todo_path.write_text("---\nid: P1.M1.E1.T001\ntitle: Tick\nstatus: pending\n---\n")
+    TaskLoader.clear_cache()
+    loader = TaskLoader(tasks_skeleton)
+    # Normalize the file to save_task's layout, then age it past the racy window.
+    loader.save_task(loader.load().find_task("P1.M1.E1.T001"))
+    _age_tree(tasks_skeleton)
+    before = os.stat(todo_path)
+
+    task = loader.load().find_task("P1.M1.E1.T001")
+    task.status = Status.BLOCKED  # "pending" -> "blocked": same length
+    loader.save_task(task)
+    # Simulate a filesystem whose timestamp tick hides the rewrite.
+    os.utime(todo_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert os.stat(todo_path).st_size == before.st_size
+
+    assert TaskLoader(tasks_skeleton).load().find_task("P1.M1.E1.T001").status is Status.BLOCKED
+    # A fresh process finds no stale entry in the user cache dir either.
+    TaskLoader.clear_cache()
+    assert TaskLoader(tasks_skeleton).load().find_task("P1.M1.E1.T001").status is Status.BLOCKED
+
+
+def test_racy_window_covers_whole_second_timestamps():
+    """Whole-second mtimes suggest a coarse filesystem, so the window widens."""
+    from backlog.loader import _racy_window_ns
+
+    assert _racy_window_ns(1_700_000_000_000_000_000) == 2_000_000_000
+    assert _racy_window_ns(1_700_000_000_123_456_789) == 20_000_000
+
+
+def test_load_yaml_reuses_parse_until_file_changes(tmp_path, monkeypatch):
+    """Unchanged index files are parsed once; edits are picked up."""
+    import backlog.loader as loader_module
+
+    index_path = tmp_path / "index.yaml"
+    index_path.write_text("tasks:\n  - id: T001\n", encoding="utf-8")
+    _age_tree(tmp_path)
+
+    TaskLoader.clear_cache()
+    loader = TaskLoader(tmp_path)
+    calls = {"parse": 0}
+    original_safe_load = loader_module.safe_load
+
+    def counting_safe_load(stream):
+        calls["parse"] += 1
+        return original_safe_load(stream)
+
+    monkeypatch.setattr(loader_module, "safe_load", counting_safe_load)
+
+    first = loader._load_yaml_for_update(index_path)
+    first["tasks"].append({"id": "T999"})
+    second = loader._load_yaml(index_path)
+    assert calls["parse"] == 1
+    assert second == {"tasks": [{"id": "T001"}]}
+
+    index_path.write_text("tasks:\n  - id: T001\n  - id: T002\n", encoding="utf-8")
+    _age_tree(tmp_path, seconds=30)
+    third = loader._load_yaml(index_path)
+    assert calls["parse"] == 2
+    assert [t["id"] for t in third["tasks"]] == ["T001", "T002"]
+
+
+def test_load_yaml_caches_fresh_files_by_content(tmp_path, monkeypatch):
+    """Files inside the racy window are cached on content, not stat fields."""
+    import backlog.loader as loader_module
+
+    index_path = tmp_path / "index.yaml"
+    index_path.write_text("tasks:\n  - id: T001\n", encoding="utf-8")
+
+    TaskLoader.clear_cache()
+    loader = TaskLoader(tmp_path)
+    calls = {"parse": 0}
+    original_safe_load = loader_module.safe_load
+
+    def counting_safe_load(stream):
+        calls["parse"] += 1
+        return original_safe_load(stream)
+
+    monkeypatch.setattr(loader_module, "safe_load", counting_safe_load)
+    monkeypatch.setattr(loader_module, "_RACY_WINDOW_NS", 10**18)
+
+    first = loader._load_yaml_for_update(index_path)
+    first["tasks"].clear()
+    index_path.write_text("tasks:\n  - id: T001\n", encoding="utf-8")
+    second = loader._load_yaml(index_path)
+    assert calls["parse"] == 1
+    assert second == {"tasks": [{"id": "T001"}]}
+
+    index_path.write_text("tasks:\n  - id: T002\n", encoding="utf-8")
+    third = loader._load_yaml(index_path)
+    assert calls["parse"] == 2
+    assert third == {"tasks": [{"id": "T002"}]}
+
+
+def test_load_yaml_sees_loader_write_with_same_size_and_mtime(tmp_path):
+    """_write_yaml drops the parse cache entry even when the stat fields match."""
+    index_path = tmp_path / "index.yaml"
+    TaskLoader.clear_cache()
+    loader = TaskLoader(tmp_path)
+    loader._write_yaml(index_path, {"tasks": [{"id": "T001"}]})
+    _age_tree(tmp_path)
+    before = os.stat(index_path)
+    assert loader._load_yaml(index_path) == {"tasks": [{"id": "T001"}]}
+
+    loader._write_yaml(index_path, {"tasks": [{"id": "T002"}]})
+    os.utime(index_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+    after = os.stat(index_path)
+    assert (after.st_size, after.st_mtime_ns, after.st_ino) == (
+        before.st_size,
+        before.st_mtime_ns,
+        before.st_ino,
+    )
+    assert loader._load_yaml(index_path) == {"tasks": [{"id": "T002"}]}
+
+
+def test_parse_todo_frontmatter_stops_at_closing_fence(tmp_path):
+    """Frontmatter spanning read blocks parses; the body is ignored."""
+    todo = tmp_path / "T001-long.todo"
+    notes = "x" * 9000
+    todo.write_bytes(
+        (
+            f"\ufeff---\r\nid: P1.M1.E1.T001\r\nnotes: {notes}\r\n---\r\n"
+            "# Body\n---\nnot: frontmatter\n"
+        ).encode("utf-8")
+    )
+
+    frontmatter = TaskLoader(tmp_path)._parse_todo_frontmatter(todo)
+    assert frontmatter == {"id": "P1.M1.E1.T001", "notes": notes}
+
+    plain = tmp_path / "T002-plain.todo"
+    plain.write_text("# No frontmatter\n---\nid: nope\n---\n", encoding="utf-8")
+    assert TaskLoader(tmp_path)._parse_todo_frontmatter(plain) == {}
+
+
+def test_ensure_dir_skips_known_dirs_until_forgotten(tmp_path):
+    """_ensure_dir remembers what it created; _forget_dir undoes that."""
+    epic_dir = tmp_path / "01-phase" / "01-ms" / "01-epic"
+    _ensure_dir(epic_dir)
+    assert epic_dir.is_dir()
+
+    milestone_dir = epic_dir.parent
+    milestone_dir.rename(tmp_path / "moved")
+    _ensure_dir(epic_dir.parent.parent)  # ancestor already known: no-op
+    assert not milestone_dir.exists()
+
+    _forget_dir(milestone_dir)
+    _ensure_dir(epic_dir)
+    assert epic_dir.is_dir()
+
+
+def test_apply_id_remap_rewrites_only_referencing_files(tmp_path):
+    """Files that never mention a remapped ID are left byte-for-byte alone."""
+    epic_dir = tmp_path / "01-phase" / "01-ms" / "01-epic"
+    epic_dir.mkdir(parents=True)
+    (tmp_path / "index.yaml").write_text("project: Remap\nphases: []\n", encoding="utf-8")
+    (epic_dir / "index.yaml").write_text(
+        "tasks:\n  - id: P1.M1.E1.T001\n    file: T001-a.todo\n", encoding="utf-8"
+    )
+    moved = epic_dir / "T001-a.todo"
+    moved.write_text("---\nid: P1.M1.E1.T001\n---\nBody\n", encoding="utf-8")
+    untouched = epic_dir / "T002-b.todo"
+    untouched.write_text(
+        "---\nid: P1.M1.E1.T002\ndepends_on: []\n---\nMentions P1.M1.E1.T001 in body\n",
+        encoding="utf-8",
+    )
+    _age_tree(tmp_path)
+    before = {p: p.stat().st_mtime_ns for p in (tmp_path / "index.yaml", untouched)}
+
+    TaskLoader(tmp_path)._apply_id_remap({"P1.M1.E1.T001": "P1.M1.E2.T001"})
+
+    assert "id: P1.M1.E2.T001" in moved.read_text(encoding="utf-8")
+    assert "P1.M1.E2.T001" in (epic_dir / "index.yaml").read_text(encoding="utf-8")
+    assert {p: p.stat().st_mtime_ns for p in before} == before
+
+
+def test_load_large_epic_keeps_task_order(tmp_path):
+    """Epic tasks load in index order, not file-name order."""
+    epic_dir = tmp_path / "01-phase" / "01-ms" / "01-epic"
+    epic_dir.mkdir(parents=True)
+    (tmp_path / "index.yaml").write_text(
+        "project: Pool\nphases:\n  - id: P1\n    name: Phase\n    path: 01-phase\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "01-phase" / "index.yaml").write_text(
+        "milestones:\n  - id: M1\n    name: Milestone\n    path: 01-ms\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "01-phase" / "01-ms" / "index.yaml").write_text(
+        "epics:\n  - id: E1\n    name: Epic\n    path: 01-epic\n",
+        encoding="utf-8",
+    )
+    entries = []
+    for num in range(12, 0, -1):
+        short = f"T{num:03d}"
+        entries.append(f"  - id: {short}\n    file: {short}-task.todo\n")
+        (epic_dir / f"{short}-task.todo").write_text(
+            f"---\nid: P1.M1.E1.{short}\ntitle: Task {num}\nstatus: pending\n---\n",
+            encoding="utf-8",
+        )
+    (epic_dir / "index.yaml").write_text("tasks:\n" + "".join(entries), encoding="utf-8")
+
+    TaskLoader.clear_cache()
+    tasks = TaskLoader(tmp_path).load("metadata").phases[0].milestones[0].epics[0].tasks
+    assert [t.title for t in tasks] == [f"Task {num}" for num in range(12, 0, -1)]
+
+
+def test_scan_index_ids_reads_only_top_level_entry_ids(tmp_path):
+    """The event-stream scan ignores nested ids and other keys."""
+    index_path = tmp_path / "index.yaml"
+    index_path.write_text(
+        """
+# Milestone: Scan
+id: P1.M1
+stats: {id: ignored}
+epics:
+  - id: E1
+    name: First
+    depends_on: [{id: E9}]
+    description: |
+      id: E8
+  - {id: P1.M1.E4, path: 04-flow}
+  - name: No id
+other:
+  - id: E7
+""",
+        encoding="utf-8",
+    )
+
+    loader = TaskLoader(tmp_path)
+    assert loader._scan_index_ids(index_path, "epics") == ["E1", "P1.M1.E4"]
+    assert loader._get_next_epic_number(tmp_path) == 5
+
+
+@pytest.mark.parametrize(
+    "name", ["Core API", "yes", "1.5", "x: y", "# tag", "- dash", "héllo", "Launch 🚀", "trailing "]
+)
+def test_dump_milestone_index_round_trips_like_safe_dump(name):
+    """The template emitter quotes whatever plain YAML would misread."""
+    from backlog._yaml_fast import dump_milestone_index
+
+    index = {
+        "id": "P1.M2",
+        "name": name,
+        "status": "pending",
+        "estimate_hours": 1e20,
+        "complexity": "medium",
+        "depends_on": ["P1.M1", "no"],
+        "locked": False,
+        "epics": [],
+        "stats": {"total_tasks": 0, "done": 0, "in_progress": 0, "blocked": 0, "pending": 0},
+    }
+    assert safe_load(dump_milestone_index(index)) == index
+
+
+def test_load_reuses_on_disk_tree_cache_across_processes(tasks_skeleton, monkeypatch):
+    """A fresh process (empty memory cache) reads the tree from the user cache dir."""
+    epic_dir = tasks_skeleton / "01-phase" / "01-ms" / "01-epic"
+    (epic_dir / "index.yaml").write_text("tasks:\n  - id: T001\n    file: T001-a.todo\n")
+    (epic_dir / "T001-a.todo").write_text("---\nid: P1.M1.E1.T001\ntitle: Disk\n---\n")
+    _age_tree(tasks_skeleton)
+    monkeypatch.setenv("BACKLOG_DISK_CACHE", "1")
+
+    TaskLoader.clear_cache()
+    first = TaskLoader(tasks_skeleton).load()
+
+    TaskLoader.clear_cache()
+    loader = TaskLoader(tasks_skeleton)
+    monkeypatch.setattr(
+        loader, "_load_tree", lambda **kwargs: pytest.fail("expected on-disk cache hit")
+    )
+    assert loader.load() == first
+
+
+def test_load_skips_on_disk_tree_cache_unless_enabled(tasks_skeleton, tmp_path, monkeypatch):
+    """Without BACKLOG_DISK_CACHE the loader never touches the user cache dir."""
+    from backlog import _cache
+
+    _age_tree(tasks_skeleton)
+    monkeypatch.setattr(_cache, "_cache_dir", lambda: pytest.fail("cache dir touched"))
+
+    TaskLoader.clear_cache()
+    loader = TaskLoader(tasks_skeleton)
+    loader.load()
+    loader.save_stats(loader.load())
+
+
+def test_load_does_not_cache_trees_containing_symlinks(tasks_skeleton, tmp_path, monkeypatch):
+    """Edits behind a symlinked directory are always picked up."""
+    epic_dir = tasks_skeleton / "01-phase" / "01-ms" / "01-epic"
+    outside = tmp_path / "outside-epic"
+    epic_dir.rename(outside)
+    epic_dir.symlink_to(outside, target_is_directory=True)
+    (outside / "index.yaml").write_text("tasks:\n  - id: T001\n    file: T001-a.todo\n")
+    todo_path = outside / "T001-a.todo"
+    todo_path.write_text("---\nid: P1.M1.E1.T001\ntitle: Before\n---\n")
+    _age_tree(tasks_skeleton)
+    _age_tree(outside)
+    monkeypatch.setenv("BACKLOG_DISK_CACHE", "1")
+
+    TaskLoader.clear_cache()
+    loader = TaskLoader(tasks_skeleton)
+    assert loader.load().find_task("P1.M1.E1.T001").title == "Before"
+
+    todo_path.write_text("---\nid: P1.M1.E1.T001\ntitle: After!\n---\n")
+    TaskLoader.clear_cache()
+    assert TaskLoader(tasks_skeleton).load().find_task("P1.M1.E1.T001").title == "After!"
+
+
+def test_tree_cache_stamp_covers_loader_code(tmp_path, monkeypatch):
+    """Editing loader.py invalidates pickled trees, not just models.py."""
+    from backlog import _cache
+    import backlog.loader as loader_module
+
+    real_stat = os.stat
+    before = _cache._code_stamp()
+
+    def stat(path, *args, **kwargs):
+        st = real_stat(path, *args, **kwargs)
+        if os.fspath(path) == loader_module.__file__:
+            return os.stat_result((*st[:8], st.st_mtime + 1, st.st_ctime))
+        return st
+
+    monkeypatch.setattr(_cache.os, "stat", stat)
+    assert _cache._code_stamp() != before
+
+
+def test_tree_cache_evicts_least_recently_used_entries(tmp_path, monkeypatch):
+    """Only the newest _MAX_ENTRIES trees stay in the cache dir."""
+    from backlog import _cache
+    from backlog.models import TaskTree
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(_cache, "_MAX_ENTRIES", 2)
+    for n in range(3):
+        _cache.store_tree((f"dir{n}",), (n,), TaskTree(f"p{n}", "", 1))
+        path = _cache._entry_path((f"dir{n}",))
+        os.utime(path, ns=(n * 10**9, n * 10**9))
+    # Reading the oldest surviving entry marks it as recently used.
+    assert _cache.load_tree(("dir1",), (1,)) is not None
+    _cache.store_tree(("dir3",), (3,), TaskTree("p3", "", 1))
+
+    kept = sorted(p.name for p in _cache._cache_dir().glob("tree-*"))
+    assert kept == sorted(_cache._entry_path((f"dir{n}",)).name for n in (1, 3))
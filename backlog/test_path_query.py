@@ -29,3 +29,11 @@ def test_parse_rejects_invalid_queries():
         PathQuery.parse("P1.M1*2")
     with pytest.raises(ValueError):
         PathQuery.parse("P1..M2")
+
+
+def test_parsed_queries_are_immutable_and_hashable():
+    query = PathQuery.parse("P1.M*")
+    assert query == PathQuery.parse(" P1.M* ")
+    assert len({query, PathQuery.parse("P1.M*")}) == 1
+    with pytest.raises(AttributeError):
+        query.raw = "P2"
@@ -1,22 +1,34 @@
-"""Tests for the skills install command."""
+"""Tests for the skills install command.
+
+Tests that only inspect generated content read from ``rendered_skills``;
+the rest go through the CLI to cover option parsing and output.
+"""
 
 import json
 
-import pytest
-import yaml
-from click.testing import CliRunner
 import click
+import pytest
 
-from backlog.cli import cli
+from backlog._yaml import safe_load
+from backlog.commands.skills import run_install
 
 
-@pytest.fixture
-def runner():
-    """CLI runner fixture."""
-    return CliRunner()
+@pytest.fixture(scope="session")
+def rendered_skills(tmp_path_factory):
+    """Install every skill and command for every client once per session.
 
+    Layout follows ``--dir``: ``skills/<client>/<skill>/...`` and
+    ``commands/<client>/<skill>.md``. Runs from an empty cwd so no project
+    config changes the rendered content.
+    """
+    root = tmp_path_factory.mktemp("rendered_skills")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(root)
+        run_install(("all",), artifact="both", output_dir=root / "out")
+    return root / "out"
 
-def test_install_default_local_common_skills(runner, tmp_path, monkeypatch):
+
+def test_install_default_local_common_skills(runner, cli, tmp_path, monkeypatch):
     """Default install should write skills for codex, claude, and opencode."""
     monkeypatch.chdir(tmp_path)
 
@@ -29,7 +41,9 @@ def test_install_default_local_common_skills(runner, tmp_path, monkeypatch):
     assert (tmp_path / ".opencode/skills/plan-ingest/SKILL.md").exists()
 
 
-def test_install_prompts_for_client_when_interactive(runner, tmp_path, monkeypatch):
+def test_install_prompts_for_client_when_interactive(
+    runner, cli, tmp_path, monkeypatch
+):
     """Interactive install without --client should prompt and honor selection."""
     monkeypatch.chdir(tmp_path)
 
@@ -47,51 +61,46 @@ def test_install_prompts_for_client_when_interactive(runner, tmp_path, monkeypat
     assert not (tmp_path / ".agents/skills/plan-task/SKILL.md").exists()
 
 
-def test_plan_ingest_template_contains_out_of_order_assignment(
-    runner, tmp_path, monkeypatch
-):
+def test_plan_ingest_template_contains_out_of_order_assignment(rendered_skills):
     """Generated plan-ingest template should encode out-of-order epic assignment."""
-    monkeypatch.chdir(tmp_path)
-
-    result = runner.invoke(cli, ["skills", "install", "plan-ingest", "--client=codex"])
-
-    assert result.exit_code == 0
-    content = (tmp_path / ".agents/skills/plan-ingest/SKILL.md").read_text()
+    content = (rendered_skills / "skills/codex/plan-ingest/SKILL.md").read_text()
     assert "Assign epic decomposition out of order" in content
     assert "topological + farthest-first" in content
 
 
-def test_start_tasks_template_contains_execution_loop(runner, tmp_path, monkeypatch):
+def test_start_tasks_template_contains_execution_loop(rendered_skills):
     """Generated start-tasks template should encode grab/cycle loop guidance."""
-    monkeypatch.chdir(tmp_path)
-
-    result = runner.invoke(cli, ["skills", "install", "start-tasks", "--client=codex"])
-
-    assert result.exit_code == 0
-    content = (tmp_path / ".agents/skills/start-tasks/SKILL.md").read_text()
+    content = (rendered_skills / "skills/codex/start-tasks/SKILL.md").read_text()
     assert "tasks grab" in content
     assert "tasks cycle" in content
     assert "Repeat indefinitely" in content
     assert "Avoid Repeated `--help`" in content
 
 
-def test_start_tasks_frontmatter_is_valid_yaml(runner, tmp_path, monkeypatch):
-    """Generated start-tasks SKILL.md frontmatter should parse as valid YAML."""
-    monkeypatch.chdir(tmp_path)
-
-    result = runner.invoke(cli, ["skills", "install", "start-tasks", "--client=codex"])
-    assert result.exit_code == 0
-
-    content = (tmp_path / ".agents/skills/start-tasks/SKILL.md").read_text()
+def test_start_tasks_frontmatter_names_skill_and_loop(rendered_skills):
+    """Generated start-tasks SKILL.md frontmatter should name the grab loop."""
+    content = (rendered_skills / "skills/codex/start-tasks/SKILL.md").read_text()
     parts = content.split("---", 2)
     assert len(parts) >= 3
-    frontmatter = yaml.safe_load(parts[1])
 
-    assert frontmatter["name"] == "start-tasks"
-    assert "tasks grab" in frontmatter["description"]
+    assert "\nname: start-tasks\n" in parts[1]
+    assert "tasks grab" in parts[1]
+
+
+def test_skill_frontmatter_is_valid_yaml(rendered_skills):
+    """Every generated SKILL.md frontmatter should parse as a YAML mapping."""
+    skill_files = sorted(rendered_skills.glob("skills/*/*/SKILL.md"))
+    assert skill_files
+
+    for path in skill_files:
+        parts = path.read_text().split("---", 2)
+        assert len(parts) >= 3, path
+        frontmatter = safe_load(parts[1])
+        assert frontmatter["name"] == path.parent.name, path
+        assert isinstance(frontmatter["description"], str), path
 
 
-def test_all_includes_start_tasks_skill(runner, tmp_path, monkeypatch):
+def test_all_includes_start_tasks_skill(runner, cli, tmp_path, monkeypatch):
     """Installing 'all' should include start-tasks and backlog-howto skills."""
     monkeypatch.chdir(tmp_path)
 
@@ -104,19 +113,14 @@ def test_all_includes_start_tasks_skill(runner, tmp_path, monkeypatch):
     assert (tmp_path / ".agents/skills/backlog-howto/SKILL.md").exists()
 
 
-def test_backlog_howto_skill_contains_version(runner, tmp_path, monkeypatch):
+def test_backlog_howto_skill_contains_version(rendered_skills):
     """Generated backlog-howto skill should include a skill version marker."""
-    monkeypatch.chdir(tmp_path)
-
-    result = runner.invoke(cli, ["skills", "install", "backlog-howto", "--client=codex"])
-
-    assert result.exit_code == 0
-    content = (tmp_path / ".agents/skills/backlog-howto/SKILL.md").read_text()
+    content = (rendered_skills / "skills/codex/backlog-howto/SKILL.md").read_text()
     assert "name: backlog-howto" in content
     assert "Skill-Version:" in content
 
 
-def test_commands_artifact_skips_codex_with_warning(runner, tmp_path, monkeypatch):
+def test_commands_artifact_skips_codex_with_warning(runner, cli, tmp_path, monkeypatch):
     """Commands should be skipped for codex and installed for claude/opencode."""
     monkeypatch.chdir(tmp_path)
 
@@ -138,7 +142,9 @@ def test_commands_artifact_skips_codex_with_warning(runner, tmp_path, monkeypatc
     assert not (tmp_path / ".agents/commands/plan-task.md").exists()
 
 
-def test_dir_with_both_artifacts_writes_expected_layout(runner, tmp_path, monkeypatch):
+def test_dir_with_both_artifacts_writes_expected_layout(
+    runner, cli, tmp_path, monkeypatch
+):
     """--dir should emit client-scoped skills and commands trees."""
     monkeypatch.chdir(tmp_path)
     out = tmp_path / "out"
@@ -165,7 +171,7 @@ def test_dir_with_both_artifacts_writes_expected_layout(runner, tmp_path, monkey
     assert not (out / "commands/codex/plan-task.md").exists()
 
 
-def test_global_scope_uses_canonical_locations(runner, tmp_path, monkeypatch):
+def test_global_scope_uses_canonical_locations(runner, cli, tmp_path, monkeypatch):
     """Global install should target canonical client home directories."""
     monkeypatch.chdir(tmp_path)
     monkeypatch.setenv("HOME", str(tmp_path))
@@ -189,7 +195,7 @@ def test_global_scope_uses_canonical_locations(runner, tmp_path, monkeypatch):
     assert (tmp_path / ".config/opencode/skills/plan-task/SKILL.md").exists()
 
 
-def test_codex_home_override_is_respected(runner, tmp_path, monkeypatch):
+def test_codex_home_override_is_respected(runner, cli, tmp_path, monkeypatch):
     """CODEX_HOME should override codex global install location."""
     monkeypatch.chdir(tmp_path)
     monkeypatch.setenv("HOME", str(tmp_path))
@@ -211,7 +217,7 @@ def test_codex_home_override_is_respected(runner, tmp_path, monkeypatch):
     assert (tmp_path / "legacy-codex-home/skills/plan-task/SKILL.md").exists()
 
 
-def test_conflict_requires_force(runner, tmp_path, monkeypatch):
+def test_conflict_requires_force(runner, cli, tmp_path, monkeypatch):
     """Second install without --force should fail on existing files."""
     monkeypatch.chdir(tmp_path)
 
@@ -223,7 +229,9 @@ def test_conflict_requires_force(runner, tmp_path, monkeypatch):
     assert "Refusing to overwrite existing files" in second.output
 
 
-def test_partial_conflicts_still_install_missing_targets(runner, tmp_path, monkeypatch):
+def test_partial_conflicts_still_install_missing_targets(
+    runner, cli, tmp_path, monkeypatch
+):
     """When some targets already exist, installer should skip them and write missing files."""
     monkeypatch.chdir(tmp_path)
 
@@ -238,7 +246,7 @@ def test_partial_conflicts_still_install_missing_targets(runner, tmp_path, monke
     assert (tmp_path / ".agents/skills/start-tasks/SKILL.md").exists()
 
 
-def test_dry_run_writes_nothing(runner, tmp_path, monkeypatch):
+def test_dry_run_writes_nothing(runner, cli, tmp_path, monkeypatch):
     """Dry-run should not write files."""
     monkeypatch.chdir(tmp_path)
 
@@ -252,7 +260,7 @@ def test_dry_run_writes_nothing(runner, tmp_path, monkeypatch):
     assert not (tmp_path / ".agents/skills/plan-task/SKILL.md").exists()
 
 
-def test_json_output_shape(runner, tmp_path, monkeypatch):
+def test_json_output_shape(runner, cli, tmp_path, monkeypatch):
     """JSON output should include operations and warnings."""
     monkeypatch.chdir(tmp_path)
 
@@ -278,79 +286,33 @@ def test_json_output_shape(runner, tmp_path, monkeypatch):
     assert any("codex does not support" in w for w in payload["warnings"])
 
 
-def test_opencode_commands_use_opencode_frontmatter(runner, tmp_path, monkeypatch):
+def test_opencode_commands_use_opencode_frontmatter(rendered_skills):
     """OpenCode command templates should avoid Claude-specific keys."""
-    monkeypatch.chdir(tmp_path)
-
-    result = runner.invoke(
-        cli,
-        ["skills", "install", "plan-task", "--client=opencode", "--artifact=commands"],
-    )
-
-    assert result.exit_code == 0
-    command = (tmp_path / ".opencode/commands/plan-task.md").read_text()
+    command = (rendered_skills / "commands/opencode/plan-task.md").read_text()
     assert "description:" in command
     assert "argument-hint:" not in command
     assert "\nname:" not in command
 
 
-def test_claude_skills_omit_codex_metadata_block(runner, tmp_path, monkeypatch):
+def test_claude_skills_omit_codex_metadata_block(rendered_skills):
     """Claude skills should use Claude-compatible frontmatter keys only."""
-    monkeypatch.chdir(tmp_path)
-
-    result = runner.invoke(
-        cli,
-        ["skills", "install", "plan-ingest", "--client=claude", "--artifact=skills"],
-    )
-
-    assert result.exit_code == 0
-    skill = (tmp_path / ".claude/skills/plan-ingest/SKILL.md").read_text()
+    skill = (rendered_skills / "skills/claude/plan-ingest/SKILL.md").read_text()
     assert "name: plan-ingest" in skill
     assert "description:" in skill
     assert "metadata:" not in skill
 
 
-def test_start_tasks_opencode_command_uses_expected_frontmatter(
-    runner, tmp_path, monkeypatch
-):
+def test_start_tasks_opencode_command_uses_expected_frontmatter(rendered_skills):
     """OpenCode start-tasks command should include loop instructions without argument-hint."""
-    monkeypatch.chdir(tmp_path)
-
-    result = runner.invoke(
-        cli,
-        [
-            "skills",
-            "install",
-            "start-tasks",
-            "--client=opencode",
-            "--artifact=commands",
-        ],
-    )
-
-    assert result.exit_code == 0
-    command = (tmp_path / ".opencode/commands/start-tasks.md").read_text()
+    command = (rendered_skills / "commands/opencode/start-tasks.md").read_text()
     assert "description:" in command
     assert "argument-hint:" not in command
     assert "tasks grab" in command
     assert "tasks cycle" in command
 
 
-def test_backlog_howto_command_references_canonical_source(runner, tmp_path, monkeypatch):
+def test_backlog_howto_command_references_canonical_source(rendered_skills):
     """backlog-howto command artifact should include source and version references."""
-    monkeypatch.chdir(tmp_path)
-
-    result = runner.invoke(
-        cli,
-        [
-            "skills",
-            "install",
-            "backlog-howto",
-            "--client=opencode",
-            "--artifact=commands",
-        ],
-    )
-
-    assert result.exit_code == 0
-    command = (tmp_path / ".opencode/commands/backlog-howto.md").read_text()
+    command = (rendered_skills / "commands/opencode/backlog-howto.md").read_text()
     assert "bl_skills/backlog-howto/SKILL.md" in command
     assert "Skill-Version:" in command
@@ -1,31 +1,32 @@
 """Focused tests for workflow and report command branches."""
 
+import shutil
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
-import yaml
-from click.testing import CliRunner
 
-from backlog.cli import cli
+from backlog._yaml import safe_dump, safe_load
+from backlog._yaml_fast import _scalar
 from backlog.helpers import get_current_task_id, load_context, set_current_task
 from backlog.loader import TaskLoader
 from backlog.models import Status
 
 
+_SLUG_TABLE = str.maketrans({" ": "-", "/": "-", ":": None, ",": None})
+
+
 def _task_filename(task_id: str, title: str) -> str:
-    short = task_id.split(".")[-1]
-    slug = (
-        title.lower()
-        .replace(" ", "-")
-        .replace("/", "-")
-        .replace(":", "")
-        .replace(",", "")
-    )
+    short = task_id.rpartition(".")[2]
+    slug = title.lower().translate(_SLUG_TABLE)
     return f"{short}-{slug}.todo"
 
 
-def _write_task(epic_dir: Path, task_id: str, title: str, overrides: dict) -> dict:
+_TASK_TEMPLATE = "---\n{frontmatter}---\n\n# {title}\n\nTask details.\n"
+
+
+def _render_task(task_id: str, title: str, overrides: dict) -> tuple[str, str, dict]:
+    """Return (filename, file content, epic index entry) for a task."""
     filename = _task_filename(task_id, title)
     frontmatter = {
         "id": task_id,
@@ -39,16 +40,11 @@ def _write_task(epic_dir: Path, task_id: str, title: str, overrides: dict) -> di
     }
     frontmatter.update(overrides)
 
-    content = (
-        "---\n"
-        f"{yaml.dump(frontmatter, default_flow_style=False)}"
-        "---\n\n"
-        f"# {title}\n\n"
-        "Task details.\n"
+    content = _TASK_TEMPLATE.format(
+        frontmatter=safe_dump(frontmatter, default_flow_style=False, sort_keys=False),
+        title=title,
     )
-    (epic_dir / filename).write_text(content)
-
-    return {
+    entry = {
         "id": task_id,
         "title": title,
         "file": filename,
@@ -58,6 +54,41 @@ def _write_task(epic_dir: Path, task_id: str, title: str, overrides: dict) -> di
         "priority": frontmatter["priority"],
         "depends_on": frontmatter.get("depends_on", []),
     }
+    return filename, content, entry
+
+
+def _emit_tasks_index(entries: list[dict]) -> str:
+    """Render an epic index.yaml for _render_task entries without the emitter."""
+    lines = ["tasks:\n"]
+    for t in entries:
+        depends_on = ", ".join(_scalar(dep) for dep in t["depends_on"])
+        lines.append(
+            f"- id: {_scalar(t['id'])}\n"
+            f"  title: {_scalar(t['title'])}\n"
+            f"  file: {_scalar(t['file'])}\n"
+            f"  status: {_scalar(t['status'])}\n"
+            f"  estimate_hours: {_scalar(t['estimate_hours'])}\n"
+            f"  complexity: {_scalar(t['complexity'])}\n"
+            f"  priority: {_scalar(t['priority'])}\n"
+            f"  depends_on: [{depends_on}]\n"
+        )
+    return "".join(lines)
+
+
+def _write_files(files: dict[Path, bytes]) -> None:
+    """Create every parent directory once, then write each file."""
+    for parent in {path.parent for path in files}:
+        parent.mkdir(parents=True, exist_ok=True)
+    for path, content in files.items():
+        path.write_bytes(content)
+
+
+TASKS_ROOT = Path(".tasks")
+
+
+def _task_path(task) -> Path:
+    """Path of a task's .todo file, relative to the test's cwd."""
+    return TASKS_ROOT / task.file
 
 
 def _load_task(task_id: str):
@@ -66,96 +97,61 @@ def _load_task(task_id: str):
     return tree.find_task(task_id)
 
 
-def _save_task_fields(task_id: str, **fields) -> None:
+def _save_tasks(updates: dict) -> None:
+    """Apply {task_id: {field: value}} updates from a single tree load."""
     loader = TaskLoader()
     tree = loader.load()
-    task = tree.find_task(task_id)
-    assert task is not None
-    for key, value in fields.items():
-        setattr(task, key, value)
-    loader.save_task(task)
-
-
-@pytest.fixture
-def runner():
-    return CliRunner()
+    for task_id, fields in updates.items():
+        task = tree.find_task(task_id)
+        assert task is not None
+        for key, value in fields.items():
+            setattr(task, key, value)
+        loader.save_task(task)
 
 
-@pytest.fixture
-def tmp_workflow_reports_dir(tmp_path, monkeypatch):
-    now = datetime.now(timezone.utc)
-    tasks_dir = tmp_path / ".tasks"
-    tasks_dir.mkdir()
-
-    (tasks_dir / "index.yaml").write_text(
-        yaml.dump(
-            {
-                "project": "Workflow and Reports Project",
-                "description": "Target branch-heavy workflow/report behavior",
-                "timeline_weeks": 2,
-                "phases": [
-                    {
-                        "id": "P1",
-                        "name": "Phase One",
-                        "path": "01-phase-one",
-                        "status": "in_progress",
-                    }
-                ],
-            }
-        )
-    )
-
-    phase_dir = tasks_dir / "01-phase-one"
-    phase_dir.mkdir()
-    (phase_dir / "index.yaml").write_text(
-        yaml.dump(
-            {
-                "milestones": [
-                    {
-                        "id": "M1",
-                        "name": "Milestone One",
-                        "path": "01-milestone-one",
-                        "status": "in_progress",
-                    }
-                ]
-            }
-        )
-    )
-
-    milestone_dir = phase_dir / "01-milestone-one"
-    milestone_dir.mkdir()
-    (milestone_dir / "index.yaml").write_text(
-        yaml.dump(
-            {
-                "epics": [
-                    {
-                        "id": "E1",
-                        "name": "Core Epic",
-                        "path": "01-core-epic",
-                        "status": "in_progress",
-                    },
-                    {
-                        "id": "E2",
-                        "name": "Feature Epic",
-                        "path": "02-feature-epic",
-                        "status": "in_progress",
-                    },
-                ]
-            }
-        )
-    )
-
-    e1_dir = milestone_dir / "01-core-epic"
-    e1_dir.mkdir()
-    e1_tasks = [
-        _write_task(
-            e1_dir,
+def _save_task_fields(task_id: str, **fields) -> None:
+    _save_tasks({task_id: fields})
+
+
+INDEX_PROJECT_YAML = """\
+project: Workflow and Reports Project
+description: Target branch-heavy workflow/report behavior
+timeline_weeks: 2
+phases:
+- id: P1
+  name: Phase One
+  path: 01-phase-one
+  status: in_progress
+"""
+
+INDEX_PHASE_YAML = """\
+milestones:
+- id: M1
+  name: Milestone One
+  path: 01-milestone-one
+  status: in_progress
+"""
+
+INDEX_MILESTONE_YAML = """\
+epics:
+- id: E1
+  name: Core Epic
+  path: 01-core-epic
+  status: in_progress
+- id: E2
+  name: Feature Epic
+  path: 02-feature-epic
+  status: in_progress
+"""
+
+_EPIC_TASKS = {
+    "01-core-epic": [
+        (
             "P1.M1.E1.T001",
             "Open API Endpoint",
             {"status": "pending", "priority": "high", "tags": ["core"]},
         ),
-        _write_task(
-            e1_dir,
+        (
             "P1.M1.E1.T002",
             "Refactor Auth Middleware",
             {
@@ -163,63 +159,131 @@ def tmp_workflow_reports_dir(tmp_path, monkeypatch):
                 "priority": "medium",
                 "depends_on": ["P1.M1.E1.T001"],
                 "claimed_by": "agent-a",
-                "claimed_at": (now - timedelta(hours=3)).isoformat(),
-                "started_at": (now - timedelta(hours=3)).isoformat(),
                 "tags": ["auth"],
             },
         ),
-        _write_task(
-            e1_dir,
+        (
             "P1.M1.E1.T003",
             "Write Migration Docs",
             {"status": "pending", "priority": "low", "tags": ["docs"]},
         ),
-    ]
-    (e1_dir / "index.yaml").write_text(yaml.dump({"tasks": e1_tasks}))
-
-    e2_dir = milestone_dir / "02-feature-epic"
-    e2_dir.mkdir()
-    e2_tasks = [
-        _write_task(
-            e2_dir,
+    ],
+    "02-feature-epic": [
+        (
             "P1.M1.E2.T001",
             "Baseline Delivery",
             {
                 "status": "done",
                 "priority": "high",
                 "estimate_hours": 2.0,
-                "started_at": (now - timedelta(days=1, hours=2)).isoformat(),
-                "completed_at": (now - timedelta(days=1)).isoformat(),
                 "duration_minutes": 120,
             },
         ),
-        _write_task(
-            e2_dir,
+        (
             "P1.M1.E2.T002",
             "Fast Follow Delivery",
             {
                 "status": "done",
                 "priority": "critical",
                 "estimate_hours": 3.0,
-                "started_at": (now - timedelta(hours=2)).isoformat(),
-                "completed_at": (now - timedelta(hours=1)).isoformat(),
                 "duration_minutes": 60,
             },
         ),
-        _write_task(
-            e2_dir,
+        (
             "P1.M1.E2.T003",
             "Pending Feature Expansion",
             {"status": "pending", "priority": "critical", "tags": ["feature"]},
         ),
-    ]
-    (e2_dir / "index.yaml").write_text(yaml.dump({"tasks": e2_tasks}))
+    ],
+}
+
+
+def _timed_fields(now: datetime) -> dict:
+    """Timestamps relative to now, keyed by task id."""
+    return {
+        "P1.M1.E1.T002": {
+            "claimed_at": (now - timedelta(hours=3)).isoformat(),
+            "started_at": (now - timedelta(hours=3)).isoformat(),
+        },
+        "P1.M1.E2.T001": {
+            "started_at": (now - timedelta(days=1, hours=2)).isoformat(),
+            "completed_at": (now - timedelta(days=1)).isoformat(),
+        },
+        "P1.M1.E2.T002": {
+            "started_at": (now - timedelta(hours=2)).isoformat(),
+            "completed_at": (now - timedelta(hours=1)).isoformat(),
+        },
+    }
+
+
+def _render_epic_task(
+    task_id: str, title: str, overrides: dict, timed: dict
+) -> tuple[str, str, dict]:
+    return _render_task(task_id, title, {**overrides, **timed.get(task_id, {})})
+
+
+@pytest.fixture(scope="session")
+def _workflow_reports_template(tmp_path_factory):
+    """Build the workflow/report ``.tasks`` tree once per session.
+
+    Task files carrying timestamps are rewritten per test by
+    ``tmp_workflow_reports_dir`` so they stay relative to that test's now.
+    """
+    tasks_dir = tmp_path_factory.mktemp("workflow_tpl") / ".tasks"
+    phase_dir = tasks_dir / "01-phase-one"
+    milestone_dir = phase_dir / "01-milestone-one"
+    files = {
+        tasks_dir / "index.yaml": INDEX_PROJECT_YAML.encode("utf-8"),
+        phase_dir / "index.yaml": INDEX_PHASE_YAML.encode("utf-8"),
+        milestone_dir / "index.yaml": INDEX_MILESTONE_YAML.encode("utf-8"),
+    }
+
+    timed = _timed_fields(datetime.now(timezone.utc))
+    for epic_path, specs in _EPIC_TASKS.items():
+        epic_dir = milestone_dir / epic_path
+        entries = []
+        for spec in specs:
+            filename, content, entry = _render_epic_task(*spec, timed)
+            files[epic_dir / filename] = content.encode("utf-8")
+            entries.append(entry)
+        files[epic_dir / "index.yaml"] = _emit_tasks_index(entries).encode("utf-8")
+    _write_files(files)
+
+    return tasks_dir
+
+
+@pytest.fixture
+def tmp_workflow_reports_dir(_workflow_reports_template, tmp_path, monkeypatch):
+    tasks_dir = shutil.copytree(_workflow_reports_template, tmp_path / ".tasks")
+    milestone_dir = Path(tasks_dir) / "01-phase-one" / "01-milestone-one"
+
+    timed = _timed_fields(datetime.now(timezone.utc))
+    files = {}
+    for epic_path, specs in _EPIC_TASKS.items():
+        for spec in specs:
+            if spec[0] in timed:
+                filename, content, _ = _render_epic_task(*spec, timed)
+                files[milestone_dir / epic_path / filename] = content.encode("utf-8")
+    _write_files(files)
 
     monkeypatch.chdir(tmp_path)
     return tmp_path
 
 
-def test_work_set_show_clear(runner, tmp_workflow_reports_dir):
+def test_tasks_index_template_round_trips():
+    timed = _timed_fields(datetime.now(timezone.utc))
+    entries = [
+        _render_epic_task(*spec, timed)[2]
+        for specs in _EPIC_TASKS.values()
+        for spec in specs
+    ]
+    # Titles that need quoting, including a non-BMP character.
+    for n, title in enumerate(['Ship "v2": 🚀', "yes", " padded\\path "], start=1):
+        entries.append(_render_task(f"P1.M1.E9.T00{n}", title, {})[2])
+    assert safe_load(_emit_tasks_index(entries)) == {"tasks": entries}
+
+
+def test_work_set_show_clear(runner, cli, tmp_workflow_reports_dir):
     set_res = runner.invoke(cli, ["work", "P1.M1.E1.T001"])
     assert set_res.exit_code == 0
     assert "Working task set" in set_res.output
@@ -234,7 +298,7 @@ def test_work_set_show_clear(runner, tmp_workflow_reports_dir):
     assert "Cleared working task context" in clear_res.output
 
 
-def test_work_rejects_multiple_task_ids(runner, tmp_workflow_reports_dir):
+def test_work_rejects_multiple_task_ids(runner, cli, tmp_workflow_reports_dir):
     result = runner.invoke(
         cli, ["work", "P1.M1.E1.T001", "P1.M1.E1.T002"]
     )
@@ -242,7 +306,7 @@ def test_work_rejects_multiple_task_ids(runner, tmp_workflow_reports_dir):
     assert "work accepts at most one TASK_ID" in result.output
 
 
-def test_work_rejects_task_id_with_clear(runner, tmp_workflow_reports_dir):
+def test_work_rejects_task_id_with_clear(runner, cli, tmp_workflow_reports_dir):
     result = runner.invoke(
         cli, ["work", "P1.M1.E1.T001", "--clear"]
     )
@@ -250,7 +314,7 @@ def test_work_rejects_task_id_with_clear(runner, tmp_workflow_reports_dir):
     assert "work --clear does not accept a TASK_ID argument" in result.output
 
 
-def test_work_supports_agent_option(runner, tmp_workflow_reports_dir):
+def test_work_supports_agent_option(runner, cli, tmp_workflow_reports_dir):
     result = runner.invoke(
         cli, ["work", "P1.M1.E1.T001", "--agent", "agent-bot"]
     )
@@ -261,7 +325,9 @@ def test_work_supports_agent_option(runner, tmp_workflow_reports_dir):
     assert ctx.get("agent") == "agent-bot"
 
 
-def test_blocked_defaults_to_no_auto_grab_and_hints(runner, tmp_workflow_reports_dir):
+def test_blocked_defaults_to_no_auto_grab_and_hints(
+    runner, cli, tmp_workflow_reports_dir
+):
     set_current_task("P1.M1.E1.T002", "agent-a")
     result = runner.invoke(cli, ["blocked", "--reason", "waiting on dependency"])
 
@@ -273,14 +339,14 @@ def test_blocked_defaults_to_no_auto_grab_and_hints(runner, tmp_workflow_reports
 
     task = _load_task("P1.M1.E1.T002")
     assert task.status == Status.BLOCKED
-    todo_text = (Path(".tasks") / task.file).read_text()
+    todo_text = _task_path(task).read_text()
     assert "reason: waiting on dependency" in todo_text
     assert task.reason == "waiting on dependency"
     assert get_current_task_id() is None
 
 
 def test_blocked_with_grab_uses_next_task_flow_if_possible(
-    runner, tmp_workflow_reports_dir
+    runner, cli, tmp_workflow_reports_dir
 ):
     set_current_task("P1.M1.E1.T001", "agent-a")
     result = runner.invoke(cli, ["blocked", "--reason", "waiting on dependency", "--grab"])
@@ -293,7 +359,7 @@ def test_blocked_with_grab_uses_next_task_flow_if_possible(
     assert task.status == Status.BLOCKED
 
 
-def test_skip_auto_grabs_next_task(runner, tmp_workflow_reports_dir):
+def test_skip_auto_grabs_next_task(runner, cli, tmp_workflow_reports_dir):
     set_current_task("P1.M1.E1.T002", "agent-a")
     result = runner.invoke(cli, ["skip", "--agent", "agent-a"])
 
@@ -310,7 +376,7 @@ def test_skip_auto_grabs_next_task(runner, tmp_workflow_reports_dir):
     assert current_task != "P1.M1.E1.T002"
 
 
-def test_unclaim_from_context(runner, tmp_workflow_reports_dir):
+def test_unclaim_from_context(runner, cli, tmp_workflow_reports_dir):
     set_current_task("P1.M1.E1.T002", "agent-a")
     result = runner.invoke(cli, ["unclaim", "--agent", "agent-a"])
 
@@ -322,7 +388,7 @@ def test_unclaim_from_context(runner, tmp_workflow_reports_dir):
     assert get_current_task_id() is None
 
 
-def test_unclaim_recovers_pending_claimed_task(runner, tmp_workflow_reports_dir):
+def test_unclaim_recovers_pending_claimed_task(runner, cli, tmp_workflow_reports_dir):
     claimed_at = datetime.now(timezone.utc)
     _save_task_fields(
         "P1.M1.E1.T003",
@@ -343,7 +409,7 @@ def test_unclaim_recovers_pending_claimed_task(runner, tmp_workflow_reports_dir)
 
 
 def test_handoff_appends_notes_and_transfers_ownership(
-    runner, tmp_workflow_reports_dir
+    runner, cli, tmp_workflow_reports_dir
 ):
     set_current_task("P1.M1.E1.T002", "agent-a")
     result = runner.invoke(
@@ -365,20 +431,20 @@ def test_handoff_appends_notes_and_transfers_ownership(
     assert task.claimed_by == "agent-b"
     assert task.status == Status.IN_PROGRESS
 
-    task_file = Path(".tasks") / task.file
+    task_file = _task_path(task)
     content = task_file.read_text()
     assert "## Handoff Notes" in content
     assert "needs coverage expansion" in content
 
 
-def test_handoff_requires_force_for_other_owner(runner, tmp_workflow_reports_dir):
+def test_handoff_requires_force_for_other_owner(runner, cli, tmp_workflow_reports_dir):
     result = runner.invoke(cli, ["handoff", "P1.M1.E1.T002", "--to", "agent-b"])
 
     assert result.exit_code != 0
     assert "Use --force to override." in result.output
 
 
-def test_why_reports_dependency_blocker(runner, tmp_workflow_reports_dir):
+def test_why_reports_dependency_blocker(runner, cli, tmp_workflow_reports_dir):
     result = runner.invoke(cli, ["why", "P1.M1.E1.T002"])
     assert result.exit_code == 0
     assert "Explicit dependencies:" in result.output
@@ -386,24 +452,26 @@ def test_why_reports_dependency_blocker(runner, tmp_workflow_reports_dir):
     assert "Task is blocked on dependencies." in result.output
 
 
-def test_why_done_task_short_circuit(runner, tmp_workflow_reports_dir):
+def test_why_done_task_short_circuit(runner, cli, tmp_workflow_reports_dir):
     result = runner.invoke(cli, ["why", "P1.M1.E2.T001"])
     assert result.exit_code == 0
     assert "This task is complete." in result.output
 
 
-def test_grab_reclaims_stale_when_no_available(runner, tmp_workflow_reports_dir):
-    _save_task_fields("P1.M1.E1.T001", status=Status.BLOCKED)
-    _save_task_fields("P1.M1.E1.T003", status=Status.BLOCKED)
-    _save_task_fields("P1.M1.E2.T003", status=Status.BLOCKED)
-
+def test_grab_reclaims_stale_when_no_available(runner, cli, tmp_workflow_reports_dir):
     stale_ts = datetime.now(timezone.utc) - timedelta(hours=6)
-    _save_task_fields(
-        "P1.M1.E1.T002",
-        status=Status.IN_PROGRESS,
-        claimed_by="old-agent",
-        claimed_at=stale_ts,
-        started_at=stale_ts,
+    _save_tasks(
+        {
+            "P1.M1.E1.T001": {"status": Status.BLOCKED},
+            "P1.M1.E1.T003": {"status": Status.BLOCKED},
+            "P1.M1.E2.T003": {"status": Status.BLOCKED},
+            "P1.M1.E1.T002": {
+                "status": Status.IN_PROGRESS,
+                "claimed_by": "old-agent",
+                "claimed_at": stale_ts,
+                "started_at": stale_ts,
+            },
+        }
     )
 
     result = runner.invoke(
@@ -419,7 +487,7 @@ def test_grab_reclaims_stale_when_no_available(runner, tmp_workflow_reports_dir)
     assert reclaimed.claimed_by == "agent-reclaimer"
 
 
-def test_report_progress_text_with_milestones(runner, tmp_workflow_reports_dir):
+def test_report_progress_text_with_milestones(runner, cli, tmp_workflow_reports_dir):
     result = runner.invoke(cli, ["report", "progress", "--by-milestone"])
 
     assert result.exit_code == 0
@@ -429,7 +497,7 @@ def test_report_progress_text_with_milestones(runner, tmp_workflow_reports_dir):
 
 
 def test_report_defaults_to_progress_and_lists_commands(
-    runner, tmp_workflow_reports_dir
+    runner, cli, tmp_workflow_reports_dir
 ):
     result = runner.invoke(cli, ["report"])
 
@@ -441,7 +509,7 @@ def test_report_defaults_to_progress_and_lists_commands(
     assert "estimate-accuracy" in result.output
 
 
-def test_report_short_aliases(runner, tmp_workflow_reports_dir):
+def test_report_short_aliases(runner, cli, tmp_workflow_reports_dir):
     progress_res = runner.invoke(cli, ["r", "p"])
     assert progress_res.exit_code == 0
     assert "Progress Report" in progress_res.output
@@ -451,7 +519,7 @@ def test_report_short_aliases(runner, tmp_workflow_reports_dir):
     assert "Velocity Report" in velocity_res.output
 
 
-def test_report_velocity_text_sections(runner, tmp_workflow_reports_dir):
+def test_report_velocity_text_sections(runner, cli, tmp_workflow_reports_dir):
     result = runner.invoke(cli, ["report", "velocity", "--days", "3"])
 
     assert result.exit_code == 0
@@ -463,7 +531,7 @@ def test_report_velocity_text_sections(runner, tmp_workflow_reports_dir):
 
 
 def test_report_velocity_over_time_trims_old_empty_days(
-    runner, tmp_workflow_reports_dir
+    runner, cli, tmp_workflow_reports_dir
 ):
     result = runner.invoke(cli, ["report", "velocity", "--days", "5"])
 
@@ -482,7 +550,7 @@ def test_report_velocity_over_time_trims_old_empty_days(
 
 
 def test_report_recent_velocity_trims_old_empty_buckets(
-    runner, tmp_workflow_reports_dir
+    runner, cli, tmp_workflow_reports_dir
 ):
     result = runner.invoke(cli, ["report", "velocity", "--days", "5"])
 
@@ -502,21 +570,24 @@ def test_report_recent_velocity_trims_old_empty_buckets(
     assert "actual)" in bucket_lines[-2]
 
 
-def test_report_velocity_no_completed_data(runner, tmp_workflow_reports_dir):
-    for task_id in ("P1.M1.E2.T001", "P1.M1.E2.T002"):
-        _save_task_fields(
-            task_id,
-            status=Status.PENDING,
-            completed_at=None,
-            duration_minutes=None,
-        )
+def test_report_velocity_no_completed_data(runner, cli, tmp_workflow_reports_dir):
+    _save_tasks(
+        {
+            task_id: {
+                "status": Status.PENDING,
+                "completed_at": None,
+                "duration_minutes": None,
+            }
+            for task_id in ("P1.M1.E2.T001", "P1.M1.E2.T002")
+        }
+    )
 
     result = runner.invoke(cli, ["report", "velocity", "--days", "2"])
     assert result.exit_code == 0
     assert "No completed tasks with timestamps found." in result.output
 
 
-def test_report_estimate_accuracy_text_sections(runner, tmp_workflow_reports_dir):
+def test_report_estimate_accuracy_text_sections(runner, cli, tmp_workflow_reports_dir):
     result = runner.invoke(cli, ["report", "estimate-accuracy"])
 
     assert result.exit_code == 0
@@ -525,9 +596,15 @@ def test_report_estimate_accuracy_text_sections(runner, tmp_workflow_reports_dir
     assert "Recommendation:" in result.output
 
 
-def test_report_estimate_accuracy_no_duration_data(runner, tmp_workflow_reports_dir):
-    for task_id in ("P1.M1.E2.T001", "P1.M1.E2.T002"):
-        _save_task_fields(task_id, status=Status.PENDING)
+def test_report_estimate_accuracy_no_duration_data(
+    runner, cli, tmp_workflow_reports_dir
+):
+    _save_tasks(
+        {
+            task_id: {"status": Status.PENDING}
+            for task_id in ("P1.M1.E2.T001", "P1.M1.E2.T002")
+        }
+    )
 
     result = runner.invoke(cli, ["report", "estimate-accuracy"])
     assert result.exit_code == 0
@@ -3,21 +3,26 @@
 from datetime import datetime, timezone
 from typing import Optional
 
+_UTC = timezone.utc
+
 
 def utc_now() -> datetime:
     """Return a timezone-aware UTC datetime."""
-    return datetime.now(timezone.utc)
+    return datetime.now(_UTC)
 
 
 def utc_now_iso() -> str:
     """Return current UTC datetime as ISO 8601."""
-    return utc_now().isoformat()
+    return datetime.now(_UTC).isoformat()
 
 
 def to_utc(dt: Optional[datetime]) -> Optional[datetime]:
     """Normalize naive/aware datetimes to timezone-aware UTC."""
     if dt is None:
         return None
-    if dt.tzinfo is None:
-        return dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(timezone.utc)
+    tz = dt.tzinfo
+    if tz is _UTC:
+        return dt
+    if tz is None:
+        return dt.replace(tzinfo=_UTC)
+    return dt.astimezone(_UTC)